@@ -125,11 +125,39 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# PDF downloads (see library/downloads.py)
+# Behind a front proxy, let it send the file: 'x-accel-redirect' (nginx, with
+# an `internal` location at PDF_ACCEL_REDIRECT_PREFIX aliased to MEDIA_ROOT)
+# or 'x-sendfile' (Apache mod_xsendfile, lighttpd). None serves the file from
+# Django with FileResponse.
+
+PDF_SENDFILE_BACKEND = None
+PDF_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Caches
+# "responses" holds cached API responses (see library/response_cache.py).
+# Local memory is per process; with several workers switch it to
+# 'django.core.cache.backends.filebased.FileBasedCache' (LOCATION = a shared
+# directory) so signal-driven evictions reach every worker. TIMEOUT bounds
+# how long an entry can survive if its tag index is ever culled.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'library-responses',
+        'TIMEOUT': 600,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
 # Email Configuration for Development
 # Para ambiente de desenvolvimento, usaremos console backend
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
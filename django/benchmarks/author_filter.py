@@ -0,0 +1,43 @@
+"""Benchmark: ?author= whole-word filter, regex scan vs. indexed name tokens.
+
+    python -m benchmarks.author_filter [--authors 50000] [--articles 50000]
+"""
+import argparse
+import re
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--authors", type=int, default=50000)
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from library import search
+    from library.models import Article
+
+    seed_catalog(args.articles, args.authors)
+    search.rebuild_author_tokens()
+
+    def old_path(term):
+        pattern = r"\b" + re.escape(term) + r"\b"
+        return list(Article.objects.filter(authors__name__iregex=pattern).distinct().values_list("id", flat=True))
+
+    def new_path(term):
+        author_ids = search.authors_matching_words(term)
+        return list(Article.objects.filter(authors__in=author_ids).distinct().values_list("id", flat=True))
+
+    print(f"{args.authors} authors, {args.articles} articles")
+    print(f"{'term':<16}{'matches':>9}{'iregex ms':>12}{'tokens ms':>12}{'speedup':>9}")
+    for term in ["John", "Oliveira", "Mary Smith", "Silva-123"]:
+        assert sorted(old_path(term)) == sorted(new_path(term)), term
+        old = best_of(lambda: old_path(term), args.repeat)
+        new = best_of(lambda: new_path(term), args.repeat)
+        print(f"{term:<16}{len(new_path(term)):>9}{old:>12.1f}{new:>12.1f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
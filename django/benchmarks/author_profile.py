@@ -0,0 +1,55 @@
+"""Benchmark: author page, join + regroup per request vs. the materialized profile.
+
+    python -m benchmarks.author_profile [--articles 50000] [--authors 5000]
+"""
+import argparse
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--authors", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import F, Prefetch
+    from library import payloads, profiles
+    from library.models import Article, Author
+
+    seed_catalog(args.articles, args.authors)
+    profiles.rebuild_profiles()
+
+    def articles():
+        return Article.objects.select_related("edition", "edition__event").prefetch_related(
+            Prefetch("authors", to_attr=payloads.AUTHORS_ATTR)
+        )
+
+    def old_path(author):
+        # what AuthorByNameView did before: join, sort by year and regroup in Python
+        qs = articles().filter(authors=author).annotate(edition_year=F("edition__year")).order_by("-edition__year")
+        docs, grouped = payloads.Documents(), {}
+        for article in qs:
+            grouped.setdefault(article.edition_year, []).append(docs.article(article))
+        return len(grouped), sorted(grouped, reverse=True)
+
+    def new_path(author):
+        profile = Author.objects.select_related("profile").get(pk=author.pk).profile
+        found = articles().in_bulk([pk for _, ids in profile.articles_by_year for pk in ids])
+        docs = payloads.Documents()
+        return {year: [docs.article(found[pk]) for pk in ids] for year, ids in profile.articles_by_year}
+
+    ranked = list(Author.objects.order_by("-profile__total_articles")[:1]) + list(Author.objects.order_by("?")[:1])
+    print(f"{args.articles} articles, {args.authors} authors")
+    print(f"{'articles':>9}{'join ms':>10}{'profile ms':>12}")
+    for author in ranked:
+        total = author.profile.total_articles
+        old = best_of(lambda: old_path(author), args.repeat)
+        new = best_of(lambda: new_path(author), args.repeat)
+        print(f"{total:>9}{old:>10.1f}{new:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
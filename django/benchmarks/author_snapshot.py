@@ -0,0 +1,46 @@
+"""Benchmark: article listings, M2M prefetch vs. the stored author snapshot.
+
+    python -m benchmarks.author_snapshot [--articles 50000] [--authors 5000]
+
+Times the query + document build of a 20-row page, one edition and the
+whole catalog, loading authors through the prefetch (the old listing path)
+or from Article.author_snapshot.
+"""
+import argparse
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--authors", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Prefetch
+    from library import payloads
+    from library.models import Article
+
+    edition = seed_catalog(args.articles, args.authors)
+    base = Article.objects.select_related("edition__event").order_by("id")
+    prefetched = base.defer("author_snapshot").prefetch_related(Prefetch("authors", to_attr=payloads.AUTHORS_ATTR))
+
+    def build(qs):
+        return payloads.Documents().articles(list(qs))
+
+    print(f"{'listing':<14}{'rows':>7}{'prefetch ms':>13}{'snapshot ms':>13}")
+    for label, where in [("page", slice(0, 20)), ("one edition", {"edition": edition}), ("whole catalog", None)]:
+        def listing(qs):
+            if isinstance(where, slice):
+                return qs[where]
+            return qs.filter(**where) if where else qs
+        rows = listing(base).count() if not isinstance(where, slice) else 20
+        old = best_of(lambda: build(listing(prefetched)), args.repeat)
+        new = best_of(lambda: build(listing(base)), args.repeat)
+        print(f"{label:<14}{rows:>7}{old:>13.1f}{new:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
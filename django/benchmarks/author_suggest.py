@@ -0,0 +1,43 @@
+"""Benchmark: author autocomplete, istartswith scan vs. the folded name_key index.
+
+    python -m benchmarks.author_suggest [--authors 50000] [--articles 100000]
+"""
+import argparse
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--authors", type=int, default=50000)
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Count
+    from library import search
+    from library.models import Author
+
+    seed_catalog(args.articles, args.authors)
+    search.rebuild_author_counts()
+
+    def old_path(prefix):
+        # what the views could do before: scan names and count articles per match
+        qs = Author.objects.filter(name__istartswith=prefix).annotate(n=Count("articles"))
+        return list(qs.order_by("-n", "name", "id")[:10])
+
+    def new_path(prefix):
+        return list(search.suggest_authors(prefix, 10))
+
+    print(f"{args.authors} authors, {args.articles} articles")
+    print(f"{'prefix':<12}{'candidates':>11}{'scan ms':>10}{'index ms':>10}")
+    for prefix in ["j", "jo", "joao", "Mariana S", "Olivia"]:
+        candidates = Author.objects.filter(name_key__startswith=search.fold_name(prefix)).count()
+        old = best_of(lambda: old_path(prefix), args.repeat)
+        new = best_of(lambda: new_path(prefix), args.repeat)
+        print(f"{prefix:<12}{candidates:>11}{old:>10.1f}{new:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
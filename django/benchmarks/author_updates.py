@@ -0,0 +1,55 @@
+"""Benchmark: replacing an article's authors, clear() + add() per author vs. set_authors.
+
+    python -m benchmarks.author_updates [--sizes 3 10 30]
+
+Each update reverses the byline, drops one author and adds a new one; all
+M2M signal receivers run, as they do behind the API.
+"""
+import argparse
+import contextlib
+import io
+
+from benchmarks.common import best_of, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 10, 30])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from library import authorship
+    from library.models import Article, Author
+
+    def old_path(article, names):
+        article.authors.clear()
+        for name in names:
+            author, _ = Author.objects.get_or_create(name=name)
+            article.authors.add(author)
+
+    def new_path(article, names):
+        authorship.set_authors(article, authorship.resolve_authors(names))
+
+    def measure(path, size):
+        article = Article.objects.create(title=f"Byline {size}")
+        names = [f"Author {size}.{i}" for i in range(size)]
+        path(article, names)
+        updates = [names[:0:-1] + [f"Extra {size}"], names]
+        with CaptureQueriesContext(connection) as ctx:
+            path(article, updates[0])
+        state = iter(updates * args.repeat)
+        return len(ctx.captured_queries), best_of(lambda: path(article, next(state)), args.repeat)
+
+    print(f"{'authors':>8}{'old queries':>13}{'new queries':>13}{'old ms':>9}{'new ms':>9}")
+    for size in args.sizes:
+        # the notification receiver prints debug lines on every post_add
+        with contextlib.redirect_stdout(io.StringIO()):
+            old_queries, old_ms = measure(old_path, size)
+            new_queries, new_ms = measure(new_path, size)
+        print(f"{size:>8}{old_queries:>13}{new_queries:>13}{old_ms:>9.1f}{new_ms:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: BibTeX parsing, regex split per entry vs. the streaming parser.
+
+    python -m benchmarks.bibtex_parse [--entries 50000]
+
+The old `_parse_bibtex` decoded the whole upload, split it with
+re.split(r'@\\w+\\s*{') and ran nine regex searches per entry, returning a
+list. The view now wraps the upload in a text stream and iterates
+`bibtex.parse` through `importer.parse_bibtex`. Both are timed over the same file,
+old from the decoded bytes and new from an open file. Peak Python
+allocations are measured with tracemalloc, in a second run. The entries have nested braces,
+so the table also counts the titles each path gets right.
+"""
+import argparse
+import io
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.common import setup_django
+
+
+def old_parse(bibtex_content):
+    articles = []
+    for entry in re.split(r'@\w+\s*{', bibtex_content)[1:]:
+        if not entry.strip():
+            continue
+        article_data = {'title': '', 'authors': [], 'abstract': '', 'url': '', 'year': '', 'bibtex_entry': f"@article{{{entry}"}
+        match = re.search(r'title\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
+        if match:
+            article_data['title'] = match.group(1).strip()
+        match = re.search(r'author\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
+        if match:
+            article_data['authors'] = [a.strip() for a in re.split(r'\s+and\s+', match.group(1)) if a.strip()]
+        match = re.search(r'year\s*=\s*[{"]?(\d{4})["}]?', entry, re.IGNORECASE)
+        if match:
+            article_data['year'] = match.group(1).strip()
+        for field in ('abstract', 'url', 'booktitle', 'journal', 'pages'):
+            match = re.search(field + r'\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
+            if match:
+                article_data['url' if field == 'url' else field] = match.group(1).strip()
+        articles.append(article_data)
+    return articles
+
+
+def write_bibtex(path, n):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(
+                f"@inproceedings{{paper{i},\n"
+                f"  title = {{{{B}}ayesian {{{{Methods}}}} for Study {i}}},\n"
+                f"  author = {{Ana Silva and João Souza and Maria {{da}} Costa}},\n"
+                f"  booktitle = {{Proceedings of the Symposium {{SBES}}}},\n"
+                f"  year = {{2024}},\n"
+                f"  pages = {{{i % 90 + 1}--{i % 90 + 10}}},\n"
+                f"  abstract = {{We study {{nested}} braces and keep going for a while to look like an abstract.}},\n"
+                f"  url = {{https://example.org/papers/{i}.pdf}}\n"
+                f"}}\n\n"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=50000)
+    args = parser.parse_args()
+
+    setup_django()
+    from library import importer
+
+    def old_path(path):
+        with open(path, "rb") as f:
+            return old_parse(f.read().decode("utf-8"))
+
+    def new_path(path):
+        with open(path, "rb") as f:
+            return [a["title"] for a in importer.parse_bibtex(io.TextIOWrapper(f, encoding="utf-8"))]
+
+    def measure(parse, path):
+        # timed and traced separately: tracemalloc slows allocations down
+        start = time.perf_counter()
+        result = parse(path)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        parse(path)
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return result, elapsed, high / 1024 / 1024
+
+    fd, path = tempfile.mkstemp(suffix=".bib")
+    os.close(fd)
+    try:
+        write_bibtex(path, args.entries)
+        print(f"{args.entries} entries, {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+        print(f"{'parser':<10}{'s':>8}{'entries/s':>11}{'peak MB':>9}{'titles ok':>11}")
+        for label, parse in (("old", old_path), ("streaming", new_path)):
+            result, elapsed, peak = measure(parse, path)
+            titles = [a["title"] if isinstance(a, dict) else a for a in result]
+            correct = sum(title == f"Bayesian Methods for Study {i}" for i, title in enumerate(titles))
+            print(f"{label:<10}{elapsed:>8.2f}{len(titles) / elapsed:>11.0f}{peak:>9.1f}{correct:>11}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
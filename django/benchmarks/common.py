@@ -0,0 +1,89 @@
+"""Shared setup for the benchmark scripts.
+
+Run them from the django/ directory, e.g. `python -m benchmarks.author_filter`.
+Each script works on a throwaway in-memory test database built from the
+migrations, so db.sqlite3 is never touched.
+"""
+import os
+import random
+import time
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+    import django
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def best_of(func, repeat=5):
+    """Best wall-clock time of `repeat` calls, in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Henrique",
+    "Isabela", "João", "Karina", "Lucas", "Mariana", "Nicolas", "Olívia", "Pedro",
+    "Rafaela", "Samuel", "Tatiana", "Vinícius", "John", "Mary", "Johnson", "Alice",
+]
+LAST_NAMES = [
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira",
+    "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes",
+    "Smith", "Johnson", "Brown", "Miller", "Davis", "Garcia", "Wilson", "Moore",
+]
+
+
+def seed_catalog(n_articles, n_authors, authors_per_article=3, seed=42):
+    """Bulk-insert a catalog without firing signals. Returns the edition."""
+    from library import snapshots
+    from library.models import Article, Author, Edition, Event, author_slug
+
+    rng = random.Random(seed)
+    event = Event.objects.create(name="Benchmark Symposium", sigla="BENCH")
+    editions = [Edition.objects.create(event=event, year=2000 + i) for i in range(25)]
+
+    names = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}-{i}"
+        for i in range(n_authors)
+    ]
+    # bulk_create skips Author.save(); the "-i" suffix keeps slugs unique
+    Author.objects.bulk_create([Author(name=name, slug=author_slug(name)) for name in names], batch_size=1000)
+    authors = list(Author.objects.order_by("id").values_list("id", "name", "slug"))
+
+    # bulk_create skips the M2M signals too, so the author snapshots are built here
+    picks = [rng.sample(authors, min(authors_per_article, len(authors))) for _ in range(n_articles)]
+    Article.objects.bulk_create(
+        [
+            Article(
+                title=f"Study {i} of {rng.choice(LAST_NAMES)} systems",
+                abstract="Lorem ipsum dolor sit amet. " * 20,
+                bibtex=f"@inproceedings{{bench{i}, title={{Study {i}}}}}",
+                edition=editions[i % len(editions)],
+                pagina_inicial=1,
+                pagina_final=10,
+                author_snapshot=[snapshots.author_entry(pk, name, None, slug) for pk, name, slug in picks[i]],
+            )
+            for i in range(n_articles)
+        ],
+        batch_size=1000,
+    )
+    through = Article.authors.through
+    article_ids = Article.objects.order_by("id").values_list("id", flat=True)
+    links = [
+        through(article_id=article_id, author_id=author_id)
+        for article_id, pick in zip(article_ids, picks)
+        for author_id, *_ in pick
+    ]
+    through.objects.bulk_create(links, batch_size=1000)
+    return editions[0]
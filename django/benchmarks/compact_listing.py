@@ -0,0 +1,51 @@
+"""Benchmark: nested vs. compact (?compact=true) article listing bodies.
+
+    python -m benchmarks.compact_listing [--articles 50000]
+
+The catalog spreads articles over 25 editions, so the default gives 2,000
+articles per edition. Reports body size and build + encode time for one
+edition and for the whole catalog.
+"""
+import argparse
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--authors", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Prefetch
+    from library import payloads
+    from library.models import Article
+
+    edition = seed_catalog(args.articles, args.authors)
+    qs = Article.objects.select_related("edition__event").prefetch_related(
+        Prefetch("authors", to_attr=payloads.AUTHORS_ATTR)
+    ).order_by("id")
+
+    def nested(articles):
+        return payloads.dumps(payloads.Documents().articles(articles))
+
+    def compact(articles):
+        docs = payloads.Documents(compact=True)
+        return payloads.dumps({"results": docs.articles(articles), "included": docs.included()})
+
+    print(f"{'listing':<14}{'rows':>7}{'nested KB':>11}{'compact KB':>12}{'nested ms':>11}{'compact ms':>12}")
+    for label, articles in [("one edition", list(qs.filter(edition=edition))), ("whole catalog", list(qs))]:
+        nested_kb = len(nested(articles)) / 1024
+        compact_kb = len(compact(articles)) / 1024
+        nested_ms = best_of(lambda: nested(articles), args.repeat)
+        compact_ms = best_of(lambda: compact(articles), args.repeat)
+        print(
+            f"{label:<14}{len(articles):>7}{nested_kb:>11.0f}{compact_kb:>12.0f}"
+            f"{nested_ms:>11.1f}{compact_ms:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
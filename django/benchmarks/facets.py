@@ -0,0 +1,54 @@
+"""Benchmark: facet counts in SQL vs. counting loaded articles in Python.
+
+    python -m benchmarks.facets [--articles 100000]
+
+The Python baseline is what a client had to do before ?facets=: load every
+matching article with its edition, event and authors, then count.
+"""
+import argparse
+from collections import Counter
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--authors", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from library import search
+    from library.models import Article
+
+    seed_catalog(args.articles, args.authors)
+    search.rebuild_author_tokens()
+    search.rebuild_index()
+
+    def python_counts(qs):
+        events, years, authors = Counter(), Counter(), Counter()
+        for a in qs.select_related("edition__event").prefetch_related("authors"):
+            events[a.edition.event.name] += 1
+            years[a.edition.year] += 1
+            authors.update(x.name for x in a.authors.all())
+        return events, years, authors.most_common(10)
+
+    cases = [
+        ("all articles", Article.objects.all()),
+        ("year >= 2015", Article.objects.filter(edition__year__gte=2015)),
+        ("author=silva", Article.objects.filter(authors__in=search.authors_matching_words("silva")).distinct()),
+        ("q=study", search.search_articles(Article.objects.all(), "study")),
+    ]
+    print(f"{args.articles} articles, {args.authors} authors")
+    print(f"{'filter':<14}{'matches':>9}{'python ms':>11}{'sql ms':>9}{'speedup':>9}")
+    for label, qs in cases:
+        sql = search.facet_counts(qs)
+        assert sum(r["count"] for r in sql["year"]) == qs.count(), label
+        old = best_of(lambda: python_counts(qs), args.repeat)
+        new = best_of(lambda: search.facet_counts(qs), args.repeat)
+        print(f"{label:<14}{qs.count():>9}{old:>11.0f}{new:>9.0f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
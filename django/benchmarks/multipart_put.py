@@ -0,0 +1,56 @@
+"""Benchmark: peak memory of parsing a multipart PUT, buffered body vs. streamed.
+
+    python -m benchmarks.multipart_put [--mb 50]
+
+The old ArticleDetailView.put wrapped io.BytesIO(request.body) around the
+whole body; `_parse_multipart` reads the request stream through the upload
+handlers. Peak Python allocations are measured with tracemalloc. The old path
+also needs DATA_UPLOAD_MAX_MEMORY_SIZE lifted: with the default 2.5 MB
+limit it rejects any larger upload.
+"""
+import argparse
+import io
+import tracemalloc
+
+from benchmarks.common import setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from django.http.multipartparser import MultiPartParser
+    from django.test import RequestFactory, override_settings
+    from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+    from library.views import _parse_multipart
+
+    pdf = b"%PDF-1.4 " + b"x" * (args.mb * 1024 * 1024)
+    body = encode_multipart(BOUNDARY, {"title": "Big", "pdf_file": SimpleUploadedFile("big.pdf", pdf)})
+    del pdf
+
+    def old_path(request):
+        with override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=None):
+            parser = MultiPartParser(request.META, io.BytesIO(request.body), request.upload_handlers, "utf-8")
+            return parser.parse()
+
+    def peak(parse):
+        # the body is stored on the request only once, as WSGI would stream it
+        request = RequestFactory().put("/", data=body, content_type=MULTIPART_CONTENT)
+        tracemalloc.start()
+        data, files = parse(request)
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        files["pdf_file"].close()
+        return high / 1024 / 1024
+
+    print(f"{args.mb} MB upload")
+    print(f"{'path':<10}{'peak MB':>9}")
+    print(f"{'buffered':<10}{peak(old_path):>9.1f}")
+    print(f"{'streamed':<10}{peak(_parse_multipart):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
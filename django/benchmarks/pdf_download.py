@@ -0,0 +1,77 @@
+"""Benchmark: bytes a Python worker copies to serve a PDF request.
+
+    python -m benchmarks.pdf_download [--mb 50]
+
+Before, PDFs were only reachable through `django.conf.urls.static` (DEBUG
+only), which ignores Range and streams the whole file through Python. The
+PDF download view answers a Range with just those bytes. A whole file is an
+open FileResponse that wsgi.file_wrapper can sendfile(2), and with
+PDF_SENDFILE_BACKEND set it is a header the front proxy acts on. Without a
+file_wrapper, as here, whole-file responses are still read in blocks, so
+they count as copied.
+"""
+import argparse
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+
+from benchmarks.common import setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.files.base import ContentFile
+    from django.test import RequestFactory, override_settings
+    from django.views.static import serve
+    from library.models import Article
+    from library.views import ArticlePdfView
+
+    media = tempfile.mkdtemp()
+    try:
+        with override_settings(MEDIA_ROOT=media):
+            with contextlib.redirect_stdout(io.StringIO()):  # the notification receiver prints
+                article = Article.objects.create(title="Large PDF")
+                article.pdf_file.save("large.pdf", ContentFile(b"%PDF-1.4 " + b"x" * (args.mb * 1024 * 1024)))
+            name = article.pdf_file.name
+            view = ArticlePdfView.as_view()
+            factory = RequestFactory()
+
+            def measure(respond, **headers):
+                start = time.perf_counter()
+                response = respond(factory.get("/", headers=headers))
+                copied = sum(map(len, response.streaming_content)) if response.streaming else len(response.content)
+                response.close()
+                return response.status_code, copied, (time.perf_counter() - start) * 1000
+
+            def static(request):
+                return serve(request, name, document_root=media)
+
+            def download(request):
+                return view(request, pk=article.pk)
+
+            rows = [
+                ("static, whole file", static, {}),
+                ("static, last 64 KB", static, {"Range": "bytes=-65536"}),
+                ("view, whole file", download, {}),
+                ("view, last 64 KB", download, {"Range": "bytes=-65536"}),
+            ]
+            print(f"{args.mb} MB PDF")
+            print(f"{'path':<26}{'status':>7}{'MB copied':>11}{'ms':>9}")
+            for label, respond, headers in rows:
+                status, copied, ms = measure(respond, **headers)
+                print(f"{label:<26}{status:>7}{copied / 1024 / 1024:>11.2f}{ms:>9.1f}")
+            with override_settings(PDF_SENDFILE_BACKEND="x-accel-redirect"):
+                status, copied, ms = measure(download)
+            print(f"{'view, X-Accel-Redirect':<26}{status:>7}{copied / 1024 / 1024:>11.2f}{ms:>9.1f}")
+    finally:
+        shutil.rmtree(media, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
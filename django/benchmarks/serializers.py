@@ -0,0 +1,80 @@
+"""Benchmark: article listing serialization, per-row dict helpers vs. payloads.
+
+    python -m benchmarks.serializers [--sizes 10000 100000]
+
+Times turning already-loaded Article instances into the JSON response body,
+so the query itself is excluded. The baseline is the per-row helper code the
+views used before library.payloads (a fresh edition/event dict per article,
+encoded by JsonResponse).
+"""
+import argparse
+import json
+
+from benchmarks.common import best_of, seed_catalog, setup_django
+
+
+def legacy_article_to_dict(a):
+    ed = a.edition
+    return {
+        "id": a.id,
+        "title": a.title,
+        "abstract": a.abstract or None,
+        "pdf_url": (f"http://localhost:8000{a.pdf_file.url}" if a.pdf_file else a.pdf_url) or None,
+        "edition": {
+            "id": ed.id,
+            "event": {
+                "id": ed.event.id,
+                "name": ed.event.name,
+                "sigla": ed.event.sigla or "",
+                "entidade_promotora": ed.event.entidade_promotora or "",
+            },
+            "year": ed.year,
+            "location": ed.location or None,
+            "start_date": ed.start_date.isoformat() if ed.start_date else None,
+            "end_date": ed.end_date.isoformat() if ed.end_date else None,
+        },
+        "authors": [{"id": x.id, "name": x.name, "email": x.email or None, "slug": x.slug} for x in a.authors.all()],
+        "bibtex": a.bibtex or None,
+        "pagina_inicial": a.pagina_inicial,
+        "pagina_final": a.pagina_final,
+        "created_at": a.created_at.isoformat() if a.created_at else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--authors", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Prefetch
+    from django.http import JsonResponse
+    from library import payloads
+    from library.models import Article
+
+    seed_catalog(max(args.sizes), args.authors)
+    encoder = "orjson" if payloads.orjson is not None else "stdlib json"
+
+    print(f"{args.authors} authors, encoder: {encoder}")
+    print(f"{'articles':>9}{'helpers ms':>13}{'payloads ms':>13}{'speedup':>9}")
+    for size in args.sizes:
+        qs = Article.objects.select_related("edition__event").order_by("id")[:size]
+        old_articles = list(qs.prefetch_related("authors"))
+        new_articles = list(qs.prefetch_related(Prefetch("authors", to_attr=payloads.AUTHORS_ATTR)))
+
+        def old_path():
+            return JsonResponse([legacy_article_to_dict(a) for a in old_articles], safe=False).content
+
+        def new_path():
+            return payloads.json_response(payloads.Documents().articles(new_articles)).content
+
+        assert json.loads(old_path()) == json.loads(new_path())
+        old = best_of(old_path, args.repeat)
+        new = best_of(new_path, args.repeat)
+        print(f"{size:>9}{old:>13.1f}{new:>13.1f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
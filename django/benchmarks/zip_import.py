@@ -0,0 +1,94 @@
+"""Benchmark: memory used to attach PDFs from a bulk-import ZIP.
+
+    python -m benchmarks.zip_import [--members 20] [--mb 5] [--matched 2]
+
+The old `_extract_pdfs_from_zip` read every PDF of the archive into a
+ContentFile before any article was matched. The archive is now only indexed
+by member name (importer.extract_pdfs_from_zip). A matched member is streamed
+into storage through a temporary file (importer.attach_pdf), and the other
+members are never decompressed. Both attach the same members of one ZIP on
+disk. Peak Python allocations are measured with tracemalloc, in a second run.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+from benchmarks.common import setup_django
+
+
+def old_extract(zip_file):
+    from django.core.files.base import ContentFile
+
+    pdf_files = {}
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        for file_info in zip_ref.filelist:
+            if file_info.filename.lower().endswith('.pdf'):
+                filename = os.path.basename(file_info.filename)
+                pdf_files[filename.lower()] = {'content': ContentFile(zip_ref.read(file_info.filename), name=filename), 'name': filename}
+    return pdf_files
+
+
+def write_zip(path, members, mb):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for i in range(members):
+            # random bytes: PDFs are mostly compressed streams already
+            archive.writestr(f"proceedings/paper{i}.pdf", b"%PDF-1.4 " + os.urandom(mb * 1024 * 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--mb", type=int, default=5)
+    parser.add_argument("--matched", type=int, default=2)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import override_settings
+    from library import importer
+    from library.models import Article
+
+    matched = [f"paper{i}.pdf" for i in range(args.matched)]
+
+    def old_path(path):
+        with open(path, "rb") as f:
+            pdf_files = old_extract(f)
+            for name in matched:
+                Article().pdf_file.save(name, pdf_files[name]["content"], save=False)
+
+    def new_path(path):
+        with open(path, "rb") as f, zipfile.ZipFile(f) as archive:
+            pdf_files = importer.extract_pdfs_from_zip(archive)
+            for name in matched:
+                importer.attach_pdf(Article(), pdf_files[name])
+
+    def measure(attach, path):
+        # timed and traced separately: tracemalloc slows allocations down
+        start = time.perf_counter()
+        attach(path)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        attach(path)
+        _, high = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, high / 1024 / 1024
+
+    media = tempfile.mkdtemp()
+    path = os.path.join(media, "proceedings.zip")
+    try:
+        write_zip(path, args.members, args.mb)
+        print(f"{args.members} PDFs of {args.mb} MB, {args.matched} matched")
+        print(f"{'path':<8}{'s':>8}{'peak MB':>9}")
+        for label, attach in (("old", old_path), ("lazy", new_path)):
+            with override_settings(MEDIA_ROOT=media):
+                elapsed, peak = measure(attach, path)
+            print(f"{label:<8}{elapsed:>8.2f}{peak:>9.1f}")
+    finally:
+        shutil.rmtree(media, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
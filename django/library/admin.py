@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import Event, Edition, Author, Article
+from .models import Event, Edition, Author, Article, ArticleAuthor
 from .models import Subscription
+from . import authorship
 
 class EditionInline(admin.TabularInline):
     model = Edition
@@ -9,7 +10,13 @@ class EditionInline(admin.TabularInline):
 class ArticleInline(admin.TabularInline):
     model = Article
     extra = 0
-    filter_horizontal = ('authors',)
+
+class ArticleAuthorInline(admin.TabularInline):
+    model = ArticleAuthor
+    extra = 0
+    fields = ('author', 'position')
+    raw_id_fields = ('author',)
+    ordering = ('position', 'id')
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
@@ -26,14 +33,33 @@ class EditionAdmin(admin.ModelAdmin):
 
 @admin.register(Author)
 class AuthorAdmin(admin.ModelAdmin):
-    list_display = ('name', 'email')
+    list_display = ('name', 'email', 'slug')
     search_fields = ('name', 'email')
+    readonly_fields = ('slug',)
 
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
-    list_display = ('title', 'edition', 'created_at')
+    list_display = ('title', 'author_names', 'edition', 'created_at')
     search_fields = ('title', 'bibtex')
-    filter_horizontal = ('authors',)
+    inlines = [ArticleAuthorInline]
+
+    @admin.display(description='Authors')
+    def author_names(self, obj):
+        # read from the stored snapshot (kept in sync by the M2M signals), no join per row
+        return ", ".join(author['name'] for author in obj.author_snapshot)
+
+    def save_formset(self, request, form, formset, change):
+        if formset.model is not ArticleAuthor:
+            return super().save_formset(request, form, formset, change)
+        # Apply the byline through set_authors, so the M2M signals (search,
+        # counts, snapshots, cache) fire as for any other authorship change
+        rows = [
+            f.cleaned_data for f in formset.forms
+            if f.cleaned_data.get('author') and not f.cleaned_data.get('DELETE')
+        ]
+        rows.sort(key=lambda row: row.get('position') or 0)
+        authorship.set_authors(form.instance, [row['author'] for row in rows])
+        formset.new_objects, formset.changed_objects, formset.deleted_objects = [], [], []
 
 
 @admin.register(Subscription)
@@ -0,0 +1,260 @@
+"""Streaming BibTeX parser for the bulk importer.
+
+`parse(source)` reads a text stream (or a string) in chunks and yields one
+dict per entry as soon as its closing delimiter has been read:
+
+    {"type": "inproceedings", "key": "paper1",
+     "fields": {"title": "{{B}}ayesian Methods", ...}, "raw": "@inproceedings{paper1, ...}"}
+
+Entries are delimited the way BibTeX does it: `@type{...}` or `@type(...)`,
+ending at the delimiter that closes at brace depth 0, so nested braces never
+end an entry or a value early. Field values may be {braced}, "quoted",
+numbers or @string macro names (the month abbreviations are predefined),
+joined with `#`. Field names are lower-cased, the first occurrence of a
+field wins, whitespace runs become single spaces, and inner braces are
+kept. `text` removes them for display and `names` splits an author list on
+the top-level "and". @comment and @preamble entries, text outside entries and
+`%` comment lines are skipped.
+
+`count(source)` finds the same entries without parsing their fields, so a
+caller can know the total before importing.
+
+Malformed input is handled leniently, as the importer reports missing fields
+itself. If a field cannot be parsed, the fields read before it are kept. An
+entry left open at the end of the input ends there.
+"""
+import io
+import re
+
+CHUNK_SIZE = 64 * 1024
+
+MONTHS = {
+    "jan": "January", "feb": "February", "mar": "March", "apr": "April",
+    "may": "May", "jun": "June", "jul": "July", "aug": "August",
+    "sep": "September", "oct": "October", "nov": "November", "dec": "December",
+}
+
+# Brace groups nested up to three levels deep, matched in one regex call; the
+# scanning loops below take over for deeper nesting and for chunk boundaries
+_GROUPS = r"[^{}]*(?:\{[^{}]*(?:\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}[^{}]*)*\}[^{}]*)*"
+
+_OUTSIDE = re.compile(r"[@%]")
+_HEAD = re.compile(r"@\s*([A-Za-z][\w:-]*)\s*([{(])")
+_CLOSERS = {"{": re.compile(r"[{}]"), "(": re.compile(r"[{})]")}
+_ENTRY_BODY = re.compile(_GROUPS + r"\}")
+_KEY = re.compile(r"\s*([^\s,{}()\"#%'=]*)\s*,?")
+_SEPARATOR = re.compile(r"(?:\s+|,|%[^\n]*)*")
+_FIELD = re.compile(r"([^\s\"#%'(),={}]+)\s*=\s*")
+# [separators] name = {value} / "value" / bare word, not followed by `#`
+_SIMPLE_FIELD = re.compile(
+    r"[\s,]*([^\s\"#%'(),={}]+)\s*=\s*(?:\{(" + _GROUPS + r")\}|\"([^\"{}]*)\"|([^\s\"#%'(),={}]+))\s*(?:,|$)"
+)
+_BARE = re.compile(r"[^\s\"#%'(),={}]+")
+_CONCAT = re.compile(r"\s*#\s*")
+_BRACE = re.compile(r"[{}]")
+_QUOTED = re.compile(r'[{}"]')
+_UNESCAPED_BRACE = re.compile(r"(?<!\\)[{}]")
+_AND = re.compile(r"[{}]|\s+and\s+", re.IGNORECASE)
+_AND_SPLIT = re.compile(r"\s+and\s+", re.IGNORECASE)
+
+
+class _Buffer:
+    """Text read so far from the source; `fill` appends the next chunk"""
+
+    def __init__(self, source, chunk_size):
+        self.read = io.StringIO(source).read if isinstance(source, str) else source.read
+        self.chunk_size = chunk_size
+        self.text = ""
+
+    def fill(self):
+        chunk = self.read(self.chunk_size)
+        self.text += chunk
+        return bool(chunk)
+
+    def discard(self, pos):
+        """Drop the text before `pos`; returns the new position"""
+        if pos >= self.chunk_size:
+            self.text = self.text[pos:]
+            return 0
+        return pos
+
+
+def _find_close(buf, start, opener):
+    """Index of the delimiter closing an entry opened at `start`, or None at end of input"""
+    if opener == "{":
+        body = _ENTRY_BODY.match(buf.text, start)
+        if body:
+            return body.end() - 1
+    pattern, closer = _CLOSERS[opener], "}" if opener == "{" else ")"
+    depth, pos = 0, start
+    while True:
+        for match in pattern.finditer(buf.text, pos):
+            char = match.group()
+            if char == "{":
+                depth += 1
+            elif depth == 0 and char == closer:
+                return match.start()
+            elif char == "}":
+                depth = max(depth - 1, 0)
+        pos = len(buf.text)
+        if not buf.fill():
+            return None
+
+
+def _balanced(s, pos):
+    """Index of the } closing the { at `pos`"""
+    depth = 0
+    for match in _BRACE.finditer(s, pos):
+        depth += 1 if match.group() == "{" else -1
+        if depth == 0:
+            return match.start()
+    raise ValueError("unbalanced braces")
+
+
+def _quoted(s, pos):
+    """Index of the " closing the quoted value that starts at `pos`"""
+    depth = 0
+    for match in _QUOTED.finditer(s, pos + 1):
+        char = match.group()
+        if char == '"' and depth == 0:
+            return match.start()
+        depth += 1 if char == "{" else -1 if char == "}" else 0
+    raise ValueError("unterminated quoted value")
+
+
+def _value(s, pos, macros):
+    """(value, end) of the `#`-joined value starting at `pos`"""
+    parts = []
+    while True:
+        char = s[pos:pos + 1]
+        if char == "{":
+            end = _balanced(s, pos)
+            parts.append(s[pos + 1:end])
+            pos = end + 1
+        elif char == '"':
+            end = _quoted(s, pos)
+            parts.append(s[pos + 1:end])
+            pos = end + 1
+        else:
+            match = _BARE.match(s, pos)
+            if not match:
+                raise ValueError("missing value")
+            word = match.group()
+            # undefined macros expand to nothing, as in BibTeX
+            parts.append(word if word.isdigit() else macros.get(word.lower(), ""))
+            pos = match.end()
+        concat = _CONCAT.match(s, pos)
+        if not concat:
+            return " ".join("".join(parts).split()), pos
+        pos = concat.end()
+
+
+def _fields(s, pos, macros):
+    fields = {}
+    while True:
+        simple = _SIMPLE_FIELD.match(s, pos)
+        if not simple:
+            pos = _SEPARATOR.match(s, pos).end()
+            simple = _SIMPLE_FIELD.match(s, pos)
+        if simple:
+            name, braced, quoted, bare = simple.groups()
+            if bare is not None:
+                value = bare if bare.isdigit() else macros.get(bare.lower(), "")
+            else:
+                value = " ".join((quoted if braced is None else braced).split())
+            fields.setdefault(name.lower(), value)
+            pos = simple.end()
+            continue
+        field = _FIELD.match(s, pos)
+        if not field:
+            return fields
+        try:
+            value, pos = _value(s, field.end(), macros)
+        except ValueError:
+            return fields
+        fields.setdefault(field.group(1).lower(), value)
+
+
+def _entries(buf):
+    """(type, start, body start, end) of each entry in `buf`, @comment and @preamble left out.
+
+    The positions index `buf.text` until the next entry is asked for; `end`
+    is the closing delimiter, or the end of the input for an entry left open.
+    """
+    pos = 0
+    while True:
+        pos = buf.discard(pos)
+        match = _OUTSIDE.search(buf.text, pos)
+        if not match:
+            pos = len(buf.text)
+            if buf.fill():
+                continue
+            return
+        at = match.start()
+        if match.group() == "%":
+            newline = buf.text.find("\n", at)
+            while newline < 0 and buf.fill():
+                newline = buf.text.find("\n", at)
+            pos = newline + 1 if newline >= 0 else len(buf.text)
+            continue
+        head = _HEAD.match(buf.text, at)
+        # the head may be cut by the chunk boundary
+        while not head and len(buf.text) - at < 256 and buf.fill():
+            head = _HEAD.match(buf.text, at)
+        if not head:
+            pos = at + 1
+            continue
+        close = _find_close(buf, head.end(), head.group(2))
+        end = len(buf.text) if close is None else close
+        pos = end + 1
+        kind = head.group(1).lower()
+        if kind not in ("comment", "preamble"):
+            yield kind, at, head.end(), end
+
+
+def parse(source, chunk_size=CHUNK_SIZE):
+    """Yield the entries of a BibTeX text stream (anything with read()) or string"""
+    buf = _Buffer(source, chunk_size)
+    macros = dict(MONTHS)
+    for kind, at, start, end in _entries(buf):
+        body = buf.text[start:end]
+        if kind == "string":
+            macros.update(_fields(body, 0, macros))
+            continue
+        key = _KEY.match(body)
+        yield {
+            "type": kind,
+            "key": key.group(1),
+            "fields": _fields(body, key.end(), macros),
+            "raw": buf.text[at:end + 1].rstrip(),
+        }
+
+
+def count(source, chunk_size=CHUNK_SIZE):
+    """The number of entries `parse` yields for `source`, found without parsing their fields"""
+    return sum(1 for kind, *_ in _entries(_Buffer(source, chunk_size)) if kind != "string")
+
+
+def text(value):
+    """A field value without its grouping braces: "{{B}}ayesian" -> "Bayesian" """
+    if "\\" in value:
+        return _UNESCAPED_BRACE.sub("", value).strip()
+    return value.replace("{", "").replace("}", "").strip()
+
+
+def names(value):
+    """The names of an author/editor field, split on the "and"s outside braces"""
+    if "{" not in value:
+        return [name for name in (part.strip() for part in _AND_SPLIT.split(value)) if name]
+    result, depth, start = [], 0, 0
+    for match in _AND.finditer(value):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+        elif depth == 0:
+            result.append(value[start:match.start()])
+            start = match.end()
+    result.append(value[start:])
+    return [name for name in map(text, result) if name]
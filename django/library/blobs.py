@@ -0,0 +1,125 @@
+"""Reference counts of the content-addressed PDF blobs (see library.storage).
+
+Each blob has a StoredPdf row counting the articles that point at it.
+library.signals calls `retain` / `release` when an article's pdf_file changes
+or the article is deleted (the bulk importer, which bypasses the signals,
+calls `retain_all`, and `discard` for the PDFs of entries it failed to
+insert), and the file is removed once the count drops to zero. Counts are
+changed under a lock on the blob's row; the file is only deleted after the
+row delete commits, and only if no upload has taken the blob up again since.
+Files from before the content-addressed layout (pdfs/<name>_<suffix>.pdf)
+have no row; they are removed when no article references them any more, and
+the dedupe_pdfs command moves them into the new layout (`rebuild_counts`
+recomputes every row from the articles).
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .models import Article, StoredPdf
+from .storage import blob_digest, pdf_storage
+
+
+def retain(name):
+    """Count one more article pointing at the blob `name`"""
+    digest = blob_digest(name)
+    if not digest:
+        return
+    # the row lock orders this against a concurrent `release` of the same blob
+    with transaction.atomic():
+        if StoredPdf.objects.select_for_update().filter(digest=digest).exists():
+            StoredPdf.objects.filter(digest=digest).update(ref_count=F("ref_count") + 1)
+        else:
+            size = pdf_storage.size(name) if pdf_storage.exists(name) else 0
+            StoredPdf.objects.create(digest=digest, name=name, size=size, ref_count=1)
+
+
+def retain_all(names):
+    """`retain` for many names at once (bulk-created articles), one UPDATE per distinct count"""
+    counts, names_by_digest = Counter(), {}
+    for name in names:
+        digest = blob_digest(name)
+        if digest:
+            counts[digest] += 1
+            names_by_digest.setdefault(digest, name)
+    if not counts:
+        return
+    with transaction.atomic():
+        existing = set(
+            StoredPdf.objects.select_for_update().filter(digest__in=counts).values_list("digest", flat=True)
+        )
+        by_increment = {}
+        for digest in existing:
+            by_increment.setdefault(counts[digest], []).append(digest)
+        for increment, digests in by_increment.items():
+            StoredPdf.objects.filter(digest__in=digests).update(ref_count=F("ref_count") + increment)
+        StoredPdf.objects.bulk_create([
+            StoredPdf(digest=digest, name=name, size=pdf_storage.size(name) if pdf_storage.exists(name) else 0, ref_count=counts[digest])
+            for digest, name in names_by_digest.items() if digest not in existing
+        ])
+
+
+def _delete_file(name):
+    if pdf_storage.exists(name):
+        pdf_storage.delete(name)
+
+
+def _delete_unused(name):
+    """Delete the file of `name` unless a row or an article took it up again since"""
+    digest = blob_digest(name)
+    with transaction.atomic():
+        if digest and StoredPdf.objects.select_for_update().filter(digest=digest).exists():
+            return
+        if Article.objects.filter(pdf_file=name).exists():
+            return
+        _delete_file(name)
+
+
+def release(name):
+    """Count one article less for `name`; its file goes once nothing uses it"""
+    if not name:
+        return
+    digest = blob_digest(name)
+    if digest:
+        # Decrement and delete under the row lock, so an upload deduplicated
+        # onto this blob meanwhile either keeps the row alive or recreates it
+        with transaction.atomic():
+            row = StoredPdf.objects.select_for_update().filter(digest=digest).first()
+            if row is None:
+                return
+            if row.ref_count > 1:
+                StoredPdf.objects.filter(pk=row.pk).update(ref_count=F("ref_count") - 1)
+                return
+            row.delete()
+    elif Article.objects.filter(pdf_file=name).exists():
+        return
+    # only after commit: a rolled back delete must still find its file, and
+    # a blob retained again by then is kept (see _delete_unused)
+    transaction.on_commit(lambda: _delete_unused(name))
+
+
+def discard(names):
+    """Remove blobs stored for articles that were never saved, unless something else uses them"""
+    for name in set(filter(None, names)):
+        transaction.on_commit(lambda name=name: _delete_unused(name))
+
+
+def rebuild_counts():
+    """Recount every blob's references from Article.pdf_file. Returns the number of blobs."""
+    names = (
+        Article.objects.exclude(pdf_file__isnull=True).exclude(pdf_file="")
+        .values_list("pdf_file").annotate(n=Count("id")).order_by()
+    )
+    rows = {}
+    for name, count in names:
+        digest = blob_digest(name)
+        if not digest:
+            continue
+        if digest not in rows:
+            size = pdf_storage.size(name) if pdf_storage.exists(name) else 0
+            rows[digest] = StoredPdf(digest=digest, name=name, size=size, ref_count=0)
+        rows[digest].ref_count += count
+    StoredPdf.objects.all().delete()
+    StoredPdf.objects.bulk_create(rows.values(), batch_size=500)
+    return len(rows)
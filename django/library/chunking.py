@@ -0,0 +1,11 @@
+"""Splitting id sets for IN (...) lookups and batched writes."""
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+CHUNK_SIZE = 500
+
+
+def chunks(items, size=CHUNK_SIZE):
+    """`items` as consecutive lists of at most `size` elements"""
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,186 @@
+"""PDF delivery: byte ranges, proxy offload and immutable caching.
+
+`pdf_response` answers a GET/HEAD for one stored PDF:
+
+- The ETag is the content version of the file name. For content-addressed
+  blobs (see library.storage) that is the SHA-256 in the name. Legacy names
+  carry a unique suffix and are never rewritten, so a hash of the name does
+  the same job. If-None-Match / If-Modified-Since are answered with 304.
+- Links built by `pdf_url` carry that version as ?v=. A request whose ?v=
+  matches is cached as immutable for a year, because new content means a
+  new URL. Requests without it get no-cache and revalidate by ETag.
+- With PDF_SENDFILE_BACKEND set, the transfer is handed to the front proxy
+  (X-Accel-Redirect for nginx, X-Sendfile for Apache/lighttpd). The proxy
+  then serves the bytes and the Range requests itself. A legacy file whose
+  path X-Sendfile cannot carry (non-ASCII) is streamed instead.
+- Otherwise the file is returned as a FileResponse. A whole file, or a range
+  running to its end, is the open file positioned at the first byte. The
+  WSGI server's file_wrapper can then send it with sendfile(2) without
+  copying it through Python. A range that ends before the end of the file
+  is read in blocks, bounded to its length.
+
+Only single ranges are honoured; a multi-range request gets the whole file
+with 200, which RFC 9110 allows.
+"""
+import hashlib
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe
+
+from .storage import blob_digest, pdf_storage
+
+CONTENT_TYPE = "application/pdf"
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# what an X-Sendfile path may hold: Apache and lighttpd use it undecoded
+_SENDFILE_PATH_RE = re.compile(r"^[\x20-\x7e]+$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def pdf_version(name):
+    """Content version of a stored PDF, derived from its name alone"""
+    return (blob_digest(name) or hashlib.sha256(name.encode()).hexdigest())[:16]
+
+
+def pdf_url(article_id, name):
+    return f"/api/articles/{article_id}/pdf/?v={pdf_version(name)}"
+
+
+def parse_range(header, size):
+    """Inclusive (first, last) byte positions of a single-range header.
+
+    Returns None when the whole file should be sent: no header, several
+    ranges, or a header that is not a valid bytes range. Raises
+    RangeNotSatisfiable when no requested byte lies inside the file.
+    """
+    match = _RANGE_RE.match((header or "").strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # suffix range: the final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable
+        return max(size - length, 0), size - 1
+    first = int(first)
+    if last != "" and int(last) < first:
+        return None
+    if first >= size:
+        raise RangeNotSatisfiable
+    return first, size - 1 if last == "" else min(int(last), size - 1)
+
+
+def _range_applies(request, etag, last_modified):
+    """If-Range: honour the Range only if the client's copy is still current"""
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+class _BoundedFile:
+    """Read-only view of `length` bytes of an open file, from its current position"""
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def _offload(name, path):
+    """Empty response telling the front proxy which file to send, or None to stream it here"""
+    backend = getattr(settings, "PDF_SENDFILE_BACKEND", None)
+    if not backend:
+        return None
+    response = HttpResponse(content_type=CONTENT_TYPE)
+    if backend == "x-accel-redirect":
+        # an `internal` nginx location aliased to MEDIA_ROOT; nginx decodes the URI
+        response["X-Accel-Redirect"] = settings.PDF_ACCEL_REDIRECT_PREFIX + quote(name)
+    elif backend == "x-sendfile":
+        if not _SENDFILE_PATH_RE.match(path):
+            # a legacy name with non-ASCII characters cannot be put in the header
+            return None
+        response["X-Sendfile"] = path
+    else:
+        raise ValueError(f"Unknown PDF_SENDFILE_BACKEND: {backend!r}")
+    return response
+
+
+def _file_response(request, path, size, etag, last_modified, filename):
+    try:
+        byte_range = parse_range(request.META.get("HTTP_RANGE"), size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+    if byte_range and not _range_applies(request, etag, last_modified):
+        byte_range = None
+    file = open(path, "rb")
+    if byte_range is None:
+        return FileResponse(file, content_type=CONTENT_TYPE, filename=filename)
+    first, last = byte_range
+    file.seek(first)
+    if last == size - 1:
+        # FileResponse sizes the body from the current position to the end
+        response = FileResponse(file, status=206, content_type=CONTENT_TYPE, filename=filename)
+    else:
+        response = FileResponse(_BoundedFile(file, last - first + 1), status=206, content_type=CONTENT_TYPE, filename=filename)
+        response["Content-Length"] = str(last - first + 1)
+    response["Content-Range"] = f"bytes {first}-{last}/{size}"
+    return response
+
+
+def _cache_headers(response, etag, last_modified, immutable):
+    if response.status_code >= 400:
+        return response
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    if immutable:
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def pdf_response(request, name, filename, immutable=False):
+    """Serve the stored PDF `name` for download as `filename` (Http404 if the file is gone)"""
+    path = pdf_storage.path(name)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404("PDF not found")
+    etag = f'"{pdf_version(name)}"'
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = _offload(name, path)
+        if response is not None:
+            response["Content-Disposition"] = content_disposition_header(False, filename)
+        else:
+            response = _file_response(request, path, stat.st_size, etag, last_modified, filename)
+    return _cache_headers(response, etag, last_modified, immutable)
@@ -0,0 +1,477 @@
+"""The BibTeX bulk import.
+
+`run_import(bibtex_content, edition, pdf_zip)` parses the entries, validates
+them, matches PDFs from the ZIP and creates the articles in batches of
+BATCH_SIZE, returning the import summary. The bulk import view calls it
+directly, and the run_import_jobs command calls it for queued ImportJobs.
+The ZIP is only indexed by member name up front. A member is decompressed
+when an article is matched to it, streamed through a temporary file into
+the PDF storage, so memory use does not grow with the archive.
+
+`create_articles(rows)` inserts a batch of new articles with their ordered
+author lists in a fixed number of statements. The author names of the whole
+batch are resolved with one query and the missing authors bulk-created
+(authorship.resolve_authors). Then the articles and their authorship links
+are inserted with bulk_create.
+
+bulk_create sends no signals. The work library.signals does for a created
+article and its added authors is therefore done here, once per batch. The
+author snapshots are written with the rows. The search index, author
+counts, profiles, PDF reference counts, version stamps and response cache
+are updated for the whole batch. Subscribers are notified once the batch
+commits. Callers run each batch in its own transaction.
+"""
+import os
+import re
+import shutil
+import zipfile
+
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import transaction
+
+from .models import Article, ArticleAuthor, Author
+from .payloads import Documents
+from . import authorship, bibtex, blobs, profiles, response_cache, search, signals, snapshots, versioning
+
+# Entries per transaction
+BATCH_SIZE = 500
+
+
+def create_articles(rows):
+    """Insert `rows` [(unsaved Article, [author names])] and return the saved articles.
+
+    Each article's pdf_file, if any, must already be in storage.
+    """
+    names = list(dict.fromkeys(name for _, article_names in rows for name in article_names if name))
+    by_name = dict(zip(names, authorship.resolve_authors(names)))
+    articles, links, author_ids = [], [], set()
+    for article, article_names in rows:
+        authors = list({by_name[name].pk: by_name[name] for name in article_names if name}.values())
+        article.author_snapshot = [snapshots.author_entry(a.pk, a.name, a.email, a.slug) for a in authors]
+        articles.append(article)
+        links.append(authors)
+        author_ids.update(a.pk for a in authors)
+
+    Article.objects.bulk_create(articles)
+    ArticleAuthor.objects.bulk_create(
+        [
+            ArticleAuthor(article_id=article.pk, author_id=author.pk, position=position)
+            for article, authors in zip(articles, links)
+            for position, author in enumerate(authors)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    article_ids = [article.pk for article in articles]
+    search.index_articles(article_ids)
+    search.refresh_author_counts(author_ids)
+    profiles.refresh_profiles(author_ids)
+    blobs.retain_all(article.pdf_file.name for article in articles if article.pdf_file)
+    versioning.bump(
+        "articles", "authors",
+        *(versioning.object_key(Article, pk) for pk in article_ids),
+        *(versioning.object_key(Author, pk) for pk in author_ids),
+    )
+    response_cache.evict(*(f"article:{pk}" for pk in article_ids), *(f"author:{pk}" for pk in author_ids))
+    transaction.on_commit(lambda: signals.notify_subscribers_of_articles(articles))
+    return articles
+
+
+def parse_bibtex(bibtex_content):
+    """Yield the article information of each BibTeX entry (a text stream or a string)"""
+    for entry in bibtex.parse(bibtex_content):
+        fields = entry['fields']
+        year = fields.get('year', '')
+        year_match = re.match(r'\d{4}', year)
+        article_data = {
+            'title': bibtex.text(fields.get('title', '')),
+            'authors': bibtex.names(fields.get('author', '')),
+            'abstract': bibtex.text(fields.get('abstract', '')),
+            'url': bibtex.text(fields.get('url', '')),
+            'year': year_match.group() if year_match else year,
+            'bibtex_entry': entry['raw'],
+        }
+        for field in ('booktitle', 'journal', 'pages'):
+            if field in fields:
+                article_data[field] = bibtex.text(fields[field])
+
+        # Always add entry for processing (validation will handle missing fields)
+        yield article_data
+
+
+def validate_article_data(article_data, entry_index):
+    """Validate that article has all required fields"""
+    # Map field names to Portuguese
+    field_translation = {
+        'title': 'título',
+        'year': 'ano',
+        'authors': 'autores',
+        'title (too short)': 'título (muito curto)',
+        'year (invalid range)': 'ano (fora do intervalo válido)',
+        'year (invalid format)': 'ano (formato inválido)'
+    }
+
+    required_fields = ['title', 'year']  # Title and year are mandatory
+    recommended_fields = ['authors']  # Authors are highly recommended
+
+    missing_required = []
+    missing_recommended = []
+
+    # Check required fields
+    for field in required_fields:
+        value = article_data.get(field)
+        if not value or (isinstance(value, str) and not value.strip()):
+            missing_required.append(field)
+
+    # Check recommended fields
+    for field in recommended_fields:
+        if not article_data.get(field) or (isinstance(article_data.get(field), list) and len(article_data.get(field)) == 0):
+            missing_recommended.append(field)
+
+    # Validate title length (minimum meaningful length)
+    title = article_data.get('title', '').strip()
+    if title and len(title) < 3:
+        missing_required.append('title (too short)')
+
+    # Validate year format
+    year = article_data.get('year')
+    if year:
+        try:
+            year_int = int(year)
+            if year_int < 1900 or year_int > 2030:
+                missing_required.append('year (invalid range)')
+        except (ValueError, TypeError):
+            missing_required.append('year (invalid format)')
+
+    # Generate validation result
+    if missing_required:
+        # Translate field names to Portuguese
+        translated_fields = [field_translation.get(field, field) for field in missing_required]
+        return {
+            'valid': False,
+            'reason': f"Campos obrigatórios em falta: {', '.join(translated_fields)}",
+            'missing_fields': missing_required + missing_recommended
+        }
+
+    # Warn about missing recommended fields but don't skip
+    warnings = []
+    if missing_recommended:
+        translated_recommended = [field_translation.get(field, field) for field in missing_recommended]
+        warnings.append(f"Campos recomendados em falta: {', '.join(translated_recommended)}")
+
+    return {
+        'valid': True,
+        'reason': None,
+        'missing_fields': missing_recommended,
+        'warnings': warnings
+    }
+
+
+def extract_pdfs_from_zip(archive):
+    """Index the PDF members of an open ZipFile by name, without decompressing any"""
+    pdf_files = {}
+    pdf_count = 0  # Track actual PDF file count
+
+    for file_info in archive.infolist():
+        if file_info.filename.lower().endswith('.pdf'):
+            # Get just the filename without path
+            filename = os.path.basename(file_info.filename)
+
+            # The member is only read when an article is matched (attach_pdf)
+            pdf_data = {
+                'archive': archive,
+                'member': file_info,
+                'name': filename
+            }
+
+            # Store with full filename (e.g., "sbes-paper1.pdf")
+            pdf_files[filename.lower()] = pdf_data
+
+            # Also store without extension for matching (e.g., "sbes-paper1")
+            name_without_ext = os.path.splitext(filename)[0].lower()
+            pdf_files[name_without_ext] = pdf_data
+
+            pdf_count += 1  # Increment actual file count
+
+    # Store the actual count in a special key
+    pdf_files['__pdf_count__'] = pdf_count
+    return pdf_files
+
+
+def attach_pdf(article, pdf_data):
+    """Stream a matched ZIP member into `article.pdf_file` without saving the article.
+
+    The member is decompressed block by block into a temporary file, which
+    the PDF storage hashes and moves into place like a spooled upload.
+    """
+    member = pdf_data['member']
+    spooled = TemporaryUploadedFile(pdf_data['name'], 'application/pdf', member.file_size, None)
+    try:
+        with pdf_data['archive'].open(member) as source:
+            shutil.copyfileobj(source, spooled)
+        article.pdf_file.save(pdf_data['name'], spooled, save=False)
+    finally:
+        spooled.close()
+
+
+def find_matching_pdf(article_data, pdf_files):
+    """Try to find a matching PDF file for the article"""
+    if not pdf_files:
+        return None
+
+    # First, try to extract the BibTeX key from the entry
+    bibtex_entry = article_data.get('bibtex_entry', '')
+    bibtex_key = None
+
+    # Extract the BibTeX key (e.g., "sbes-paper1" from "@inproceedings{sbes-paper1,")
+    key_match = re.search(r'@\w+\s*{\s*([^,\s]+)', bibtex_entry)
+    if key_match:
+        bibtex_key = key_match.group(1).strip()
+
+    # Strategy 1: Try exact match with BibTeX key + .pdf
+    if bibtex_key:
+        exact_filename = f"{bibtex_key}.pdf".lower()
+        if exact_filename in pdf_files:
+            return pdf_files[exact_filename]
+
+        # Also try the key without extension (in case it was stored that way)
+        if bibtex_key.lower() in pdf_files:
+            return pdf_files[bibtex_key.lower()]
+
+    # Strategy 2: Try title-based matching (fallback)
+    title = article_data.get('title', '').lower()
+
+    # Try different matching strategies based on title
+    possible_names = [
+        # Clean title (remove special characters)
+        re.sub(r'[^\w\s-]', '', title).replace(' ', '_'),
+        re.sub(r'[^\w\s-]', '', title).replace(' ', '-'),
+        re.sub(r'[^\w\s-]', '', title).replace(' ', ''),
+        # First few words of title
+        '_'.join(title.split()[:3]),
+        '-'.join(title.split()[:3]),
+        # Just first word
+        title.split()[0] if title.split() else '',
+    ]
+
+    # Try to match with PDF files
+    for name in possible_names:
+        if name and name.lower() in pdf_files:
+            return pdf_files[name.lower()]
+
+    # If no match found, try partial matching
+    for pdf_name in pdf_files.keys():
+        # First try BibTeX key partial match
+        if bibtex_key and bibtex_key.lower() in pdf_name.lower():
+            return pdf_files[pdf_name]
+
+        # Then try title-based partial match
+        for name in possible_names:
+            if name and len(name) > 3 and name.lower() in pdf_name.lower():
+                return pdf_files[pdf_name]
+
+    return None
+
+
+def build_article(article_data, edition, pdf_files):
+    """(unsaved Article, author names) for a validated entry; a matched PDF is stored right away"""
+    # Parse pages field (e.g., "1--11" or "1-11" or "100")
+    pagina_inicial = None
+    pagina_final = None
+    pages_str = article_data.get('pages', '')
+    if pages_str:
+        # Try to split by -- or - or –
+        pages_parts = re.split(r'[-–—]+', pages_str.strip())
+        if len(pages_parts) >= 2:
+            # Range format: "1--11" or "1-11"
+            try:
+                pagina_inicial = int(pages_parts[0].strip())
+                pagina_final = int(pages_parts[1].strip())
+            except ValueError:
+                pass
+        elif len(pages_parts) == 1 and pages_parts[0].strip():
+            # Single page: "100"
+            try:
+                pagina_inicial = int(pages_parts[0].strip())
+                pagina_final = pagina_inicial
+            except ValueError:
+                pass
+
+    article = Article(
+        title=article_data.get('title', ''),
+        abstract=article_data.get('abstract', ''),
+        pdf_url=article_data.get('url', ''),
+        edition=edition,
+        bibtex=article_data.get('bibtex_entry', ''),
+        pagina_inicial=pagina_inicial,
+        pagina_final=pagina_final,
+    )
+
+    authors = [name.strip() for name in article_data.get('authors', [])]
+
+    # Try to match PDF file from ZIP
+    pdf_file = find_matching_pdf(article_data, pdf_files)
+    if pdf_file:
+        # Written to storage now, last, so a failing entry leaves no blob behind;
+        # the row is inserted with the batch (_import_batch discards it if that fails)
+        attach_pdf(article, pdf_file)
+
+    return article, authors
+
+
+def _import_batch(batch, docs, created_articles, processing_errors):
+    """Create a batch of built articles in one transaction.
+
+    If the batch fails, its entries are retried one by one, each in its
+    own savepoint, so a bad entry is reported without losing the rest.
+    The PDFs of the entries that still fail are removed from storage once
+    the batch is done (another entry of it may share the same blob).
+    """
+    if not batch:
+        return
+    try:
+        with transaction.atomic():
+            articles = create_articles(batch)
+    except Exception:
+        articles, failed = [], []
+        for article, authors in batch:
+            # a failed bulk_create may have assigned primary keys
+            article.pk, article._state.adding = None, True
+            try:
+                with transaction.atomic():
+                    articles += create_articles([(article, authors)])
+            except Exception as e:
+                failed.append(article.pdf_file.name)
+                processing_errors.append({
+                    'title': article.title,
+                    'reason': f"Erro no banco de dados: {str(e)}"
+                })
+        blobs.discard(failed)
+    created_articles.extend(docs.article(article) for article in articles)
+
+
+def generate_import_report(created_articles, skipped_articles, processing_errors, pdf_files):
+    """Generate a comprehensive import report"""
+    total_entries = len(created_articles) + len(skipped_articles) + len(processing_errors)
+    success_rate = (len(created_articles) / total_entries * 100) if total_entries > 0 else 0
+
+    # Get actual PDF count from the special key
+    actual_pdf_count = pdf_files.get('__pdf_count__', 0)
+
+    report = {
+        'summary': {
+            'total_entries_processed': total_entries,
+            'successful_imports': len(created_articles),
+            'skipped_entries': len(skipped_articles),
+            'processing_errors': len(processing_errors),
+            'success_rate': round(success_rate, 1),
+            'pdf_files_in_zip': actual_pdf_count,
+            'pdfs_successfully_matched': len([a for a in created_articles if a.get('pdf_url') and 'localhost:8000' in str(a.get('pdf_url', ''))])
+        },
+        'details': {
+            'skipped_breakdown': {},
+            'most_common_skip_reasons': []
+        }
+    }
+
+    # Analyze skip reasons
+    skip_reasons = {}
+    for skipped in skipped_articles:
+        reason = skipped['reason']
+        skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+
+    report['details']['skipped_breakdown'] = skip_reasons
+    report['details']['most_common_skip_reasons'] = sorted(skip_reasons.items(), key=lambda x: x[1], reverse=True)
+
+    return report
+
+
+def run_import(bibtex_content, edition, pdf_zip=None, progress=None, start=0):
+    """Import every entry of `bibtex_content` (a text stream or a string) into `edition`.
+
+    Returns the import summary the bulk import endpoint responds with. If
+    the input cannot be read to the end, the entries before the error are
+    still imported and the summary has `complete` false and the `error`.
+    `progress(processed)` is called after each batch is committed with the
+    number of entries handled so far. The first `start` entries are skipped
+    (a job resumed after its worker died); the summary leaves them out.
+    """
+    if not pdf_zip:
+        return _import_entries(bibtex_content, edition, {}, progress, start)
+    # Handle ZIP file with PDFs: indexed now, members read as they are matched
+    try:
+        archive = zipfile.ZipFile(pdf_zip, 'r')
+    except Exception as e:
+        print(f"Error extracting ZIP: {e}")
+        return _import_entries(bibtex_content, edition, {}, progress, start)
+    with archive:
+        return _import_entries(bibtex_content, edition, extract_pdfs_from_zip(archive), progress, start)
+
+
+def _import_entries(bibtex_content, edition, pdf_files, progress, start):
+    created_articles = []
+    docs = Documents()
+    skipped_articles = []
+    processing_errors = []
+
+    # Entries are created in batches, each in one transaction
+    batch = []
+    processed = 0
+    read_error = None
+    entries = enumerate(parse_bibtex(bibtex_content), 1)
+    while True:
+        # The upload is decoded as it is read: an undecodable byte far into it
+        # ends the import after the batches already committed, which the
+        # summary then reports instead of failing the whole request
+        try:
+            processed, article_data = next(entries)
+        except StopIteration:
+            break
+        except ValueError as e:  # UnicodeDecodeError included
+            read_error = f"Erro ao ler o BibTeX após a entrada #{processed}: {str(e)}"
+            processing_errors.append({'title': f'Entry #{processed + 1}', 'reason': read_error})
+            break
+        if processed <= start:
+            continue
+        # Validate required fields
+        validation_result = validate_article_data(article_data, processed)
+
+        if not validation_result['valid']:
+            skipped_articles.append({
+                'title': article_data.get('title', f'Entry #{processed}'),
+                'reason': validation_result['reason'],
+                'missing_fields': validation_result['missing_fields']
+            })
+            continue
+
+        try:
+            batch.append(build_article(article_data, edition, pdf_files))
+        except Exception as e:
+            processing_errors.append({
+                'title': article_data.get('title', f'Entry #{processed}'),
+                'reason': f"Erro no banco de dados: {str(e)}"
+            })
+        if len(batch) >= BATCH_SIZE:
+            _import_batch(batch, docs, created_articles, processing_errors)
+            batch = []
+            if progress:
+                progress(processed)
+    _import_batch(batch, docs, created_articles, processing_errors)
+    if progress:
+        progress(processed)
+
+    # Generate summary report
+    report = generate_import_report(created_articles, skipped_articles, processing_errors, pdf_files)
+
+    return {
+        "complete": read_error is None,
+        "error": read_error,
+        "created_count": len(created_articles),
+        "skipped_count": len(skipped_articles),
+        "error_count": len(processing_errors),
+        "articles": created_articles,
+        "skipped_articles": skipped_articles,
+        "processing_errors": processing_errors,
+        "report": report,
+        "pdf_matches": len([a for a in created_articles if a.get('pdf_url') and 'localhost:8000' in str(a.get('pdf_url', ''))])
+    }
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from library import blobs, response_cache, versioning
+from library.models import Article
+from library.storage import blob_digest, pdf_storage
+
+# Upload directories used before the content-addressed layout
+LEGACY_DIRS = ('articles', 'pdfs')
+
+class Command(BaseCommand):
+    help = 'Move article PDFs into the content-addressed layout (one file per distinct content) and rebuild their reference counts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would change')
+        parser.add_argument('--purge', action='store_true', help='Also delete legacy PDFs that no article references')
+
+    def legacy_files(self):
+        for directory in LEGACY_DIRS:
+            if pdf_storage.exists(directory):
+                for name in pdf_storage.listdir(directory)[1]:
+                    yield f'{directory}/{name}'
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        articles = Article.objects.exclude(pdf_file__isnull=True).exclude(pdf_file='')
+        moved, digests = {}, set()
+        with transaction.atomic():
+            for pk, name in articles.values_list('id', 'pdf_file').iterator():
+                if blob_digest(name):
+                    continue
+                if not pdf_storage.exists(name):
+                    self.stderr.write(self.style.WARNING(f'Article {pk}: {name} is missing, left as is.'))
+                    continue
+                if dry_run:
+                    moved[pk] = name
+                    continue
+                with pdf_storage.open(name) as content:
+                    new_name = pdf_storage.save(name, content)
+                # queryset update: the counts are rebuilt below in one pass
+                Article.objects.filter(pk=pk).update(pdf_file=new_name)
+                moved[pk] = name
+                digests.add(blob_digest(new_name))
+            if not dry_run:
+                blob_count = blobs.rebuild_counts()
+                versioning.bump_for(Article, moved)
+                transaction.on_commit(response_cache.clear)
+
+        referenced = set(articles.values_list('pdf_file', flat=True))
+        moved_names = set(moved.values())
+        stale = [
+            name for name in self.legacy_files()
+            if name not in referenced and (options['purge'] or name in moved_names)
+        ]
+        freed = sum(pdf_storage.size(name) for name in stale)
+        if not dry_run:
+            for name in stale:
+                pdf_storage.delete(name)
+
+        verb = 'Would move' if dry_run else 'Moved'
+        self.stdout.write(f'{verb} {len(moved)} article PDFs' + ('' if dry_run else f' into {len(digests)} distinct blobs') + '.')
+        verb = 'Would delete' if dry_run else 'Deleted'
+        self.stdout.write(f'{verb} {len(stale)} legacy files ({freed / 1024 / 1024:.1f} MB).')
+        unreferenced = 0 if options['purge'] else sum(
+            1 for name in self.legacy_files() if name not in referenced and name not in stale
+        )
+        if unreferenced:
+            self.stdout.write(f'{unreferenced} legacy files are not referenced by any article; rerun with --purge to delete them.')
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS(f'{blob_count} content-addressed PDFs in use.'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from library import profiles, response_cache, versioning
+
+class Command(BaseCommand):
+    help = 'Recompute every materialized author profile (author page data) from the articles and authorships.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = profiles.rebuild_profiles()
+            # every author page may have changed: new ETags, no cached copies
+            versioning.bump('authors')
+            transaction.on_commit(response_cache.clear)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {count} author profiles.'))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from library import response_cache, search, versioning
+from library.models import Author
+
+class Command(BaseCommand):
+    help = 'Rebuild the search indexes (full-text article index, author name tokens and article counts) from scratch.'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            # search results, author filters and suggestions may all change
+            versioning.bump_for(Author)
+            transaction.on_commit(response_cache.clear)
+            tokens = search.rebuild_author_tokens()
+            self.stdout.write(self.style.SUCCESS(f'Indexed {tokens} author name tokens.'))
+            authors = search.rebuild_author_counts()
+            self.stdout.write(self.style.SUCCESS(f'Recounted articles of {authors} authors.'))
+            if not search.fts_available():
+                self.stderr.write(self.style.WARNING('Full-text search requires the SQLite backend; skipping article index.'))
+                return
+            count = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} articles.'))
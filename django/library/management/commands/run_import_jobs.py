@@ -0,0 +1,106 @@
+import io
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from library import bibtex, importer
+from library.models import ImportJob
+
+class Command(BaseCommand):
+    help = 'Run the bulk imports queued by the bulk import endpoint, oldest first, polling for new ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run the jobs queued now and exit instead of polling')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls when the queue is empty (default 5)')
+        parser.add_argument('--stale-after', type=float, default=3600.0,
+                            help='Seconds without progress after which a started job is taken to be abandoned by its worker and queued again (default 3600)')
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(seconds=options['stale_after'])
+        while True:
+            self.requeue_stale(stale_after)
+            job = self.claim()
+            if job:
+                self.run(job)
+            elif options['once']:
+                return
+            else:
+                time.sleep(options['interval'])
+
+    def requeue_stale(self, stale_after):
+        """Queue again the unfinished jobs whose worker has not reported progress for `stale_after`.
+
+        The worker refreshes `heartbeat_at` after every batch, so only a dead
+        one falls behind; the entries it already imported (`processed`) are
+        skipped when the job is run again.
+        """
+        stale = ImportJob.objects.filter(
+            phase__in=[ImportJob.PARSING, ImportJob.IMPORTING], heartbeat_at__lt=timezone.now() - stale_after,
+        )
+        for pk in stale.values_list('pk', flat=True):
+            if stale.filter(pk=pk).update(phase=ImportJob.QUEUED):
+                self.stderr.write(self.style.WARNING(f'Import job {pk}: abandoned by its worker, queued again'))
+
+    def claim(self):
+        """The oldest queued job, moved to the parsing phase, or None if there is none"""
+        queued = ImportJob.objects.filter(phase=ImportJob.QUEUED)
+        while True:
+            pk = queued.order_by('pk').values_list('pk', flat=True).first()
+            if pk is None:
+                return None
+            # another worker may have claimed it since
+            now = timezone.now()
+            if queued.filter(pk=pk).update(phase=ImportJob.PARSING, started_at=now, heartbeat_at=now):
+                return ImportJob.objects.select_related('edition').get(pk=pk)
+
+    def open_upload(self, field):
+        # a fresh file object per pass; FieldFile.open would reuse the closed one
+        return field.storage.open(field.name, 'rb')
+
+    def run(self, job):
+        self.stdout.write(f'Import job {job.pk}: importing into {job.edition}...')
+
+        def progress(processed):
+            job.processed = processed
+            job.heartbeat_at = timezone.now()
+            job.save(update_fields=['processed', 'heartbeat_at'])
+
+        try:
+            # A first pass only finds the entry delimiters (no fields are
+            # parsed), so pollers can show processed/total from the start
+            with io.TextIOWrapper(self.open_upload(job.bibtex_file), encoding='utf-8') as stream:
+                job.total = bibtex.count(stream)
+            job.phase = ImportJob.IMPORTING
+            job.save(update_fields=['total', 'phase'])
+            with io.TextIOWrapper(self.open_upload(job.bibtex_file), encoding='utf-8') as stream:
+                pdf_zip = self.open_upload(job.pdf_zip) if job.pdf_zip else None
+                try:
+                    result = importer.run_import(stream, job.edition, pdf_zip, progress, start=job.processed)
+                finally:
+                    if pdf_zip:
+                        pdf_zip.close()
+            # the created articles can be fetched from the API; the summary is kept
+            result.pop('articles')
+            job.result = result
+            if result['complete']:
+                job.phase = ImportJob.DONE
+                self.stdout.write(self.style.SUCCESS(
+                    f"Import job {job.pk}: {result['created_count']} created, "
+                    f"{result['skipped_count']} skipped, {result['error_count']} errors."
+                ))
+            else:
+                # the entries before the unreadable part were imported; `result` says which
+                job.phase = ImportJob.FAILED
+                job.error = result['error']
+                self.stderr.write(self.style.ERROR(
+                    f"Import job {job.pk} failed after {result['created_count']} created: {job.error}"
+                ))
+        except Exception as e:
+            job.phase = ImportJob.FAILED
+            job.error = str(e)
+            self.stderr.write(self.style.ERROR(f'Import job {job.pk} failed: {e}'))
+        job.finished_at = timezone.now()
+        job.bibtex_file.delete(save=False)
+        job.pdf_zip.delete(save=False)
+        job.save(update_fields=['phase', 'result', 'error', 'finished_at', 'bibtex_file', 'pdf_zip'])
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from library import response_cache, snapshots, versioning
+from library.models import Article
+
+class Command(BaseCommand):
+    help = 'Check every article\'s denormalized author snapshot against the authors table; --repair rewrites the drifted ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repair', action='store_true', help='Rewrite the snapshots that drifted')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drifted = snapshots.find_drift()
+            if not drifted:
+                self.stdout.write(self.style.SUCCESS('All author snapshots are consistent.'))
+                return
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} articles have a stale author snapshot: {", ".join(map(str, drifted[:20]))}{" ..." if len(drifted) > 20 else ""}'))
+            if options['repair']:
+                snapshots.refresh(drifted)
+                # the payloads of these articles changed: new ETags, no cached copies
+                versioning.bump_for(Article, drifted)
+                response_cache.evict(*(f'article:{pk}' for pk in drifted))
+                self.stdout.write(self.style.SUCCESS(f'Repaired {len(drifted)} author snapshots.'))
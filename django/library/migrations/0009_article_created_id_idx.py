@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0008_article_pagina_final_article_pagina_inicial_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(fields=["created_at", "id"], name="article_created_id_idx"),
+        ),
+    ]
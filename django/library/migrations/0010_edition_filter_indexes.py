@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0009_article_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="edition",
+            index=models.Index(fields=["event", "year"], name="edition_event_year_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="edition",
+            index=models.Index(fields=["year"], name="edition_year_idx"),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:28
+
+import django.db.models.deletion
+import library.models
+from django.db import migrations, models
+
+
+def create_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS library_article_fts "
+        "USING fts5(title, abstract, authors, tokenize='unicode61 remove_diacritics 2')"
+    )
+    # BM25 column weights: title, abstract, authors
+    schema_editor.execute(
+        "INSERT INTO library_article_fts(library_article_fts, rank) "
+        "VALUES ('rank', 'bm25(10.0, 1.0, 5.0)')"
+    )
+    schema_editor.execute(
+        "INSERT INTO library_article_fts(rowid, title, abstract, authors) "
+        "SELECT a.id, a.title, a.abstract, "
+        "COALESCE((SELECT group_concat(au.name, ' ') FROM library_article_authors aa "
+        "JOIN library_author au ON au.id = aa.author_id WHERE aa.article_id = a.id), '') "
+        "FROM library_article a"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS library_article_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0010_edition_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArticleSearchIndex",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_index",
+                        serialize=False,
+                        to="library.article",
+                    ),
+                ),
+                ("title", models.TextField()),
+                ("abstract", models.TextField()),
+                ("authors", models.TextField()),
+                (
+                    "document",
+                    library.models.SearchDocumentField(db_column="library_article_fts"),
+                ),
+                ("rank", models.FloatField(db_column="rank")),
+            ],
+            options={
+                "db_table": "library_article_fts",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:29
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_tokens(apps, schema_editor):
+    Author = apps.get_model("library", "Author")
+    AuthorNameToken = apps.get_model("library", "AuthorNameToken")
+    rows = []
+    for author_id, name in Author.objects.values_list("id", "name").iterator():
+        for token in {t.lower() for t in re.findall(r"\w+", name or "")}:
+            rows.append(AuthorNameToken(author_id=author_id, token=token))
+    AuthorNameToken.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0011_article_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuthorNameToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("token", models.CharField(max_length=255)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="name_tokens",
+                        to="library.author",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["token", "author"], name="author_token_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("author", "token"), name="unique_author_token"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_tokens, migrations.RunPython.noop),
+    ]
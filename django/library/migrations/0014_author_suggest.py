@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:58
+
+import library.models
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_authors(apps, schema_editor):
+    Author = apps.get_model('library', 'Author')
+    authors = list(Author.objects.annotate(n=Count('articles')).only('id', 'name'))
+    for author in authors:
+        author.name_key = library.models.fold_name(author.name)
+        author.article_count = author.n
+    Author.objects.bulk_update(authors, ['name_key', 'article_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0013_content_versions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='author',
+            name='article_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='author',
+            name='name_key',
+            field=library.models.FoldedNameField(blank=True, max_length=255, source='name'),
+        ),
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['name_key', 'article_count'], name='author_suggest_idx'),
+        ),
+        migrations.RunPython(backfill_authors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:10
+
+import library.models
+from django.db import migrations, models
+
+
+def backfill_slugs(apps, schema_editor):
+    Author = apps.get_model('library', 'Author')
+    authors = list(Author.objects.only('id', 'name').order_by('id'))
+    taken = set()
+    for author in authors:
+        author.slug = library.models.unique_slug(library.models.author_slug(author.name), taken)
+        taken.add(author.slug)
+    Author.objects.bulk_update(authors, ['slug'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0014_author_suggest'),
+    ]
+
+    operations = [
+        # Added without the unique constraint, filled, then made unique
+        migrations.AddField(
+            model_name='author',
+            name='slug',
+            field=models.SlugField(db_index=False, default='', editable=False, max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='author',
+            name='slug',
+            field=models.SlugField(editable=False, max_length=255, unique=True),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_profiles(apps, schema_editor):
+    Article = apps.get_model('library', 'Article')
+    Author = apps.get_model('library', 'Author')
+    AuthorProfile = apps.get_model('library', 'AuthorProfile')
+    entries, authors_by_article = {}, {}
+    rows = Article.authors.through.objects.values_list('author_id', 'article_id', 'article__edition__year')
+    for author_id, article_id, year in rows.iterator():
+        entries.setdefault(author_id, []).append((year, article_id))
+        authors_by_article.setdefault(article_id, set()).add(author_id)
+    profiles = []
+    for author_id in Author.objects.values_list('id', flat=True).iterator():
+        by_year = {}
+        articles = sorted(entries.get(author_id, []), key=lambda e: (e[0] is None, -(e[0] or 0), e[1]))
+        for year, article_id in articles:
+            by_year.setdefault(year, []).append(article_id)
+        coauthors = set().union(*(authors_by_article[article_id] for _, article_id in articles)) - {author_id}
+        years = [year for year in by_year if year is not None]
+        profiles.append(AuthorProfile(
+            author_id=author_id,
+            articles_by_year=[[year, ids] for year, ids in by_year.items()],
+            total_articles=len(articles),
+            coauthor_count=len(coauthors),
+            first_year=min(years, default=None),
+            last_year=max(years, default=None),
+        ))
+    AuthorProfile.objects.bulk_create(profiles, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0015_author_slug'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorProfile',
+            fields=[
+                ('author', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='profile', serialize=False, to='library.author')),
+                ('articles_by_year', models.JSONField(default=list)),
+                ('total_articles', models.PositiveIntegerField(default=0)),
+                ('coauthor_count', models.PositiveIntegerField(default=0)),
+                ('first_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('last_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_profiles, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:20
+
+from django.db import migrations, models
+
+
+def backfill_snapshots(apps, schema_editor):
+    Article = apps.get_model('library', 'Article')
+    snapshots = {}
+    rows = (
+        Article.authors.through.objects.order_by('article_id', 'id')
+        .values_list('article_id', 'author_id', 'author__name', 'author__email')
+    )
+    for article_id, author_id, name, email in rows.iterator():
+        snapshots.setdefault(article_id, []).append({'id': author_id, 'name': name, 'email': email or None})
+    articles = [Article(pk=pk, author_snapshot=snapshot) for pk, snapshot in snapshots.items()]
+    Article.objects.bulk_update(articles, ['author_snapshot'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0016_author_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='author_snapshot',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0017_article_author_snapshot'),
+    ]
+
+    operations = [
+        # Adopt the auto-created M2M table as an explicit through model; the
+        # table and its columns already exist, so only the state changes
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ArticleAuthor',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='library.article')),
+                        ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='library.author')),
+                    ],
+                    options={
+                        'db_table': 'library_article_authors',
+                        'unique_together': {('article', 'author')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='article',
+                    name='authors',
+                    field=models.ManyToManyField(blank=True, related_name='articles', through='library.ArticleAuthor', to='library.author'),
+                ),
+            ],
+        ),
+        # Existing links keep position 0 and read back in insertion (id) order
+        migrations.AddField(
+            model_name='articleauthor',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
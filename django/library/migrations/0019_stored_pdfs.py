@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:18
+
+import library.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0018_article_author_position'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredPdf',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField(default=0)),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='pdf_file',
+            field=models.FileField(blank=True, null=True, storage=library.storage.get_pdf_storage, upload_to='pdfs/'),
+        ),
+    ]
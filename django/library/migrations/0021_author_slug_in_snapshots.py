@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 09:12
+
+import library.models
+from django.db import migrations
+
+
+def move_reserved_slugs(apps, schema_editor):
+    Author = apps.get_model('library', 'Author')
+    reserved = list(Author.objects.filter(slug__in=library.models.RESERVED_AUTHOR_SLUGS))
+    for author in reserved:
+        taken = set(Author.objects.filter(slug__startswith=author.slug).values_list('slug', flat=True))
+        author.slug = library.models.unique_slug(author.slug, taken)
+        author.save(update_fields=['slug'])
+
+
+def add_slugs_to_snapshots(apps, schema_editor):
+    Article = apps.get_model('library', 'Article')
+    snapshots = {}
+    rows = (
+        Article.authors.through.objects.order_by('article_id', 'position', 'id')
+        .values_list('article_id', 'author_id', 'author__name', 'author__email', 'author__slug')
+    )
+    for article_id, author_id, name, email, slug in rows.iterator():
+        snapshots.setdefault(article_id, []).append({'id': author_id, 'name': name, 'email': email or None, 'slug': slug})
+    articles = [Article(pk=pk, author_snapshot=snapshot) for pk, snapshot in snapshots.items()]
+    Article.objects.bulk_update(articles, ['author_snapshot'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('library', '0020_import_jobs'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_reserved_slugs, migrations.RunPython.noop),
+        migrations.RunPython(add_slugs_to_snapshots, migrations.RunPython.noop),
+    ]
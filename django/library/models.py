@@ -1,4 +1,60 @@
+import re
+import unicodedata
+
 from django.db import models
+from django.utils.text import slugify
+
+from .storage import get_pdf_storage
+
+
+def fold_name(value):
+	"""Lower-case, accent-free form of a name: "João Müller" -> "joao muller" """
+	decomposed = unicodedata.normalize('NFKD', value or '')
+	stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+	return ' '.join(stripped.casefold().split())
+
+
+def author_slug(name):
+	"""Base URL slug for an author name: "João da Silva" -> "joao-da-silva" """
+	return slugify(fold_name(name)) or 'author'
+
+
+# Path segments routed before authors/<slug>/ (see library.urls)
+RESERVED_AUTHOR_SLUGS = frozenset({'suggest'})
+
+
+def unique_slug(base, taken):
+	"""`base`, or `base-2`, `base-3`... whichever is neither in `taken` nor reserved"""
+	slug, n = base, 1
+	while slug in taken or slug in RESERVED_AUTHOR_SLUGS:
+		n += 1
+		slug = f'{base}-{n}'
+	return slug
+
+
+class FoldedNameField(models.CharField):
+	"""Folded copy of another field (see fold_name), recomputed on every save.
+
+	Filled in pre_save, so bulk_create populates it too; only queryset.update()
+	of the source field bypasses it.
+	"""
+
+	def __init__(self, *args, source=None, **kwargs):
+		self.source = source
+		kwargs.setdefault('editable', False)
+		super().__init__(*args, **kwargs)
+
+	def deconstruct(self):
+		name, path, args, kwargs = super().deconstruct()
+		kwargs['source'] = self.source
+		kwargs.pop('editable', None)
+		return name, path, args, kwargs
+
+	def pre_save(self, model_instance, add):
+		value = fold_name(getattr(model_instance, self.source))
+		setattr(model_instance, self.attname, value)
+		return value
+
 
 class Event(models.Model):
 	name = models.CharField(max_length=255)
@@ -15,32 +71,229 @@ class Edition(models.Model):
 	start_date = models.DateField(null=True, blank=True)
 	end_date = models.DateField(null=True, blank=True)
 
+	class Meta:
+		indexes = [
+			# Server-side event/year filters on the edition and article lists
+			models.Index(fields=['event', 'year'], name='edition_event_year_idx'),
+			models.Index(fields=['year'], name='edition_year_idx'),
+		]
+
 	def __str__(self):
 		return f"{self.event.name} {self.year}"
 
 class Author(models.Model):
 	name = models.CharField(max_length=255)
 	email = models.EmailField(blank=True)
+	# Name autocomplete: prefix range scans on the folded name, ranked by the
+	# denormalized number of articles (kept current by library.signals)
+	name_key = FoldedNameField(max_length=255, source='name', blank=True)
+	article_count = models.PositiveIntegerField(default=0, editable=False)
+	# Canonical URL slug (author_slug of the name, "-2", "-3"... on clashes);
+	# assigned in save(), so bulk_create callers must set it themselves
+	slug = models.SlugField(max_length=255, unique=True, editable=False)
+
+	class Meta:
+		indexes = [
+			models.Index(fields=['name_key', 'article_count'], name='author_suggest_idx'),
+		]
 
 	def __str__(self):
 		return self.name
 
+	def save(self, *args, **kwargs):
+		base = author_slug(self.name)
+		# keep the slug (and the URLs using it) while the name still maps to it
+		if not self.slug or not re.fullmatch(rf'{re.escape(base)}(-\d+)?', self.slug):
+			clashes = Author.objects.filter(slug__startswith=base).exclude(pk=self.pk)
+			self.slug = unique_slug(base, set(clashes.values_list('slug', flat=True)))
+			if kwargs.get('update_fields') is not None:
+				kwargs['update_fields'] = {*kwargs['update_fields'], 'slug'}
+		super().save(*args, **kwargs)
+
+class AuthorNameToken(models.Model):
+	"""One row per lower-cased word of an author's name.
+
+	Lets the whole-word author filter run as an indexed lookup instead of a
+	regex over every author; maintained by library.search.
+	"""
+	author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='name_tokens')
+	token = models.CharField(max_length=255)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=['author', 'token'], name='unique_author_token'),
+		]
+		indexes = [
+			models.Index(fields=['token', 'author'], name='author_token_idx'),
+		]
+
+	def __str__(self):
+		return self.token
+
+class AuthorProfile(models.Model):
+	"""Precomputed author page: article ids grouped by year and summary counts.
+
+	`articles_by_year` is a list of [year, [article ids]] pairs, newest year
+	first and articles without an edition (year null) last. Maintained by
+	library.profiles from the Article, Edition and authorship signals.
+	"""
+	author = models.OneToOneField(Author, primary_key=True, on_delete=models.CASCADE, related_name='profile')
+	articles_by_year = models.JSONField(default=list)
+	total_articles = models.PositiveIntegerField(default=0)
+	coauthor_count = models.PositiveIntegerField(default=0)
+	first_year = models.PositiveIntegerField(null=True, blank=True)
+	last_year = models.PositiveIntegerField(null=True, blank=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	def __str__(self):
+		return f"{self.author_id}: {self.total_articles} articles"
+
 class Article(models.Model):
 	title = models.CharField(max_length=500)
 	abstract = models.TextField(blank=True, default='')
 	pdf_url = models.URLField(blank=True, default='')
-	pdf_file = models.FileField(upload_to='pdfs/', blank=True, null=True)
+	# Content-addressed and deduplicated, see library.storage / library.blobs
+	pdf_file = models.FileField(upload_to='pdfs/', storage=get_pdf_storage, blank=True, null=True)
 	edition = models.ForeignKey(Edition, on_delete=models.CASCADE, related_name='articles', null=True, blank=True)
-	authors = models.ManyToManyField(Author, related_name='articles', blank=True)
+	authors = models.ManyToManyField(Author, through='ArticleAuthor', related_name='articles', blank=True)
 	bibtex = models.TextField(blank=True, default='')
 	pagina_inicial = models.IntegerField(null=True, blank=True)  # Start page
 	pagina_final = models.IntegerField(null=True, blank=True)  # End page
 	created_at = models.DateTimeField(auto_now_add=True)
+	# Ordered author documents ({"id", "name", "email", "slug"}) so listings skip the
+	# M2M join; kept by library.snapshots, which recomputes it after every save()
+	author_snapshot = models.JSONField(default=list, blank=True, editable=False)
+
+	class Meta:
+		indexes = [
+			# Keyset pagination on the article list seeks on (created_at, id)
+			models.Index(fields=['created_at', 'id'], name='article_created_id_idx'),
+		]
 
 	def __str__(self):
 		return self.title
 
 
+class ArticleAuthor(models.Model):
+	"""Authorship link; `position` is the author's place in the byline.
+
+	Uses the table of the former auto-created M2M. Links added through
+	`article.authors.add()` get position 0 and fall back to insertion order;
+	library.authorship.set_authors numbers them explicitly.
+	"""
+	article = models.ForeignKey(Article, on_delete=models.CASCADE)
+	author = models.ForeignKey(Author, on_delete=models.CASCADE)
+	position = models.PositiveIntegerField(default=0)
+
+	class Meta:
+		db_table = 'library_article_authors'
+		unique_together = [('article', 'author')]
+
+	def __str__(self):
+		return f"{self.article_id}:{self.author_id}@{self.position}"
+
+
+class StoredPdf(models.Model):
+	"""A content-addressed PDF blob and the number of articles using it.
+
+	Maintained by library.blobs; the file is deleted when ref_count reaches 0.
+	"""
+	digest = models.CharField(max_length=64, unique=True)  # SHA-256, hex
+	name = models.CharField(max_length=255)  # storage name, pdfs/ab/cd/<digest>.pdf
+	size = models.PositiveBigIntegerField(default=0)
+	ref_count = models.PositiveIntegerField(default=0)
+
+	def __str__(self):
+		return f"{self.name} x{self.ref_count}"
+
+
+class ImportJob(models.Model):
+	"""A bulk import queued by the bulk import endpoint and run by the run_import_jobs command.
+
+	The uploads are kept under imports/ until the job has run. In the parsing
+	phase the worker counts the BibTeX entries (`total`); `processed` then
+	counts those imported so far, and `result` holds the import summary once
+	the job is done. A job whose worker has not reported progress
+	(`heartbeat_at`) for longer than its --stale-after is queued again and
+	resumes after its `processed` entries.
+	"""
+	QUEUED = 'queued'
+	PARSING = 'parsing'
+	IMPORTING = 'importing'
+	DONE = 'done'
+	FAILED = 'failed'
+	PHASES = [
+		(QUEUED, 'Queued'),
+		(PARSING, 'Parsing'),
+		(IMPORTING, 'Importing'),
+		(DONE, 'Done'),
+		(FAILED, 'Failed'),
+	]
+
+	edition = models.ForeignKey(Edition, on_delete=models.CASCADE, related_name='import_jobs')
+	phase = models.CharField(max_length=10, choices=PHASES, default=QUEUED)
+	bibtex_file = models.FileField(upload_to='imports/', blank=True)
+	pdf_zip = models.FileField(upload_to='imports/', blank=True)
+	processed = models.PositiveIntegerField(default=0)
+	total = models.PositiveIntegerField(null=True, blank=True)
+	result = models.JSONField(null=True, blank=True)
+	error = models.TextField(blank=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+	started_at = models.DateTimeField(null=True, blank=True)
+	# refreshed by the worker after every batch; see run_import_jobs --stale-after
+	heartbeat_at = models.DateTimeField(null=True, blank=True)
+	finished_at = models.DateTimeField(null=True, blank=True)
+
+	def __str__(self):
+		return f"import #{self.pk} ({self.phase})"
+
+
+class SearchDocumentField(models.TextField):
+	"""The hidden FTS5 column named after the table, used as the left side of MATCH"""
+
+
+@SearchDocumentField.register_lookup
+class Match(models.Lookup):
+	lookup_name = 'match'
+
+	def as_sql(self, compiler, connection):
+		lhs, lhs_params = self.process_lhs(compiler, connection)
+		rhs, rhs_params = self.process_rhs(compiler, connection)
+		return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+class ArticleSearchIndex(models.Model):
+	"""Read-only mapping of the SQLite FTS5 article index.
+
+	The virtual table is created by a migration and kept up to date by
+	library.search; Django never creates or writes it through the ORM.
+	"""
+	article = models.OneToOneField(Article, primary_key=True, db_column='rowid', on_delete=models.DO_NOTHING, related_name='search_index')
+	title = models.TextField()
+	abstract = models.TextField()
+	authors = models.TextField()
+	document = SearchDocumentField(db_column='library_article_fts')
+	rank = models.FloatField(db_column='rank')
+
+	class Meta:
+		managed = False
+		db_table = 'library_article_fts'
+
+
+class ContentVersion(models.Model):
+	"""Monotonic version stamp for a collection ("articles") or an object ("article:12").
+
+	Bumped by library.signals whenever the underlying rows change and used by
+	library.versioning to answer conditional GETs (ETag).
+	"""
+	key = models.CharField(max_length=100, unique=True)
+	version = models.PositiveBigIntegerField(default=0)
+	updated_at = models.DateTimeField()
+
+	def __str__(self):
+		return f"{self.key}@{self.version}"
+
+
 class Subscription(models.Model):
 	"""A lightweight subscription model so users can subscribe to authors or events by email.
 
@@ -0,0 +1,217 @@
+"""JSON payloads for the API: article, edition, event and author documents.
+
+Views build response bodies through a `Documents` instance, one per response.
+It memoizes the sub-documents shared between rows, so an edition (with its
+embedded event) or an author is turned into a dict once per response no
+matter how many articles reference it. Streamed exports `clear()` the memo
+after each chunk so it does not grow with the result.
+
+With `compact=True` articles carry `edition_id` and `author_ids` instead of
+nested objects, and every referenced edition, event and author is emitted
+once in a top-level `included` map (see `Documents.included`).
+
+Article authors come from the denormalized `Article.author_snapshot` (see
+library.snapshots), so listings need neither the M2M join nor a prefetch;
+an explicit `Prefetch("authors", to_attr=AUTHORS_ATTR)` still takes precedence.
+
+`dumps` encodes straight to bytes with orjson when it is installed and falls
+back to the stdlib encoder otherwise; `json_response` wraps it in an
+HttpResponse and is the drop-in replacement for JsonResponse on read paths.
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+from .models import Article, Author, Edition, Event
+from . import downloads
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+CONTENT_TYPE = "application/json"
+
+_django_default = DjangoJSONEncoder().default
+
+if orjson is not None:
+    # Non-str keys: the author views group by (int) year. Dates and datetimes
+    # go through DjangoJSONEncoder so the output matches JsonResponse.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(data):
+        return orjson.dumps(data, default=_django_default, option=_ORJSON_OPTIONS)
+else:
+    _encoder = DjangoJSONEncoder(separators=(",", ":"))
+
+    def dumps(data):
+        return _encoder.encode(data).encode()
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), status=status, content_type=CONTENT_TYPE)
+
+
+def article_pdf_url(a: Article):
+    pdf_url = a.pdf_url or ""
+    if a.pdf_file:
+        # the download view, not MEDIA_URL: ?v= makes the link immutable
+        pdf_url = f"http://localhost:8000{downloads.pdf_url(a.id, a.pdf_file.name)}"
+    return pdf_url or None
+
+
+# `Prefetch("authors", to_attr=AUTHORS_ATTR)` stores a plain list on each
+# article; when present it is used instead of the stored snapshot
+AUTHORS_ATTR = "author_list"
+
+
+def event_document(e: Event):
+    return {
+        "id": e.id,
+        "name": e.name,
+        "sigla": e.sigla or "",
+        "entidade_promotora": e.entidade_promotora or "",
+    }
+
+
+# Serialized article fields, in output order, with the value builder and the
+# model columns each one needs when the queryset is restricted by ?fields=
+ARTICLE_FIELDS = {
+    "id": (lambda docs, a: a.id, ("id",)),
+    "title": (lambda docs, a: a.title, ("title",)),
+    "abstract": (lambda docs, a: a.abstract or None, ("abstract",)),
+    "pdf_url": (lambda docs, a: article_pdf_url(a), ("pdf_url", "pdf_file")),
+    "edition": (lambda docs, a: docs.edition(a.edition) if a.edition_id else None, ("edition",)),
+    "authors": (lambda docs, a: docs.article_authors(a), ("author_snapshot",)),
+    "bibtex": (lambda docs, a: a.bibtex or None, ("bibtex",)),
+    "pagina_inicial": (lambda docs, a: a.pagina_inicial, ("pagina_inicial",)),
+    "pagina_final": (lambda docs, a: a.pagina_final, ("pagina_final",)),
+    "created_at": (lambda docs, a: a.created_at.isoformat() if a.created_at else None, ("created_at",)),
+}
+
+# Compact replacements for the nested fields: output key and builder
+COMPACT_FIELDS = {
+    "edition": ("edition_id", lambda docs, a: docs.include_edition(a.edition) if a.edition_id else None),
+    "authors": ("author_ids", lambda docs, a: [docs.include_author(x) for x in docs.article_authors(a)]),
+}
+
+
+class Documents:
+    """Builds the documents of one response, reusing shared sub-documents.
+
+    Memoized dicts are shared between rows, so callers must not mutate them.
+    """
+
+    def __init__(self, fields=None, compact=False):
+        self._builders = [
+            COMPACT_FIELDS[name] if compact and name in COMPACT_FIELDS else (name, build)
+            for name, (build, _) in ARTICLE_FIELDS.items()
+            if fields is None or name in fields
+        ]
+        if fields is None:
+            self.article = self._compact_article if compact else self._full_article
+        self._events = {}
+        self._editions = {}
+        self._authors = {}
+        self._included = {"editions": {}, "events": {}, "authors": {}}
+
+    def event(self, e: Event):
+        doc = self._events.get(e.id)
+        if doc is None:
+            doc = self._events[e.id] = event_document(e)
+        return doc
+
+    def edition(self, ed: Edition):
+        doc = self._editions.get(ed.id)
+        if doc is None:
+            doc = self._editions[ed.id] = {
+                "id": ed.id,
+                "event": self.event(ed.event),
+                "year": ed.year,
+                "location": ed.location or None,
+                "start_date": ed.start_date.isoformat() if ed.start_date else None,
+                "end_date": ed.end_date.isoformat() if ed.end_date else None,
+            }
+        return doc
+
+    def author(self, a: Author):
+        doc = self._authors.get(a.id)
+        if doc is None:
+            doc = self._authors[a.id] = {"id": a.id, "name": a.name, "email": a.email or None, "slug": a.slug}
+        return doc
+
+    def clear(self):
+        """Forget the memoized sub-documents; streams call this after each chunk"""
+        self._events.clear()
+        self._editions.clear()
+        self._authors.clear()
+
+    def include_edition(self, ed: Edition):
+        editions = self._included["editions"]
+        if ed.id not in editions:
+            self.include_event(ed.event)
+            doc = dict(self.edition(ed), event_id=ed.event_id)
+            del doc["event"]
+            editions[ed.id] = doc
+        return ed.id
+
+    def include_event(self, e: Event):
+        if e.id not in self._included["events"]:
+            self._included["events"][e.id] = self.event(e)
+        return e.id
+
+    def article_authors(self, a: Article):
+        """Author documents of an article, in order"""
+        authors = getattr(a, AUTHORS_ATTR, None)
+        if authors is None:
+            # share one dict per author across the response, like author()
+            memo = self._authors
+            return [memo.setdefault(doc["id"], doc) for doc in a.author_snapshot]
+        return [self.author(x) for x in authors]
+
+    def include_author(self, doc):
+        """Register an author document in `included`; returns its id"""
+        self._included["authors"].setdefault(doc["id"], doc)
+        return doc["id"]
+
+    def included(self):
+        """Editions, events and authors referenced by compact documents, by id"""
+        return self._included
+
+    def article(self, a: Article):
+        return {name: build(self, a) for name, build in self._builders}
+
+    def _full_article(self, a: Article):
+        # Same document as article() with every field, written out: listings
+        # without ?fields= are the hot path and skip the per-field calls.
+        # _compact_article is the same for compact=True.
+        return {
+            "id": a.id,
+            "title": a.title,
+            "abstract": a.abstract or None,
+            "pdf_url": article_pdf_url(a),
+            "edition": self.edition(a.edition) if a.edition_id else None,
+            "authors": self.article_authors(a),
+            "bibtex": a.bibtex or None,
+            "pagina_inicial": a.pagina_inicial,
+            "pagina_final": a.pagina_final,
+            "created_at": a.created_at.isoformat() if a.created_at else None,
+        }
+
+    def _compact_article(self, a: Article):
+        include_author = self.include_author
+        return {
+            "id": a.id,
+            "title": a.title,
+            "abstract": a.abstract or None,
+            "pdf_url": article_pdf_url(a),
+            "edition_id": self.include_edition(a.edition) if a.edition_id else None,
+            "author_ids": [include_author(x) for x in self.article_authors(a)],
+            "bibtex": a.bibtex or None,
+            "pagina_inicial": a.pagina_inicial,
+            "pagina_final": a.pagina_final,
+            "created_at": a.created_at.isoformat() if a.created_at else None,
+        }
+
+    def articles(self, articles):
+        return [self.article(a) for a in articles]
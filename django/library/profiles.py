@@ -0,0 +1,103 @@
+"""Materialized author profiles behind the author pages.
+
+One AuthorProfile row per author holds the ids of their articles grouped by
+edition year (newest first), the total, the number of distinct co-authors
+and the first/last publication year. library.signals refreshes the profiles
+of every author an article, edition or authorship change touches, so the
+author page reads one row instead of joining and regrouping the articles on
+each request. `rebuild_profiles` (the rebuild_author_profiles command)
+recomputes all of them.
+"""
+from django.db.models import Q
+
+from .models import Article, Author, AuthorProfile
+from .chunking import CHUNK_SIZE, chunks
+
+_PROFILE_FIELDS = ["articles_by_year", "total_articles", "coauthor_count", "first_year", "last_year", "updated_at"]
+
+
+def _year_order(entry):
+    year, article_id = entry
+    return (year is None, -(year or 0), article_id)
+
+
+def _build(author_id, entries, coauthors):
+    by_year = {}
+    for year, article_id in sorted(entries, key=_year_order):
+        by_year.setdefault(year, []).append(article_id)
+    years = [year for year in by_year if year is not None]
+    return AuthorProfile(
+        author_id=author_id,
+        articles_by_year=[[year, ids] for year, ids in by_year.items()],
+        total_articles=len(entries),
+        coauthor_count=len(coauthors - {author_id}),
+        first_year=min(years, default=None),
+        last_year=max(years, default=None),
+    )
+
+
+def _compute(authors):
+    """Profiles of every author in the queryset, including those without articles"""
+    through = Article.authors.through.objects
+    entries, authors_by_article = {}, {}
+    # LEFT JOIN: an author without articles still yields one (id, None, None) row
+    for author_id, article_id, year in authors.values_list("id", "articles__id", "articles__edition__year"):
+        rows = entries.setdefault(author_id, [])
+        if article_id is not None:
+            rows.append((year, article_id))
+    coauthorships = through.filter(author__in=authors).values("article_id")
+    for article_id, author_id in through.filter(article_id__in=coauthorships).values_list("article_id", "author_id"):
+        authors_by_article.setdefault(article_id, set()).add(author_id)
+    return [
+        _build(author_id, rows, set().union(*(authors_by_article[article_id] for _, article_id in rows)))
+        for author_id, rows in entries.items()
+    ]
+
+
+def _save(profiles):
+    AuthorProfile.objects.bulk_create(
+        profiles,
+        update_conflicts=True,
+        unique_fields=["author"],
+        update_fields=_PROFILE_FIELDS,
+        batch_size=CHUNK_SIZE,
+    )
+
+
+def refresh_profiles(author_ids):
+    """Recompute the profiles of the given authors (ids of deleted authors are skipped)"""
+    for chunk in chunks(set(author_ids)):
+        _save(_compute(Author.objects.filter(pk__in=chunk)))
+
+
+def refresh_article_authors(article_ids, author_ids=()):
+    """Recompute the profiles of everyone currently on the given articles, plus `author_ids`.
+
+    `article_ids` may be a list or a values() queryset.
+    """
+    current = Article.authors.through.objects.filter(article_id__in=article_ids).values_list("author_id", flat=True)
+    refresh_profiles({*current, *author_ids})
+
+
+def coauthor_ids(author_id):
+    """Ids of everyone sharing an article with the author (the author excluded)"""
+    through = Article.authors.through.objects
+    articles = through.filter(author_id=author_id).values("article_id")
+    return set(through.filter(Q(article_id__in=articles), ~Q(author_id=author_id)).values_list("author_id", flat=True))
+
+
+def profile_for(author):
+    """The author's profile, computed on the spot if it was never materialized"""
+    try:
+        return author.profile
+    except AuthorProfile.DoesNotExist:
+        refresh_profiles([author.pk])
+        return AuthorProfile.objects.get(pk=author.pk)
+
+
+def rebuild_profiles():
+    """Recompute every author's profile. Returns the number of profiles written."""
+    rows = _compute(Author.objects.all())
+    AuthorProfile.objects.all().delete()
+    AuthorProfile.objects.bulk_create(rows, batch_size=CHUNK_SIZE)
+    return len(rows)
@@ -0,0 +1,120 @@
+"""Response cache for read endpoints with tag-based, signal-driven eviction.
+
+Cached GET responses live in the "responses" cache alias (local memory by
+default, see CACHES in settings). Each entry is keyed on the view name, the
+URL kwargs and the normalized query string, and is registered under the tags
+of every object its payload contains ("article:12", "author:3", ...) plus the
+collections it lists ("events"). library.signals evicts tags when rows
+change, so editing one article only drops the entries that contain it.
+
+Hit, miss, store and eviction counters are kept in the same cache so every
+worker sharing the backend reports the same totals (see `stats()`).
+"""
+import hashlib
+from functools import wraps
+
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.utils.http import urlencode
+
+CACHE_ALIAS = "responses"
+COUNTERS = ("hits", "misses", "stores", "evictions")
+
+
+def _cache():
+    return caches[CACHE_ALIAS]
+
+
+def _count(name, delta=1):
+    cache = _cache()
+    key = f"stats:{name}"
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, timeout=None)
+
+
+def stats():
+    values = _cache().get_many([f"stats:{name}" for name in COUNTERS])
+    result = {name: values.get(f"stats:{name}", 0) for name in COUNTERS}
+    lookups = result["hits"] + result["misses"]
+    result["hit_rate"] = round(result["hits"] / lookups, 3) if lookups else None
+    return result
+
+
+def reset_stats():
+    _cache().delete_many([f"stats:{name}" for name in COUNTERS])
+
+
+def clear():
+    _cache().clear()
+
+
+def make_key(view_name, kwargs, query):
+    """Cache key for a view call; query parameters are order-insensitive"""
+    normalized = urlencode(sorted((k, sorted(v)) for k, v in query.lists()), doseq=True)
+    args = ",".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
+    digest = hashlib.md5(f"{args}?{normalized}".encode()).hexdigest()
+    return f"resp:{view_name}:{digest}"
+
+
+def _store(key, response, tags):
+    cache = _cache()
+    cache.set(key, (response.content, response["Content-Type"]))
+    tag_keys = [f"tag:{tag}" for tag in tags]
+    current = cache.get_many(tag_keys)
+    cache.set_many({tag_key: current.get(tag_key, set()) | {key} for tag_key in tag_keys}, timeout=None)
+    _count("stores")
+
+
+def _evict_now(tags):
+    cache = _cache()
+    tag_keys = [f"tag:{tag}" for tag in tags]
+    entries = set().union(*cache.get_many(tag_keys).values())
+    if entries:
+        cache.delete_many(list(entries))
+        _count("evictions", len(entries))
+    cache.delete_many(tag_keys)
+
+
+def evict(*tags):
+    """Drop every cached response registered under any of `tags`.
+
+    Runs immediately and again after the surrounding transaction commits, so a
+    request racing the write cannot leave a stale entry behind.
+    """
+    tags = [tag for tag in tags if tag]
+    if not tags:
+        return
+    _evict_now(tags)
+    transaction.on_commit(lambda: _evict_now(tags))
+
+
+def cached_response(view_name):
+    """Class decorator caching a view's `get`.
+
+    The view marks a response as cacheable by setting `response.cache_tags`
+    to the set of tags describing its payload; responses without tags (errors,
+    streams) are passed through untouched.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            key = make_key(view_name, kwargs, request.GET)
+            cached = _cache().get(key)
+            if cached is not None:
+                _count("hits")
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+            _count("misses")
+            response = view_func(request, *args, **kwargs)
+            tags = getattr(response, "cache_tags", None)
+            if tags and response.status_code == 200 and not response.streaming:
+                _store(key, response, tags)
+            return response
+        return wrapped
+
+    return method_decorator(decorator, name="get")
@@ -0,0 +1,263 @@
+"""Full-text search over articles backed by an SQLite FTS5 index.
+
+The index lives in the `library_article_fts` virtual table (created by
+migration 0011) with one row per article: title, abstract and the
+space-separated author names, keyed by the article id (FTS rowid). Ranking
+uses BM25 with the column weights configured in the migration, so title hits
+count more than author hits, which count more than abstract hits.
+
+Only the bundled SQLite backend is supported; on any other database
+`fts_available()` is False and `search_articles` falls back to icontains.
+
+The whole-word author filter (?author=) is served by the AuthorNameToken
+table instead: one indexed row per lower-cased word of each author name.
+
+`suggest_authors` serves name autocomplete from the indexed, case- and
+accent-folded Author.name_key column, ranked by the denormalized
+Author.article_count that `refresh_author_counts` keeps current.
+
+`facet_counts` computes per-event, per-year and top-N author counts for any
+filtered article queryset with grouped aggregate queries.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Count, F, FloatField, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Article, Author, ArticleSearchIndex, AuthorNameToken, Edition, fold_name
+from .chunking import CHUNK_SIZE, chunks
+
+FTS_TABLE = ArticleSearchIndex._meta.db_table
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_available():
+    return connection.vendor == "sqlite"
+
+
+def build_match_query(text):
+    """Turn free user input into a safe FTS5 query.
+
+    Every word becomes a quoted prefix term ("learn"*), so FTS syntax
+    characters in the input can never produce a parse error.
+    Returns None when the input has no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _document_select(where_sql=""):
+    article_table = Article._meta.db_table
+    through = Article.authors.through._meta
+    author_table = Author._meta.db_table
+    return (
+        f"SELECT a.id, a.title, a.abstract, "
+        f"COALESCE((SELECT group_concat(au.name, ' ') "
+        f"FROM {through.db_table} aa JOIN {author_table} au ON au.id = aa.author_id "
+        f"WHERE aa.article_id = a.id), '') "
+        f"FROM {article_table} a {where_sql}"
+    )
+
+
+def index_articles(article_ids):
+    """(Re)index the given articles from their current database rows"""
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        for chunk in chunks(set(article_ids)):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", chunk)
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}(rowid, title, abstract, authors) "
+                + _document_select(f"WHERE a.id IN ({placeholders})"),
+                chunk,
+            )
+
+
+def remove_articles(article_ids):
+    if not fts_available():
+        return
+    with connection.cursor() as cursor:
+        for chunk in chunks(set(article_ids)):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})", chunk)
+
+
+def rebuild_index():
+    """Drop every indexed document and re-index all articles. Returns the count."""
+    if not fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}(rowid, title, abstract, authors) " + _document_select())
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+        return cursor.fetchone()[0]
+
+
+def search_articles(qs, text):
+    """Restrict an article queryset to full-text matches for `text`.
+
+    The result is annotated with `search_rank` (BM25, lower is better) so
+    callers can order by relevance. Returns an empty queryset for input
+    without searchable words.
+    """
+    match = build_match_query(text)
+    unranked = Value(0.0, output_field=FloatField())
+    if match is None:
+        return qs.annotate(search_rank=unranked).none()
+    if not fts_available():
+        condition = Q()
+        for word in _TOKEN_RE.findall(text):
+            condition &= Q(title__icontains=word) | Q(abstract__icontains=word) | Q(authors__name__icontains=word)
+        return qs.filter(condition).annotate(search_rank=unranked)
+    return qs.filter(search_index__document__match=match).annotate(search_rank=F("search_index__rank"))
+
+
+# --- Author name tokens ---
+
+def name_tokens(name):
+    return {token.lower() for token in _TOKEN_RE.findall(name or "")}
+
+
+def index_author_names(authors):
+    """Replace the stored name tokens of the given Author instances"""
+    authors = [a for a in authors if a.pk]
+    if not authors:
+        return
+    AuthorNameToken.objects.filter(author__in=authors).delete()
+    AuthorNameToken.objects.bulk_create(
+        [AuthorNameToken(author_id=a.pk, token=t) for a in authors for t in name_tokens(a.name)],
+        batch_size=CHUNK_SIZE,
+    )
+
+
+def rebuild_author_tokens():
+    """Re-tokenize every author name. Returns the number of tokens written."""
+    AuthorNameToken.objects.all().delete()
+    rows = [
+        AuthorNameToken(author_id=pk, token=t)
+        for pk, name in Author.objects.values_list("id", "name").iterator()
+        for t in name_tokens(name)
+    ]
+    AuthorNameToken.objects.bulk_create(rows, batch_size=CHUNK_SIZE)
+    return len(rows)
+
+
+def authors_matching_words(term):
+    r"""Authors whose name contains `term` as whole word(s), case-insensitively.
+
+    Same semantics as the old `name__iregex=r'\b<term>\b'` filter. A single
+    word is answered straight from the token index; longer terms use the index
+    to find candidates holding every word and confirm the exact phrase on that
+    small set. Returns None when the term has no word characters.
+    """
+    tokens = [t.lower() for t in _TOKEN_RE.findall(term)]
+    if not tokens:
+        return None
+    if _TOKEN_RE.fullmatch(term):
+        return AuthorNameToken.objects.filter(token=tokens[0]).values("author_id")
+    candidates = Author.objects.all()
+    for token in set(tokens):
+        candidates = candidates.filter(name_tokens__token=token)
+    pattern = re.compile(r"\b" + re.escape(term) + r"\b", re.IGNORECASE)
+    return [pk for pk, name in candidates.values_list("id", "name") if pattern.search(name)]
+
+
+# --- Author autocomplete ---
+
+SUGGEST_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+
+# Sorts after every character a folded name can contain
+_PREFIX_END = "\U0010ffff"
+
+
+def suggest_authors(prefix, limit=SUGGEST_LIMIT):
+    """Authors whose folded name starts with `prefix`, most published first.
+
+    The prefix is matched as a range on name_key (>= prefix, < prefix + max
+    char) rather than LIKE, so ranking reads only the (name_key,
+    article_count) index; the full rows are then fetched for the top `limit`.
+    """
+    key = fold_name(prefix)
+    if not key:
+        return []
+    top = list(
+        Author.objects.filter(name_key__gte=key, name_key__lt=key + _PREFIX_END)
+        .order_by("-article_count", "name_key", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    found = Author.objects.in_bulk(top)
+    return [found[pk] for pk in top]
+
+
+def _article_count():
+    """Correlated subquery counting the outer author's articles"""
+    count = (
+        Article.authors.through.objects.filter(author_id=OuterRef("pk"))
+        .order_by().values("author_id").annotate(n=Count("article_id")).values("n")
+    )
+    return Coalesce(Subquery(count, output_field=IntegerField()), 0)
+
+
+def refresh_author_counts(author_ids):
+    """Recount Author.article_count for the given authors from the M2M table"""
+    for chunk in chunks(set(author_ids)):
+        Author.objects.filter(pk__in=chunk).update(article_count=_article_count())
+
+
+def rebuild_author_counts():
+    """Recount every author's articles. Returns the number of authors updated."""
+    return Author.objects.update(article_count=_article_count())
+
+
+# --- Facets ---
+
+FACETS = ("event", "year", "author")
+FACET_LIMIT = 10
+FACET_MAX_LIMIT = 100
+
+
+def facet_counts(qs, facets=FACETS, limit=FACET_LIMIT):
+    """Result counts per event, edition year and author for an article queryset.
+
+    Counting runs as GROUP BY queries over the articles whose ids the filtered
+    queryset selects (a subquery, so filter joins can never double count).
+    Event and year counts are both rolled up from one per-edition count, and
+    authors are ranked by id before their names are read for the top `limit`.
+    """
+    ids = qs.order_by().values("pk")
+    result = {}
+    if "event" in facets or "year" in facets:
+        per_edition = dict(
+            Article.objects.filter(pk__in=ids, edition__isnull=False)
+            .values_list("edition_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        events, years = {}, {}
+        editions = Edition.objects.filter(pk__in=per_edition).values_list("id", "year", "event_id", "event__name")
+        for edition_id, year, event_id, event_name in editions:
+            count = per_edition[edition_id]
+            event = events.setdefault(event_id, {"id": event_id, "name": event_name, "count": 0})
+            event["count"] += count
+            years[year] = years.get(year, 0) + count
+        if "event" in facets:
+            result["event"] = sorted(events.values(), key=lambda e: (-e["count"], e["name"]))
+        if "year" in facets:
+            result["year"] = [{"year": year, "count": years[year]} for year in sorted(years, reverse=True)]
+    if "author" in facets:
+        top = list(
+            Article.authors.through.objects.filter(article_id__in=ids)
+            .values_list("author_id")
+            .annotate(count=Count("article_id"))
+            .order_by("-count", "author_id")[:limit]
+        )
+        names = dict(Author.objects.filter(pk__in=[pk for pk, _ in top]).values_list("id", "name"))
+        result["author"] = [{"id": pk, "name": names[pk], "count": count} for pk, count in top]
+    return result
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from library import authorship
 from library.models import Article, Author, Edition, Event, Subscription
 
 class EventSerializer(serializers.ModelSerializer):
@@ -17,7 +18,7 @@ class EditionSerializer(serializers.ModelSerializer):
 class AuthorSerializer(serializers.ModelSerializer):
     class Meta:
         model = Author
-        fields = ['id', 'name', 'email']
+        fields = ['id', 'name', 'email', 'slug']
 
 class ArticleSerializer(serializers.ModelSerializer):
     authors = AuthorSerializer(many=True, read_only=True)
@@ -30,9 +31,7 @@ class ArticleSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         authors_data = validated_data.pop('authors', [])
         article = Article.objects.create(**validated_data)
-        for author_data in authors_data:
-            author, _ = Author.objects.get_or_create(**author_data)
-            article.authors.add(author)
+        authorship.set_authors(article, authorship.resolve_authors([a['name'] for a in authors_data]))
         return article
 
     def update(self, instance, validated_data):
@@ -41,10 +40,8 @@ class ArticleSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
         if authors_data is not None:
-            instance.authors.clear()
-            for author_data in authors_data:
-                author, _ = Author.objects.get_or_create(**author_data)
-                instance.authors.add(author)
+            # diff against the current byline: one lookup, one insert, one delete
+            authorship.set_authors(instance, authorship.resolve_authors([a['name'] for a in authors_data]))
         return instance
 
 class SubscriptionSerializer(serializers.ModelSerializer):
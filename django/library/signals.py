@@ -1,10 +1,12 @@
-from django.db.models.signals import post_save, m2m_changed
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save, m2m_changed
 from django.dispatch import receiver
 from django.core.mail import send_mail
 from django.conf import settings
 import logging
 
-from .models import Article, Subscription
+from .models import Article, Author, Edition, Event, Subscription
+from . import blobs, profiles, response_cache, search, snapshots, versioning
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,36 +19,27 @@ def send_notification_email(article_instance):
     event = article_instance.edition.event if article_instance.edition else None
     # collect unique emails
     emails = set()
+    authors = list(article_instance.authors.all())
     
     print(f"[DEBUG] Evento do artigo: {event}")
-    print(f"[DEBUG] Autores do artigo: {[a.name for a in article_instance.authors.all()]}")
+    print(f"[DEBUG] Autores do artigo: {[a.name for a in authors]}")
     
-    # subscriptions to the event
+    # subscriptions to the event, to any of the authors, or general ones
+    # (no author/event), fetched in a single query
+    matching = Q(author__isnull=True, event__isnull=True)
     if event:
-        event_subscriptions = Subscription.objects.filter(event=event)
-        print(f"[DEBUG] Subscriptions para o evento {event.name}: {event_subscriptions.count()}")
-        for s in event_subscriptions:
-            emails.add(s.email)
-            logger.info(f"Found event subscription: {s.email} for event {event.name}")
-            print(f"[DEBUG] Adicionado email por evento: {s.email}")
-    
-    # subscriptions to any of the authors
-    for author in article_instance.authors.all():
-        print(f"[DEBUG] Verificando subscriptions para autor: {author.name}")
-        author_subscriptions = Subscription.objects.filter(author=author)
-        print(f"[DEBUG] Subscriptions encontradas para {author.name}: {author_subscriptions.count()}")
-        for s in author_subscriptions:
-            emails.add(s.email)
-            logger.info(f"Found author subscription: {s.email} for author {author.name}")
-            print(f"[DEBUG] Adicionado email por autor: {s.email}")
-    
-    # general subscriptions (no author/event)
-    general_subscriptions = Subscription.objects.filter(author__isnull=True, event__isnull=True)
-    print(f"[DEBUG] Subscriptions gerais: {general_subscriptions.count()}")
-    for s in general_subscriptions:
+        matching |= Q(event=event)
+    if authors:
+        matching |= Q(author__in=authors)
+    for s in Subscription.objects.filter(matching).only("email", "author_id", "event_id"):
         emails.add(s.email)
-        logger.info(f"Found general subscription: {s.email}")
-        print(f"[DEBUG] Adicionado email geral: {s.email}")
+        if event and s.event_id == event.id:
+            logger.info(f"Found event subscription: {s.email} for event {event.name}")
+        elif s.author_id:
+            logger.info(f"Found author subscription: {s.email} for author {s.author_id}")
+        else:
+            logger.info(f"Found general subscription: {s.email}")
+        print(f"[DEBUG] Adicionado email: {s.email}")
 
     print(f"[DEBUG] Total de emails únicos encontrados: {len(emails)}")
     print(f"[DEBUG] Lista de emails: {list(emails)}")
@@ -58,8 +51,13 @@ def send_notification_email(article_instance):
 
     logger.info(f"Found {len(emails)} unique subscribers: {list(emails)}")
 
+    subject, message = _notification_content(article_instance, event, [author.name for author in authors])
+    _send_notifications(emails, subject, message)
+
+def _notification_content(article_instance, event, author_names):
+    """(subject, message) announcing a new article"""
     # Build email content formatado conforme solicitado
-    authors_list = ", ".join([author.name for author in article_instance.authors.all()])
+    authors_list = ", ".join(author_names)
     
     # Formatação da edição conforme solicitado
     edition_info = ""
@@ -88,7 +86,9 @@ Edição: {edition_info}
 Esta é uma notificação automática.
 Você está recebendo este email porque se cadastrou para receber notificações sobre novos artigos.
 """
+    return subject, message
 
+def _send_notifications(emails, subject, message):
     from_email = getattr(settings, 'DEFAULT_FROM_EMAIL', 'no-reply@researchhub.com')
     print(f"[DEBUG] From email: {from_email}")
     print(f"[DEBUG] Subject: {subject}")
@@ -121,6 +121,38 @@ Você está recebendo este email porque se cadastrou para receber notificações
     logger.info(f"Successfully sent {success_count} out of {len(emails)} notification emails")
     print(f"[DEBUG] Enviados {success_count} de {len(emails)} emails com sucesso")
 
+def notify_subscribers_of_articles(articles):
+    """Notify the subscribers of many new articles (a bulk import) with one subscription query.
+
+    Same recipients and message as send_notification_email, read from each
+    article's author_snapshot and edition instead of per-article queries.
+    Articles without authors are skipped, as the signals only notify once
+    authors are added.
+    """
+    articles = [a for a in articles if a.author_snapshot]
+    if not articles:
+        return
+    event_ids = {a.edition.event_id for a in articles if a.edition and a.edition.event_id}
+    author_ids = {entry["id"] for a in articles for entry in a.author_snapshot}
+    matching = Q(author__isnull=True, event__isnull=True) | Q(event_id__in=event_ids) | Q(author_id__in=author_ids)
+    general, by_event, by_author = set(), {}, {}
+    for s in Subscription.objects.filter(matching).only("email", "author_id", "event_id"):
+        if s.event_id:
+            by_event.setdefault(s.event_id, set()).add(s.email)
+        if s.author_id:
+            by_author.setdefault(s.author_id, set()).add(s.email)
+        if not s.event_id and not s.author_id:
+            general.add(s.email)
+
+    for article in articles:
+        event = article.edition.event if article.edition else None
+        emails = general | by_event.get(event.id if event else None, set())
+        for entry in article.author_snapshot:
+            emails |= by_author.get(entry["id"], set())
+        if emails:
+            subject, message = _notification_content(article, event, [entry["name"] for entry in article.author_snapshot])
+            _send_notifications(emails, subject, message)
+
 @receiver(post_save, sender=Article)
 def notify_subscribers_on_article_create(sender, instance: Article, created, **kwargs):
     """Signal para quando um artigo é criado - mas só verifica se tem autores"""
@@ -138,8 +170,11 @@ def notify_subscribers_on_article_create(sender, instance: Article, created, **k
         print("[DEBUG] Artigo criado sem autores, aguardando adição de autores")
 
 @receiver(m2m_changed, sender=Article.authors.through)
-def notify_subscribers_on_authors_added(sender, instance, action, pk_set, **kwargs):
+def notify_subscribers_on_authors_added(sender, instance, action, pk_set, reverse=False, **kwargs):
     """Signal para quando autores são adicionados ao artigo"""
+    if reverse:
+        # author.articles.add(...): instance is an Author, not an article
+        return
     print(f"[DEBUG] Signal m2m_changed chamado para artigo: {instance.title}, action: {action}")
     
     if action == "post_add" and pk_set:
@@ -155,3 +190,243 @@ def notify_subscribers_on_authors_added(sender, instance, action, pk_set, **kwar
             send_notification_email(instance)
         else:
             print("[DEBUG] Artigo não é recente, não enviando notificação")
+
+
+# --- Full-text search index maintenance ---
+
+@receiver(post_save, sender=Article)
+def index_article_on_save(sender, instance: Article, **kwargs):
+    search.index_articles([instance.pk])
+
+@receiver(post_delete, sender=Article)
+def unindex_article_on_delete(sender, instance: Article, **kwargs):
+    search.remove_articles([instance.pk])
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def reindex_articles_on_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep the indexed author names in sync with the authors M2M"""
+    if reverse and action == "pre_clear":
+        # author.articles.clear() does not report which articles were affected
+        instance._search_article_ids = list(instance.articles.values_list("id", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        search.index_articles([instance.pk])
+    elif action == "post_clear":
+        search.index_articles(getattr(instance, "_search_article_ids", []))
+    else:
+        search.index_articles(pk_set or [])
+
+@receiver(post_save, sender=Author)
+def index_author_name_tokens(sender, instance: Author, **kwargs):
+    """Keep the whole-word author filter's token table in sync with Author.name"""
+    search.index_author_names([instance])
+
+@receiver(post_save, sender=Author)
+def reindex_articles_on_author_rename(sender, instance: Author, created, **kwargs):
+    if not created:
+        search.index_articles(instance.articles.values_list("id", flat=True))
+
+@receiver(pre_delete, sender=Author)
+def remember_articles_before_author_delete(sender, instance: Author, **kwargs):
+    instance._search_article_ids = list(instance.articles.values_list("id", flat=True))
+
+@receiver(post_delete, sender=Author)
+def reindex_articles_on_author_delete(sender, instance: Author, **kwargs):
+    search.index_articles(getattr(instance, "_search_article_ids", []))
+
+
+# --- Author article counts (ranking for the name autocomplete) ---
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def recount_author_articles(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            search.refresh_author_counts([instance.pk])
+        return
+    if action == "pre_clear":
+        instance._count_author_ids = list(instance.authors.values_list("id", flat=True))
+    elif action == "post_clear":
+        search.refresh_author_counts(getattr(instance, "_count_author_ids", []))
+    elif action in ("post_add", "post_remove"):
+        search.refresh_author_counts(pk_set or [])
+
+@receiver(pre_delete, sender=Article)
+def remember_authors_before_article_delete(sender, instance: Article, **kwargs):
+    instance._count_author_ids = list(instance.authors.values_list("id", flat=True))
+
+@receiver(post_delete, sender=Article)
+def recount_authors_on_article_delete(sender, instance: Article, **kwargs):
+    search.refresh_author_counts(getattr(instance, "_count_author_ids", []))
+
+
+# --- Denormalized author snapshots on articles (join-free listings) ---
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def refresh_snapshots_on_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            snapshots.refresh_article(instance)
+        return
+    if action == "pre_clear":
+        instance._snapshot_article_ids = list(instance.articles.values_list("id", flat=True))
+    elif action == "post_clear":
+        snapshots.refresh(getattr(instance, "_snapshot_article_ids", []))
+    elif action in ("post_add", "post_remove"):
+        snapshots.refresh(pk_set or [])
+
+@receiver(post_save, sender=Article)
+def refresh_snapshot_on_article_save(sender, instance: Article, created, update_fields=None, **kwargs):
+    # A save() writes the whole row, snapshot included, from an instance that
+    # may have been loaded before its authors changed. A new row has no
+    # authors yet, unless it re-inserts a deleted article with its old snapshot.
+    if update_fields is None and (not created or instance.author_snapshot):
+        snapshots.refresh_article(instance)
+
+@receiver(post_save, sender=Author)
+def refresh_snapshots_on_author_save(sender, instance: Author, created, **kwargs):
+    # a new author is on no article yet; an edited one may have a new name or email
+    if not created:
+        snapshots.refresh_for_authors([instance.pk])
+
+@receiver(pre_delete, sender=Author)
+def remember_snapshots_before_author_delete(sender, instance: Author, **kwargs):
+    instance._snapshot_article_ids = list(instance.articles.values_list("id", flat=True))
+
+@receiver(post_delete, sender=Author)
+def refresh_snapshots_on_author_delete(sender, instance: Author, **kwargs):
+    snapshots.refresh(getattr(instance, "_snapshot_article_ids", []))
+
+
+# --- Materialized author profiles (author pages) ---
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def refresh_profiles_on_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Authorship changes move articles and co-author counts of everyone on the article"""
+    if action == "pre_clear":
+        # clear() does not report what it removes
+        related = instance.articles if reverse else instance.authors
+        instance._profile_clear_ids = list(related.values_list("id", flat=True))
+    elif action == "post_clear":
+        cleared = getattr(instance, "_profile_clear_ids", [])
+        if reverse:
+            profiles.refresh_article_authors(cleared, [instance.pk])
+        else:
+            profiles.refresh_profiles(cleared)
+    elif action in ("post_add", "post_remove"):
+        if reverse:
+            profiles.refresh_article_authors(pk_set or [], [instance.pk])
+        else:
+            profiles.refresh_article_authors([instance.pk], pk_set or [])
+
+@receiver(post_save, sender=Article)
+def refresh_profiles_on_article_save(sender, instance: Article, created, **kwargs):
+    # a new article has no authors yet; an edited one may have changed edition (year)
+    if not created:
+        profiles.refresh_article_authors([instance.pk])
+
+@receiver(pre_delete, sender=Article)
+def remember_profiles_before_article_delete(sender, instance: Article, **kwargs):
+    instance._profile_author_ids = list(instance.authors.values_list("id", flat=True))
+
+@receiver(post_delete, sender=Article)
+def refresh_profiles_on_article_delete(sender, instance: Article, **kwargs):
+    profiles.refresh_profiles(getattr(instance, "_profile_author_ids", []))
+
+@receiver(post_save, sender=Edition)
+def refresh_profiles_on_edition_save(sender, instance: Edition, created, **kwargs):
+    if not created:
+        profiles.refresh_article_authors(instance.articles.values("id"))
+
+@receiver(pre_delete, sender=Author)
+def remember_coauthors_before_author_delete(sender, instance: Author, **kwargs):
+    instance._profile_coauthor_ids = profiles.coauthor_ids(instance.pk)
+
+@receiver(post_delete, sender=Author)
+def refresh_coauthor_profiles_on_author_delete(sender, instance: Author, **kwargs):
+    profiles.refresh_profiles(getattr(instance, "_profile_coauthor_ids", []))
+
+
+# --- PDF blob reference counts ---
+
+@receiver(pre_save, sender=Article)
+def remember_pdf_before_article_save(sender, instance: Article, update_fields=None, **kwargs):
+    if instance._state.adding or (update_fields is not None and "pdf_file" not in update_fields):
+        instance._previous_pdf = None
+        return
+    instance._previous_pdf = Article.objects.filter(pk=instance.pk).values_list("pdf_file", flat=True).first()
+
+@receiver(post_save, sender=Article)
+def count_pdf_references_on_article_save(sender, instance: Article, created, update_fields=None, **kwargs):
+    if update_fields is not None and "pdf_file" not in update_fields:
+        return
+    previous, current = getattr(instance, "_previous_pdf", None) or "", instance.pdf_file.name or ""
+    if previous != current:
+        blobs.retain(current)
+        blobs.release(previous)
+    instance._previous_pdf = current
+
+@receiver(post_delete, sender=Article)
+def release_pdf_on_article_delete(sender, instance: Article, **kwargs):
+    blobs.release(instance.__dict__.get("pdf_file") and instance.pdf_file.name)
+
+
+# --- Version stamps for conditional GET (ETag) ---
+
+@receiver(post_save, sender=Event)
+@receiver(post_save, sender=Edition)
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=Edition)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=Subscription)
+def bump_versions_on_change(sender, instance, **kwargs):
+    versioning.bump_for(sender, [instance.pk])
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def bump_versions_on_authors_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    article_ids, author_ids = ([instance.pk], pk_set or []) if not reverse else (pk_set or [], [instance.pk])
+    versioning.bump(
+        "articles", "authors",
+        *(versioning.object_key(Article, pk) for pk in article_ids),
+        *(versioning.object_key(Author, pk) for pk in author_ids),
+    )
+
+
+# --- Response cache eviction ---
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def evict_cached_event(sender, instance: Event, **kwargs):
+    response_cache.evict("events", f"event:{instance.pk}")
+
+@receiver(post_save, sender=Edition)
+@receiver(post_delete, sender=Edition)
+def evict_cached_edition(sender, instance: Edition, **kwargs):
+    response_cache.evict("editions", f"edition:{instance.pk}")
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def evict_cached_article(sender, instance: Article, **kwargs):
+    response_cache.evict(f"article:{instance.pk}")
+
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def evict_cached_author(sender, instance: Author, **kwargs):
+    response_cache.evict(f"author:{instance.pk}")
+
+@receiver(m2m_changed, sender=Article.authors.through)
+def evict_cached_authorship(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    article_ids, author_ids = ([instance.pk], pk_set or []) if not reverse else (pk_set or [], [instance.pk])
+    response_cache.evict(
+        *(f"article:{pk}" for pk in article_ids),
+        *(f"author:{pk}" for pk in author_ids),
+    )
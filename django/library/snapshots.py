@@ -0,0 +1,67 @@
+"""Denormalized author snapshot stored on each article.
+
+`Article.author_snapshot` holds the ordered author documents of the article
+({"id", "name", "email", "slug"}, the same dicts the API embeds, in byline
+position order), so listings render
+authors from the article row alone, without the M2M join or a prefetch.
+
+library.signals refreshes the snapshot whenever authorship changes (views,
+ArticleSerializer, importers and admin all go through the M2M manager) and
+whenever an author is renamed or deleted. A full Article.save() writes the
+column from the instance, which may be stale, so it is recomputed right
+after every such save as well. `find_drift` (the
+verify_author_snapshots command) compares it against the M2M table.
+"""
+from .models import Article
+from .chunking import CHUNK_SIZE, chunks
+
+
+def author_entry(author_id, name, email, slug):
+    return {"id": author_id, "name": name, "email": email or None, "slug": slug}
+
+
+def build(article_ids):
+    """{article id: snapshot} computed from the M2M table, in authorship order"""
+    snapshots = {pk: [] for pk in article_ids}
+    rows = (
+        Article.authors.through.objects.filter(article_id__in=article_ids)
+        .order_by("article_id", "position", "id")
+        .values_list("article_id", "author_id", "author__name", "author__email", "author__slug")
+    )
+    for article_id, author_id, name, email, slug in rows:
+        snapshots[article_id].append(author_entry(author_id, name, email, slug))
+    return snapshots
+
+
+def _write(snapshots):
+    articles = [Article(pk=pk, author_snapshot=snapshot) for pk, snapshot in snapshots.items()]
+    Article.objects.bulk_update(articles, ["author_snapshot"], batch_size=CHUNK_SIZE)
+
+
+def refresh(article_ids):
+    """Recompute and store the snapshots of the given articles"""
+    for chunk in chunks(set(article_ids)):
+        _write(build(chunk))
+
+
+def refresh_article(article):
+    """Recompute one article's snapshot and update the instance in memory too"""
+    snapshot = build([article.pk])[article.pk]
+    Article.objects.filter(pk=article.pk).update(author_snapshot=snapshot)
+    article.author_snapshot = snapshot
+
+
+def refresh_for_authors(author_ids):
+    """Recompute the snapshots of every article by the given authors"""
+    articles = Article.authors.through.objects.filter(author_id__in=author_ids)
+    refresh(articles.values_list("article_id", flat=True).distinct())
+
+
+def find_drift():
+    """Ids of the articles whose stored snapshot differs from the M2M table"""
+    drifted = []
+    for chunk in chunks(Article.objects.order_by("id").values_list("id", flat=True)):
+        expected = build(chunk)
+        stored = Article.objects.filter(pk__in=chunk).values_list("id", "author_snapshot")
+        drifted.extend(pk for pk, snapshot in stored if snapshot != expected[pk])
+    return drifted
@@ -0,0 +1,84 @@
+"""Content-addressed storage for article PDFs.
+
+Files are stored under the SHA-256 of their bytes, sharded two levels deep so
+no directory grows past a few hundred entries:
+
+    pdfs/3f/a2/3fa2...e1.pdf
+
+The digest is computed while streaming the upload's chunks; when a blob with
+that digest already exists nothing is written, otherwise the bytes land in a
+temporary file beside the target and are renamed into place (an upload that
+Django already spooled to disk is moved, not copied). Identical uploads and
+bulk-imported PDFs therefore share one file.
+
+Reference counting lives in library.blobs.
+"""
+import hashlib
+import os
+import re
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+PREFIX = "pdfs"
+
+_BLOB_RE = re.compile(rf"^{PREFIX}/[0-9a-f]{{2}}/[0-9a-f]{{2}}/([0-9a-f]{{64}})(\.\w+)?$")
+
+
+def blob_name(digest, ext=".pdf"):
+    return f"{PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def blob_digest(name):
+    """The SHA-256 a content-addressed name was built from, or None for legacy names"""
+    match = _BLOB_RE.match(name or "")
+    return match.group(1) if match else None
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that names every file after the hash of its content"""
+
+    def get_available_name(self, name, max_length=None):
+        # The final name is only known once the content is hashed (see _save);
+        # equal names mean equal bytes, so they never need a unique suffix
+        return name
+
+    def _save(self, name, content):
+        ext = os.path.splitext(name)[1].lower() or ".pdf"
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        name = blob_name(digest.hexdigest(), ext)
+        path = self.path(name)
+        if os.path.exists(path):
+            return name
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        if hasattr(content, "temporary_file_path"):
+            file_move_safe(content.temporary_file_path(), path, allow_overwrite=True)
+        else:
+            # Write beside the target and rename, so a blob is never seen half
+            # written; a concurrent writer of the same blob has the same bytes
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    for chunk in content.chunks():
+                        out.write(chunk)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        if self.file_permissions_mode is not None:
+            os.chmod(path, self.file_permissions_mode)
+        return name
+
+
+pdf_storage = ContentAddressedStorage()
+
+
+def get_pdf_storage():
+    return pdf_storage
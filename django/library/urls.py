@@ -14,12 +14,21 @@ urlpatterns = [
     path('articles/', views.ArticleListCreateAPIView.as_view(), name='article-list-create'),
     path('articles/<int:pk>/', views.ArticleDetailView.as_view(), name='article-detail'),
     path('articles/bulk-import/', views.BulkImportArticlesView.as_view(), name='bulk-import-articles'),
+    path('articles/batch/', views.ArticleBatchView.as_view(), name='article-batch'),
+    path('articles/<int:pk>/pdf/', views.ArticlePdfView.as_view(), name='article-pdf'),
+
+    # Queued bulk imports
+    path('import-jobs/<int:pk>/', views.ImportJobDetailView.as_view(), name='import-job-detail'),
 
     # Authors (articles by author)
     path('authors/<int:pk>/articles/', views.AuthorArticlesView.as_view(), name='author-articles'),
+    path('authors/suggest/', views.AuthorSuggestView.as_view(), name='author-suggest'),
     path('authors/<str:author_name>/', views.AuthorByNameView.as_view(), name='author-by-name'),
 
     # Subscriptions - fixing the URL to match frontend
     path('subscriptions/', views.SubscriptionCreateView.as_view(), name='subscription-create'),
     path('subscriptions/list/', views.SubscriptionListView.as_view(), name='subscription-list'),
+
+    # Response cache counters
+    path('cache-stats/', views.CacheStatsView.as_view(), name='cache-stats'),
 ]
@@ -0,0 +1,75 @@
+"""Version stamps and conditional GET support for the read endpoints.
+
+Every write to the catalog bumps a version counter for the affected
+collections ("events", "editions", "articles", "authors", "subscriptions")
+and for the object itself ("article:12"). GET views declare which stamps
+their response depends on with `conditional_get(...)`. The ETag is
+derived from those stamps alone, so a matching If-None-Match is answered
+with 304 by Django's `condition` decorator before the view (and its listing
+query) runs. No Last-Modified is sent: its one-second resolution would let
+If-Modified-Since answer 304 for a write made in the same second.
+"""
+import hashlib
+
+from django.db.models import F
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from .models import Article, Author, ContentVersion, Edition, Event, Subscription
+
+# Collections whose payloads embed each model, so a change must bump them all
+DEPENDENT_COLLECTIONS = {
+    Event: ("events", "editions", "articles"),
+    Edition: ("editions", "articles"),
+    Article: ("articles",),
+    Author: ("authors", "articles"),
+    Subscription: ("subscriptions",),
+}
+
+
+def object_key(model, pk):
+    return f"{model._meta.model_name}:{pk}"
+
+
+def bump(*keys):
+    """Increment the version of each key, creating missing ones at version 1"""
+    keys = set(keys)
+    if not keys:
+        return
+    now = timezone.now()
+    updated = ContentVersion.objects.filter(key__in=keys).update(version=F("version") + 1, updated_at=now)
+    if updated < len(keys):
+        existing = set(ContentVersion.objects.filter(key__in=keys).values_list("key", flat=True))
+        ContentVersion.objects.bulk_create(
+            [ContentVersion(key=key, version=1, updated_at=now) for key in keys - existing],
+            ignore_conflicts=True,
+        )
+
+
+def bump_for(model, pks=()):
+    """Bump the collections that embed `model` plus the given objects"""
+    bump(*DEPENDENT_COLLECTIONS.get(model, ()), *(object_key(model, pk) for pk in pks))
+
+
+def _versions(keys):
+    """The current version of each key, 0 for keys never bumped"""
+    versions = dict(ContentVersion.objects.filter(key__in=keys).values_list("key", "version"))
+    return [versions.get(key, 0) for key in keys]
+
+
+def conditional_get(*key_templates):
+    """Class decorator adding ETag handling to a view's `get`.
+
+    Key templates are formatted with the URL kwargs, e.g. "article:{pk}".
+    The ETag also covers the full path, since query parameters change the body.
+    """
+    def resolve(request, kwargs):
+        return tuple(template.format(**kwargs) for template in key_templates)
+
+    def etag(request, *args, **kwargs):
+        versions = _versions(resolve(request, kwargs))
+        raw = f"{request.get_full_path()}|{'.'.join(map(str, versions))}"
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    return method_decorator(condition(etag_func=etag), name="get")
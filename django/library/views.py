@@ -1,13 +1,25 @@
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.http.multipartparser import MultiPartParserError
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import get_object_or_404
-from datetime import date
+from django.utils.text import slugify
+from django.core.files.base import ContentFile
+from django.db.models import F, Q
+from datetime import date, datetime
+import base64
+import binascii
+import io
 import json
 import re  # Add this import
 
-from .models import Edition, Event, Article, Author, Subscription
+from .models import Edition, Event, Article, Author, ImportJob, Subscription, author_slug, fold_name
+from . import search
+from .versioning import conditional_get
+from .response_cache import cached_response
+from .payloads import ARTICLE_FIELDS, Documents, event_document, json_response
+from . import authorship, downloads, importer, payloads, profiles, response_cache
 
 def _parse_date(s):
     if not s:
@@ -17,49 +29,288 @@ def _parse_date(s):
     except Exception:
         return None
 
-def _edition_to_dict(ed: Edition):
-    return {
-        "id": ed.id,
-        "event": {
-            "id": ed.event.id, 
-            "name": ed.event.name,
-            "sigla": ed.event.sigla or "",
-            "entidade_promotora": ed.event.entidade_promotora or ""
-        },
-        "year": ed.year,
-        "location": ed.location or None,
-        "start_date": ed.start_date.isoformat() if ed.start_date else None,
-        "end_date": ed.end_date.isoformat() if ed.end_date else None,
-    }
+# Keyset pagination for the article list, ordered by (created_at, id), or
+# by (search_rank, id) for full-text searches
+ARTICLE_PAGE_SIZE = 50
+ARTICLE_MAX_PAGE_SIZE = 500
+# Ids accepted by one batch lookup (?ids= or POST /api/articles/batch/)
+ARTICLE_BATCH_MAX_IDS = 1000
+
+_CURSOR_KEYS = {
+    "created_at": (lambda value: value.isoformat(), datetime.fromisoformat),
+    "search_rank": (float, float),
+}
+
+def _is_false(value):
+    return str(value).strip().lower() in ("0", "false", "no", "off")
+
+def _is_true(value):
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+def _encode_cursor(article: Article, key):
+    """Opaque cursor pointing right after `article` in (key, id) order"""
+    dump, _ = _CURSOR_KEYS[key]
+    raw = json.dumps([dump(getattr(article, key)), article.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor, key):
+    """Return (key value, id) from a cursor, or None if it is malformed"""
+    _, load = _CURSOR_KEYS[key]
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        return load(value), int(pk)
+    except (binascii.Error, ValueError, TypeError):
+        return None
+
+def _parse_limit(value):
+    if value in (None, ""):
+        return ARTICLE_PAGE_SIZE
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return None
+    if limit < 1:
+        return None
+    return min(limit, ARTICLE_MAX_PAGE_SIZE)
+
+def _keyset_page(qs, request, key="created_at"):
+    """Apply ?limit=&cursor= to an article queryset.
+
+    Uses an index seek on (created_at, id) instead of OFFSET, so every page
+    costs the same regardless of how deep the client has paged.
+    Returns (articles, next_cursor) or a JsonResponse with the error.
+    """
+    limit = _parse_limit(request.GET.get("limit"))
+    if limit is None:
+        return JsonResponse({"error": "limit must be a positive integer"}, status=400)
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        position = _decode_cursor(cursor, key)
+        if position is None:
+            return JsonResponse({"error": "invalid cursor"}, status=400)
+        value, pk = position
+        # The leading key >= x term lets SQLite seek the composite index
+        qs = qs.filter(**{f"{key}__gte": value}).filter(
+            Q(**{f"{key}__gt": value}) | Q(id__gt=pk)
+        )
 
-def _author_to_dict(a: Author):
-    return {"id": a.id, "name": a.name, "email": a.email or None}
+    page = list(qs.order_by(key, "id")[:limit + 1])
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = _encode_cursor(page[-1], key)
+    return page, next_cursor
 
-def _article_to_dict(a: Article):
-    pdf_url = a.pdf_url or ""
-    if a.pdf_file:
-        # Use request to build full URL or just the path
-        pdf_url = f"http://localhost:8000{a.pdf_file.url}"  # or just a.pdf_file.url
-    
-    return {
-        "id": a.id,
-        "title": a.title,
-        "abstract": a.abstract or None,
-        "pdf_url": pdf_url or None,
-        "edition": _edition_to_dict(a.edition) if a.edition_id else None,
-        "authors": [_author_to_dict(x) for x in a.authors.all()],
-        "bibtex": a.bibtex or None,
-        "pagina_inicial": a.pagina_inicial,
-        "pagina_final": a.pagina_final,
-        "created_at": a.created_at.isoformat() if a.created_at else None,
+def _parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _parse_id(value):
+    """An id from JSON or a query string: ints (not bools) and digit strings only"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().isascii() and value.strip().isdigit():
+        return int(value)
+    return None
+
+def _parse_ids(raw):
+    """Parse a comma-separated string or a list of ids, keeping the first
+    occurrence of each in order. Returns a list or a 400 JsonResponse."""
+    if isinstance(raw, str):
+        raw = [part for part in raw.split(",") if part.strip()]
+    if not isinstance(raw, list):
+        return JsonResponse({"error": "ids must be a list of integers"}, status=400)
+    ids = [_parse_id(value) for value in raw]
+    invalid = [value for value, pk in zip(raw, ids) if pk is None]
+    if invalid:
+        return JsonResponse({"error": f"invalid ids: {', '.join(map(str, invalid))}"}, status=400)
+    if len(ids) > ARTICLE_BATCH_MAX_IDS:
+        return JsonResponse({"error": f"at most {ARTICLE_BATCH_MAX_IDS} ids per request"}, status=400)
+    return list(dict.fromkeys(ids))
+
+def _parse_facets(request):
+    """Parse ?facets=event,year,author (and ?facet_limit=) for the article list.
+
+    Returns None when no facets were asked for, a (facets, limit) pair, or a
+    400 JsonResponse.
+    """
+    raw = request.GET.get("facets")
+    if not raw:
+        return None
+    facets = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = sorted(set(facets) - set(search.FACETS))
+    if unknown:
+        return JsonResponse({"error": f"unknown facets: {', '.join(unknown)}"}, status=400)
+    limit = request.GET.get("facet_limit")
+    if limit is None:
+        return facets, search.FACET_LIMIT
+    limit = _parse_int(limit)
+    if limit is None or not 1 <= limit <= search.FACET_MAX_LIMIT:
+        return JsonResponse({"error": f"facet_limit must be between 1 and {search.FACET_MAX_LIMIT}"}, status=400)
+    return facets, limit
+
+def _batch_lookup(request, raw_ids):
+    """Articles for a list of ids in one query (plus prefetch), in request order.
+
+    The response lists the found articles under "results" and the ids that
+    do not exist under "missing"; ?fields= and ?compact= apply as on the list.
+    """
+    ids = _parse_ids(raw_ids)
+    if isinstance(ids, JsonResponse):
+        return ids
+    fields = _parse_fields(request)
+    if isinstance(fields, JsonResponse):
+        return fields
+    compact = _is_true(request.GET.get("compact", "false"))
+    found = _article_queryset(fields).in_bulk(ids)
+    docs = Documents(fields, compact=compact)
+    data = {
+        "results": [docs.article(found[pk]) for pk in ids if pk in found],
+        "missing": [pk for pk in ids if pk not in found],
+    }
+    if compact:
+        data["included"] = docs.included()
+    return json_response(data)
+
+def _apply_edition_filters(qs, request, prefix=""):
+    """Push ?edition_id=, ?event_id=, ?year=, ?year_from=, ?year_to= into SQL.
+
+    `prefix` is the path from the queryset model to Edition ("" for editions,
+    "edition__" for articles). Returns the filtered queryset or a JsonResponse
+    with the error.
+    """
+    filters = {}
+    lookups = {
+        "edition_id": f"{prefix}id" if prefix else "id",
+        "event_id": f"{prefix}event_id",
+        "year": f"{prefix}year",
+        "year_from": f"{prefix}year__gte",
+        "year_to": f"{prefix}year__lte",
     }
+    for param, lookup in lookups.items():
+        value = request.GET.get(param)
+        if value in (None, ""):
+            continue
+        number = _parse_int(value)
+        if number is None:
+            return JsonResponse({"error": f"{param} must be an integer"}, status=400)
+        filters[lookup] = number
+    return qs.filter(**filters) if filters else qs
+
+# Streaming export (?stream=json|ndjson): rows fetched and prefetched per chunk
+STREAM_CHUNK_SIZE = 500
+STREAM_FORMATS = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+def _stream_json(rows, fmt):
+    """Encode dicts incrementally as a JSON array or NDJSON, one chunk at a time"""
+    if fmt == "json":
+        yield b"["
+    first = True
+    buffer = []
+    for row in rows:
+        encoded = payloads.dumps(row)
+        if fmt == "ndjson":
+            buffer.append(encoded + b"\n")
+        else:
+            buffer.append(encoded if first else b"," + encoded)
+        first = False
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+    if buffer:
+        yield b"".join(buffer)
+    if fmt == "json":
+        yield b"]"
+
+def _streaming_response(qs, docs, fmt):
+    """Stream a queryset of articles without ever holding the whole result in memory.
+
+    queryset.iterator() keeps only one chunk of model instances alive and
+    runs prefetch_related once per chunk, and the edition and author
+    documents `docs` memoizes are dropped after each chunk, so memory stays
+    flat no matter how many rows match.
+    """
+    def rows():
+        for count, article in enumerate(qs.iterator(chunk_size=STREAM_CHUNK_SIZE), 1):
+            yield docs.article(article)
+            if count % STREAM_CHUNK_SIZE == 0:
+                docs.clear()
+    return StreamingHttpResponse(_stream_json(rows(), fmt), content_type=STREAM_FORMATS[fmt])
+
+def _edition_cache_tags(data):
+    return {f"edition:{data['id']}", f"event:{data['event']['id']}"}
+
+def _article_cache_tags(article: Article, data):
+    """Tags of every object whose change would alter this article's payload"""
+    tags = {f"article:{article.id}"}
+    if article.edition_id:
+        # also covers grouping by edition year in the author views
+        tags.add(f"edition:{article.edition_id}")
+    if data.get("edition"):
+        tags.update(_edition_cache_tags(data["edition"]))
+    for author in data.get("authors") or ():
+        tags.add(f"author:{author['id']}")
+    return tags
+
+def _parse_fields(request):
+    """Parse ?fields=id,title,... into a set of article fields.
+
+    Returns None when the parameter is absent (serialize everything) or a
+    JsonResponse naming the unknown fields.
+    """
+    raw = request.GET.get("fields")
+    if not raw:
+        return None
+    fields = {f.strip() for f in raw.split(",") if f.strip()}
+    unknown = sorted(fields - ARTICLE_FIELDS.keys())
+    if unknown:
+        return JsonResponse({"error": f"unknown fields: {', '.join(unknown)}"}, status=400)
+    return fields
+
+def _parse_multipart(request):
+    """(data, files) of a multipart PUT/PATCH body, streamed the way POST is.
+
+    Django only parses POST bodies by itself. This feeds the request stream
+    (never `request.body`) through the configured upload handlers, so large
+    files are spooled to temporary files instead of held in memory.
+    Raises MultiPartParserError on a malformed body.
+    """
+    data, files = request.parse_file_upload(request.META, request)
+    # request.close() (run when the response is done) closes `_files`, so the
+    # temporary files are cleaned up exactly like POST uploads
+    request._files = files
+    return data, files
+
+def _article_queryset(fields=None):
+    """Article queryset that only loads the columns and relations `fields` needs"""
+    qs = Article.objects.all()
+    if fields is None or "edition" in fields:
+        qs = qs.select_related("edition", "edition__event")
+    if fields is not None:
+        # id and created_at are the pagination key, edition_id is used for grouping
+        columns = {"id", "created_at", "edition"}
+        for name in fields:
+            columns.update(ARTICLE_FIELDS[name][1])
+        qs = qs.only(*columns)
+    return qs
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("editions")
+@cached_response("edition-list")
 class EditionListCreateView(View):
     def get(self, request):
-        qs = Edition.objects.select_related("event").all()
-        data = [_edition_to_dict(e) for e in qs]
-        return JsonResponse(data, safe=False)
+        qs = _apply_edition_filters(Edition.objects.select_related("event").all(), request)
+        if isinstance(qs, JsonResponse):
+            return qs
+        docs = Documents()
+        data = [docs.edition(e) for e in qs]
+        response = json_response(data)
+        response.cache_tags = {"editions"}.union(*(_edition_cache_tags(e) for e in data))
+        return response
 
     def post(self, request):
         try:
@@ -90,13 +341,14 @@ class EditionListCreateView(View):
             start_date=start_date,
             end_date=end_date,
         )
-        return JsonResponse(_edition_to_dict(edition), status=201)
+        return json_response(Documents().edition(edition), status=201)
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("edition:{pk}", "events")
 class EditionDetailView(View):
     def get(self, request, pk):
         ed = get_object_or_404(Edition.objects.select_related("event"), pk=pk)
-        return JsonResponse(_edition_to_dict(ed))
+        return json_response(Documents().edition(ed))
 
     def put(self, request, pk):
         try:
@@ -122,7 +374,7 @@ class EditionDetailView(View):
             ed.end_date = _parse_date(payload.get("end_date"))
 
         ed.save()
-        return JsonResponse(_edition_to_dict(ed))
+        return json_response(Documents().edition(ed))
 
     def delete(self, request, pk):
         ed = get_object_or_404(Edition, pk=pk)
@@ -130,33 +382,83 @@ class EditionDetailView(View):
         return JsonResponse({}, status=204)
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("articles")
 class ArticleListCreateAPIView(View):
     def get(self, request):
-        qs = Article.objects.select_related("edition", "edition__event").prefetch_related("authors").all()
-        # support filters via query params: title, author, event
+        if "ids" in request.GET:
+            # Batch lookup of known articles: ?ids=3,1,2
+            return _batch_lookup(request, request.GET["ids"])
+        fields = _parse_fields(request)
+        if isinstance(fields, JsonResponse):
+            return fields
+        facets = _parse_facets(request)
+        if isinstance(facets, JsonResponse):
+            return facets
+        qs = _article_queryset(fields)
+        # support filters via query params: q (full-text), title, author, event
+        q = request.GET.get('q')
         title = request.GET.get('title')
         author = request.GET.get('author')
         event = request.GET.get('event')
+        order_key = "created_at"
+        if q:
+            # BM25-ranked match over title, abstract and author names
+            qs = search.search_articles(qs, q)
+            order_key = "search_rank"
         if title:
             qs = qs.filter(title__icontains=title)
         if author:
             # For author search, find names that contain the search term as a complete word
             author_clean = author.strip()
             # Use regex to match complete words (word boundaries)
-            from django.db.models import Q
-            import re
-            
-            # Escape special regex characters in the search term
-            escaped_term = re.escape(author_clean)
-            # Create regex pattern for word boundary matching (case insensitive)
-            regex_pattern = r'\b' + escaped_term + r'\b'
-            
-            qs = qs.filter(authors__name__iregex=regex_pattern)
+            # Served by the indexed author name tokens (see search.authors_matching_words)
+            author_ids = search.authors_matching_words(author_clean)
+            if author_ids is not None:
+                qs = qs.filter(authors__in=author_ids)
+            else:
+                # No word characters to index on: keep the regex behaviour
+                regex_pattern = r'\b' + re.escape(author_clean) + r'\b'
+                qs = qs.filter(authors__name__iregex=regex_pattern)
         if event:
             qs = qs.filter(edition__event__name__icontains=event)
+        qs = _apply_edition_filters(qs, request, prefix="edition__")
+        if isinstance(qs, JsonResponse):
+            return qs
         qs = qs.distinct()
-        data = [_article_to_dict(a) for a in qs]
-        return JsonResponse(data, safe=False)
+        # ?compact=true: edition_id/author_ids per article plus a top-level
+        # "included" map holding each edition, event and author once
+        compact = _is_true(request.GET.get("compact", "false"))
+        docs = Documents(fields, compact=compact)
+
+        # Export-style requests: stream the full result as a JSON array or NDJSON
+        stream = request.GET.get("stream")
+        if stream:
+            if stream not in STREAM_FORMATS:
+                return JsonResponse({"error": "stream must be json or ndjson"}, status=400)
+            if compact or facets:
+                return JsonResponse({"error": "compact and facets are not supported with stream"}, status=400)
+            return _streaming_response(qs.order_by(order_key, "id"), docs, stream)
+
+        # Old clients can still ask for the whole list with ?paginate=false
+        if _is_false(request.GET.get("paginate", "true")):
+            if q:
+                qs = qs.order_by(order_key, "id")
+            if not (compact or facets):
+                return json_response(docs.articles(qs))
+            data = {"results": docs.articles(qs)}
+        else:
+            result = _keyset_page(qs, request, key=order_key)
+            if isinstance(result, JsonResponse):
+                return result
+            page, next_cursor = result
+            data = {"results": docs.articles(page), "next_cursor": next_cursor}
+
+        if compact:
+            data["included"] = docs.included()
+        if facets:
+            # Counts over the whole filtered set, not just this page
+            data["facets"] = search.facet_counts(qs, *facets)
+        return json_response(data)
 
     def post(self, request):
         print(f"Content-Type: {request.content_type}")  # Debug
@@ -196,16 +498,11 @@ class ArticleListCreateAPIView(View):
             authors_str = request.POST.get("authors", "")
             if authors_str:
                 try:
-                    authors = json.loads(authors_str)
-                    for name in authors:
-                        if not name:
-                            continue
-                        author, _ = Author.objects.get_or_create(name=name)
-                        article.authors.add(author)
+                    authorship.set_authors(article, authorship.resolve_authors(json.loads(authors_str)))
                 except json.JSONDecodeError:
                     pass
 
-            return JsonResponse(_article_to_dict(article), status=201)
+            return json_response(Documents().article(article), status=201)
 
         # Handle JSON payload (backward compatibility)
         try:
@@ -255,31 +552,42 @@ class ArticleListCreateAPIView(View):
         else:
             names = []
 
-        for name in names:
-            author, _ = Author.objects.get_or_create(name=name)
-            article.authors.add(author)
+        authorship.set_authors(article, authorship.resolve_authors(names))
 
         article.save()
-        return JsonResponse(_article_to_dict(article))
+        return json_response(Documents().article(article))
 
     def delete(self, request, pk):
         article = get_object_or_404(Article, pk=pk)
-        # Delete file if exists
-        if article.pdf_file:
-            import os
-            if os.path.isfile(article.pdf_file.path):
-                os.remove(article.pdf_file.path)
+        # the PDF is released by library.signals; shared blobs stay on disk
         article.delete()
         return JsonResponse({}, status=204)
 
 @method_decorator(csrf_exempt, name='dispatch')
+class ArticleBatchView(View):
+    def post(self, request):
+        """Batch lookup for id lists too long for ?ids=: {"ids": [3, 1, 2]}"""
+        try:
+            payload = json.loads(request.body.decode() or "{}")
+        except json.JSONDecodeError:
+            return JsonResponse({"error": "invalid json"}, status=400)
+        if not isinstance(payload, dict) or "ids" not in payload:
+            return JsonResponse({"error": "ids is required"}, status=400)
+        return _batch_lookup(request, payload["ids"])
+
+@method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("article:{pk}", "editions", "authors")
+@cached_response("article-detail")
 class ArticleDetailView(View):
     def get(self, request, pk):
-        article = get_object_or_404(
-            Article.objects.select_related("edition", "edition__event").prefetch_related("authors"),
-            pk=pk
-        )
-        return JsonResponse(_article_to_dict(article))
+        fields = _parse_fields(request)
+        if isinstance(fields, JsonResponse):
+            return fields
+        article = get_object_or_404(_article_queryset(fields), pk=pk)
+        data = Documents(fields).article(article)
+        response = json_response(data)
+        response.cache_tags = _article_cache_tags(article, data)
+        return response
 
     def put(self, request, pk):
         print(f"=== UPDATE ARTICLE {pk} ===")
@@ -292,25 +600,12 @@ class ArticleDetailView(View):
         # Handle multipart/form-data for file uploads
         # Django doesn't automatically parse PUT requests with multipart/form-data
         if request.content_type and 'multipart/form-data' in request.content_type:
-            from django.http import QueryDict
-            import io
-            
-            # Parse the request body manually for PUT
             try:
-                # Use Django's MultiPartParser
-                from django.http.multipartparser import MultiPartParser
-                
-                # Parse the multipart data
-                parser = MultiPartParser(request.META, io.BytesIO(request.body), request.upload_handlers, request.encoding or 'utf-8')
-                parsed_data, parsed_files = parser.parse()
-                print(f"Parsed POST data: {dict(parsed_data)}")
-                print(f"Parsed FILES: {list(parsed_files.keys())}")
-            except Exception as e:
-                print(f"Error parsing multipart data: {e}")
-                import traceback
-                traceback.print_exc()
-                parsed_data = QueryDict()
-                parsed_files = {}
+                parsed_data, parsed_files = _parse_multipart(request)
+            except MultiPartParserError as e:
+                return JsonResponse({"error": f"invalid multipart body: {e}"}, status=400)
+            print(f"Parsed POST data: {dict(parsed_data)}")
+            print(f"Parsed FILES: {list(parsed_files.keys())}")
             
             if "title" in parsed_data:
                 print(f"Updating title to: {parsed_data['title']}")  # Debug
@@ -341,14 +636,7 @@ class ArticleDetailView(View):
             if authors_str:
                 print(f"Updating authors: {authors_str}")  # Debug
                 try:
-                    authors = json.loads(authors_str)
-                    article.authors.clear()
-                    for name in authors:
-                        if not name:
-                            continue
-                        author, created = Author.objects.get_or_create(name=name)
-                        print(f"Adding author: {author.name} (created: {created})")  # Debug
-                        article.authors.add(author)
+                    authorship.set_authors(article, authorship.resolve_authors(json.loads(authors_str)))
                 except json.JSONDecodeError as e:
                     print(f"Error parsing authors JSON: {e}")  # Debug
 
@@ -358,9 +646,9 @@ class ArticleDetailView(View):
             
             # Refresh the article with related data
             article.refresh_from_db()
-            article = Article.objects.select_related("edition", "edition__event").prefetch_related("authors").get(pk=article.id)
+            article = Article.objects.select_related("edition", "edition__event").get(pk=article.id)
             
-            return JsonResponse(_article_to_dict(article))
+            return json_response(Documents().article(article))
 
         # Handle JSON payload
         try:
@@ -386,77 +674,118 @@ class ArticleDetailView(View):
             article.edition = get_object_or_404(Edition, pk=payload["edition_id"])
 
         if "authors" in payload:
-            article.authors.clear()
-            for name in payload["authors"]:
-                if not name:
-                    continue
-                author, _ = Author.objects.get_or_create(name=name)
-                article.authors.add(author)
+            authorship.set_authors(article, authorship.resolve_authors(payload["authors"]))
 
         article.save()
-        return JsonResponse(_article_to_dict(article))
+        return json_response(Documents().article(article))
+
+    def patch(self, request, pk):
+        """Partial update; PUT already only touches the fields it is sent"""
+        return self.put(request, pk)
 
     def delete(self, request, pk):
         article = get_object_or_404(Article, pk=pk)
-        # Delete file if exists
-        if article.pdf_file:
-            import os
-            if os.path.isfile(article.pdf_file.path):
-                os.remove(article.pdf_file.path)
+        # the PDF is released by library.signals; shared blobs stay on disk
         article.delete()
         return JsonResponse({}, status=204)
 
+class ArticlePdfView(View):
+    def get(self, request, pk):
+        """Download the article's PDF (Range requests, proxy offload, immutable when ?v= is current)"""
+        article = Article.objects.filter(pk=pk).values("title", "pdf_file").first()
+        if not article or not article["pdf_file"]:
+            return JsonResponse({"error": "PDF not found"}, status=404)
+        name = article["pdf_file"]
+        filename = f"{slugify(fold_name(article['title']))[:80] or 'article'}-{pk}.pdf"
+        immutable = request.GET.get("v") == downloads.pdf_version(name)
+        try:
+            return downloads.pdf_response(request, name, filename, immutable=immutable)
+        except Http404:
+            return JsonResponse({"error": "PDF not found"}, status=404)
+
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("articles")
+@cached_response("author-articles")
 class AuthorArticlesView(View):
     def get(self, request, pk):
+        fields = _parse_fields(request)
+        if isinstance(fields, JsonResponse):
+            return fields
         author = get_object_or_404(Author, pk=pk)
-        qs = author.articles.select_related('edition', 'edition__event').all().order_by('edition__year')
+        qs = _article_queryset(fields).filter(authors=author).annotate(edition_year=F('edition__year')).order_by('edition__year')
         # group by year
         grouped = {}
+        tags = {f"author:{author.id}"}
+        docs = Documents(fields)
         for art in qs:
-            year = art.edition.year
-            grouped.setdefault(year, []).append(_article_to_dict(art))
-        return JsonResponse(grouped)
+            year = art.edition_year
+            data = docs.article(art)
+            grouped.setdefault(year, []).append(data)
+            tags |= _article_cache_tags(art, data)
+        response = json_response(grouped)
+        response.cache_tags = tags
+        return response
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("articles", "authors")
+@cached_response("author-by-name")
 class AuthorByNameView(View):
     def get(self, request, author_name):
         """Get author and their articles by name slug"""
-        # Convert slug back to name (replace hyphens with spaces)
-        name = author_name.replace('-', ' ')
-        
+        fields = _parse_fields(request)
+        if isinstance(fields, JsonResponse):
+            return fields
+        # Normalize the slug the way Author.slug is built, so "Joao-Silva" or
+        # "joão-silva" still resolve; then it is a single unique-index lookup
         try:
-            # Try exact match first
-            author = Author.objects.get(name__iexact=name)
+            author = Author.objects.select_related("profile").get(slug=author_slug(author_name))
         except Author.DoesNotExist:
-            # Try partial match if exact doesn't work
-            authors = Author.objects.filter(name__icontains=name)
-            if not authors.exists():
-                return JsonResponse({"error": "Author not found"}, status=404)
-            author = authors.first()  # Take the first match
+            return JsonResponse({"error": "Author not found"}, status=404)
         
-        # Get articles grouped by year
-        qs = author.articles.select_related('edition', 'edition__event').all().order_by('-edition__year')
+        # The grouping by year (newest first) is materialized in the profile,
+        # so the articles are only fetched by primary key
+        profile = profiles.profile_for(author)
+        ids = [pk for _, year_ids in profile.articles_by_year for pk in year_ids]
+        found = _article_queryset(fields).in_bulk(ids)
         
         grouped_by_year = {}
-        total_articles = 0
-        
-        for article in qs:
-            year = article.edition.year
-            if year not in grouped_by_year:
-                grouped_by_year[year] = []
-            grouped_by_year[year].append(_article_to_dict(article))
-            total_articles += 1
-        
-        # Sort years in descending order
-        sorted_years = sorted(grouped_by_year.keys(), reverse=True)
-        
-        return JsonResponse({
-            "author": _author_to_dict(author),
-            "total_articles": total_articles,
-            "years": sorted_years,
+        # a slug only ever resolves to this author (slugs are unique)
+        tags = {f"author:{author.id}"}
+        docs = Documents(fields)
+        
+        for year, year_ids in profile.articles_by_year:
+            grouped_by_year[year] = []
+            for pk in year_ids:
+                if pk in found:
+                    data = docs.article(found[pk])
+                    grouped_by_year[year].append(data)
+                    tags |= _article_cache_tags(found[pk], data)
+        
+        response = json_response({
+            "author": docs.author(author),
+            "total_articles": profile.total_articles,
+            "coauthor_count": profile.coauthor_count,
+            "first_year": profile.first_year,
+            "last_year": profile.last_year,
+            "years": list(grouped_by_year),
             "articles_by_year": grouped_by_year
         })
+        response.cache_tags = tags
+        return response
+
+@method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("authors", "articles")
+class AuthorSuggestView(View):
+    def get(self, request):
+        """Name autocomplete: ?prefix=jo&limit=10, most published authors first"""
+        limit = request.GET.get("limit")
+        limit = search.SUGGEST_LIMIT if limit is None else _parse_int(limit)
+        if limit is None or not 1 <= limit <= search.SUGGEST_MAX_LIMIT:
+            return JsonResponse({"error": f"limit must be between 1 and {search.SUGGEST_MAX_LIMIT}"}, status=400)
+        authors = search.suggest_authors(request.GET.get("prefix", ""), limit)
+        return json_response([
+            {"id": a.id, "name": a.name, "slug": a.slug, "article_count": a.article_count} for a in authors
+        ])
 
 @method_decorator(csrf_exempt, name='dispatch')
 class SubscriptionCreateView(View):
@@ -498,22 +827,22 @@ class SubscriptionCreateView(View):
         }, status=201)
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("subscriptions")
 class SubscriptionListView(View):
     def get(self, request):
         subs = Subscription.objects.all().values('id', 'email', 'author_id', 'event_id', 'created_at')
         return JsonResponse(list(subs), safe=False)
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("events")
+@cached_response("event-list")
 class EventListCreateView(View):
     def get(self, request):
         events = Event.objects.all()
-        data = [{
-            "id": e.id, 
-            "name": e.name,
-            "sigla": e.sigla or "",
-            "entidade_promotora": e.entidade_promotora or ""
-        } for e in events]
-        return JsonResponse(data, safe=False)
+        data = [event_document(e) for e in events]
+        response = json_response(data)
+        response.cache_tags = {"events"}
+        return response
     
     def post(self, request):
         try:
@@ -538,15 +867,11 @@ class EventListCreateView(View):
         }, status=201)
 
 @method_decorator(csrf_exempt, name='dispatch')
+@conditional_get("event:{pk}")
 class EventDetailView(View):
     def get(self, request, pk):
         event = get_object_or_404(Event, pk=pk)
-        return JsonResponse({
-            "id": event.id, 
-            "name": event.name,
-            "sigla": event.sigla or "",
-            "entidade_promotora": event.entidade_promotora or ""
-        })
+        return json_response(event_document(event))
     
     def put(self, request, pk):
         try:
@@ -582,8 +907,9 @@ class BulkImportArticlesView(View):
         """Import multiple articles from BibTeX format"""
         try:
             if 'bibtex_file' in request.FILES:
-                # Handle file upload
-                bibtex_content = request.FILES['bibtex_file'].read().decode('utf-8')
+                # Handle file upload: parsed as a stream, never read whole
+                upload = request.FILES['bibtex_file']
+                bibtex_content = io.TextIOWrapper(upload, encoding='utf-8') if upload.size else ''
             elif request.POST.get('bibtex_content'):
                 # Handle FormData with bibtex_content as text field
                 bibtex_content = request.POST.get('bibtex_content')
@@ -638,367 +964,52 @@ class BulkImportArticlesView(View):
                 except Edition.MultipleObjectsReturned:
                     return JsonResponse({"error": f"Múltiplas edições encontradas para {event_name} {year}. Por favor, especifique edition_id."}, status=400)
             
-            # Handle ZIP file with PDFs
-            pdf_files = {}
-            if 'pdf_zip' in request.FILES:
-                pdf_files = self._extract_pdfs_from_zip(request.FILES['pdf_zip'])
-            
-            # Parse BibTeX entries
-            articles_data = self._parse_bibtex(bibtex_content)
+            # Large uploads can be queued for the run_import_jobs worker instead
+            if _is_true(request.POST.get('async', request.GET.get('async'))):
+                return self._enqueue(request, bibtex_content, edition)
             
-            created_articles = []
-            skipped_articles = []
-            processing_errors = []
-            
-            for entry_index, article_data in enumerate(articles_data, 1):
-                # Validate required fields
-                validation_result = self._validate_article_data(article_data, entry_index)
-                
-                if not validation_result['valid']:
-                    skipped_articles.append({
-                        'title': article_data.get('title', f'Entry #{entry_index}'),
-                        'reason': validation_result['reason'],
-                        'missing_fields': validation_result['missing_fields']
-                    })
-                    continue
-                
-                try:
-                    # Parse pages field (e.g., "1--11" or "1-11" or "100")
-                    pagina_inicial = None
-                    pagina_final = None
-                    pages_str = article_data.get('pages', '')
-                    if pages_str:
-                        # Try to split by -- or - or –
-                        pages_parts = re.split(r'[-–—]+', pages_str.strip())
-                        if len(pages_parts) >= 2:
-                            # Range format: "1--11" or "1-11"
-                            try:
-                                pagina_inicial = int(pages_parts[0].strip())
-                                pagina_final = int(pages_parts[1].strip())
-                            except ValueError:
-                                pass
-                        elif len(pages_parts) == 1 and pages_parts[0].strip():
-                            # Single page: "100"
-                            try:
-                                pagina_inicial = int(pages_parts[0].strip())
-                                pagina_final = pagina_inicial
-                            except ValueError:
-                                pass
-                    
-                    # Create article
-                    article = Article.objects.create(
-                        title=article_data.get('title', ''),
-                        abstract=article_data.get('abstract', ''),
-                        pdf_url=article_data.get('url', ''),
-                        edition=edition,
-                        bibtex=article_data.get('bibtex_entry', ''),
-                        pagina_inicial=pagina_inicial,
-                        pagina_final=pagina_final,
-                    )
-                    
-                    # Try to match PDF file from ZIP
-                    pdf_file = self._find_matching_pdf(article_data, pdf_files)
-                    if pdf_file:
-                        # Use the save method of FileField to properly save the file
-                        article.pdf_file.save(pdf_file['name'], pdf_file['content'], save=True)
-                    
-                    # Add authors
-                    authors = article_data.get('authors', [])
-                    for author_name in authors:
-                        if author_name.strip():
-                            author, _ = Author.objects.get_or_create(name=author_name.strip())
-                            article.authors.add(author)
-                    
-                    created_articles.append(_article_to_dict(article))
-                    
-                except Exception as e:
-                    processing_errors.append({
-                        'title': article_data.get('title', f'Entry #{entry_index}'),
-                        'reason': f"Erro no banco de dados: {str(e)}"
-                    })
-            
-            # Generate summary report
-            report = self._generate_import_report(created_articles, skipped_articles, processing_errors, pdf_files)
-            
-            return JsonResponse({
-                "success": True,
-                "created_count": len(created_articles),
-                "skipped_count": len(skipped_articles),
-                "error_count": len(processing_errors),
-                "articles": created_articles,
-                "skipped_articles": skipped_articles,
-                "processing_errors": processing_errors,
-                "report": report,
-                "pdf_matches": len([a for a in created_articles if a.get('pdf_url') and 'localhost:8000' in str(a.get('pdf_url', ''))])
-            }, status=201)
+            result = importer.run_import(bibtex_content, edition, request.FILES.get('pdf_zip'))
+            # an upload that could not be read to the end still committed its first entries
+            return JsonResponse({"success": result['complete'], **result}, status=201)
             
         except Exception as e:
             return JsonResponse({"error": f"Falha na importação: {str(e)}"}, status=400)
     
-    def _validate_article_data(self, article_data, entry_index):
-        """Validate that article has all required fields"""
-        # Map field names to Portuguese
-        field_translation = {
-            'title': 'título',
-            'year': 'ano',
-            'authors': 'autores',
-            'title (too short)': 'título (muito curto)',
-            'year (invalid range)': 'ano (fora do intervalo válido)',
-            'year (invalid format)': 'ano (formato inválido)'
-        }
-        
-        required_fields = ['title', 'year']  # Title and year are mandatory
-        recommended_fields = ['authors']  # Authors are highly recommended
-        
-        missing_required = []
-        missing_recommended = []
-        
-        # Check required fields
-        for field in required_fields:
-            value = article_data.get(field)
-            if not value or (isinstance(value, str) and not value.strip()):
-                missing_required.append(field)
-        
-        # Check recommended fields
-        for field in recommended_fields:
-            if not article_data.get(field) or (isinstance(article_data.get(field), list) and len(article_data.get(field)) == 0):
-                missing_recommended.append(field)
-        
-        # Validate title length (minimum meaningful length)
-        title = article_data.get('title', '').strip()
-        if title and len(title) < 3:
-            missing_required.append('title (too short)')
-        
-        # Validate year format
-        year = article_data.get('year')
-        if year:
-            try:
-                year_int = int(year)
-                if year_int < 1900 or year_int > 2030:
-                    missing_required.append('year (invalid range)')
-            except (ValueError, TypeError):
-                missing_required.append('year (invalid format)')
-        
-        # Generate validation result
-        if missing_required:
-            # Translate field names to Portuguese
-            translated_fields = [field_translation.get(field, field) for field in missing_required]
-            return {
-                'valid': False,
-                'reason': f"Campos obrigatórios em falta: {', '.join(translated_fields)}",
-                'missing_fields': missing_required + missing_recommended
-            }
-        
-        # Warn about missing recommended fields but don't skip
-        warnings = []
-        if missing_recommended:
-            translated_recommended = [field_translation.get(field, field) for field in missing_recommended]
-            warnings.append(f"Campos recomendados em falta: {', '.join(translated_recommended)}")
-        
-        return {
-            'valid': True,
-            'reason': None,
-            'missing_fields': missing_recommended,
-            'warnings': warnings
-        }
-    
-    def _generate_import_report(self, created_articles, skipped_articles, processing_errors, pdf_files):
-        """Generate a comprehensive import report"""
-        total_entries = len(created_articles) + len(skipped_articles) + len(processing_errors)
-        success_rate = (len(created_articles) / total_entries * 100) if total_entries > 0 else 0
-        
-        # Get actual PDF count from the special key
-        actual_pdf_count = pdf_files.get('__pdf_count__', 0)
-        
-        report = {
-            'summary': {
-                'total_entries_processed': total_entries,
-                'successful_imports': len(created_articles),
-                'skipped_entries': len(skipped_articles),
-                'processing_errors': len(processing_errors),
-                'success_rate': round(success_rate, 1),
-                'pdf_files_in_zip': actual_pdf_count,
-                'pdfs_successfully_matched': len([a for a in created_articles if a.get('pdf_url') and 'localhost:8000' in str(a.get('pdf_url', ''))])
-            },
-            'details': {
-                'skipped_breakdown': {},
-                'most_common_skip_reasons': []
-            }
-        }
-        
-        # Analyze skip reasons
-        skip_reasons = {}
-        for skipped in skipped_articles:
-            reason = skipped['reason']
-            skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
-        
-        report['details']['skipped_breakdown'] = skip_reasons
-        report['details']['most_common_skip_reasons'] = sorted(skip_reasons.items(), key=lambda x: x[1], reverse=True)
-        
-        return report
+    def _enqueue(self, request, bibtex_content, edition):
+        """Store the upload as a queued ImportJob; 202 with the URL to poll"""
+        job = ImportJob(edition=edition)
+        if 'bibtex_file' in request.FILES:
+            job.bibtex_file.save('import.bib', request.FILES['bibtex_file'], save=False)
+        else:
+            job.bibtex_file.save('import.bib', ContentFile(bibtex_content.encode('utf-8')), save=False)
+        if 'pdf_zip' in request.FILES:
+            job.pdf_zip.save('import.zip', request.FILES['pdf_zip'], save=False)
+        job.save()
+        return JsonResponse({
+            "success": True,
+            "job_id": job.pk,
+            "phase": job.phase,
+            "status_url": f"/api/import-jobs/{job.pk}/",
+        }, status=202)
 
-    def _extract_pdfs_from_zip(self, zip_file):
-        """Extract PDF files from uploaded ZIP"""
-        import zipfile
-        import os
-        from django.core.files.base import ContentFile
-        
-        pdf_files = {}
-        pdf_count = 0  # Track actual PDF file count
-        
-        try:
-            with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                for file_info in zip_ref.filelist:
-                    if file_info.filename.lower().endswith('.pdf'):
-                        # Extract PDF content
-                        pdf_content = zip_ref.read(file_info.filename)
-                        # Get just the filename without path
-                        filename = os.path.basename(file_info.filename)
-                        
-                        # Store as dict with content and name
-                        pdf_data = {
-                            'content': ContentFile(pdf_content, name=filename),
-                            'name': filename
-                        }
-                        
-                        # Store with full filename (e.g., "sbes-paper1.pdf")
-                        pdf_files[filename.lower()] = pdf_data
-                        
-                        # Also store without extension for matching (e.g., "sbes-paper1")
-                        name_without_ext = os.path.splitext(filename)[0].lower()
-                        pdf_files[name_without_ext] = pdf_data
-                        
-                        pdf_count += 1  # Increment actual file count
-                        
-        except Exception as e:
-            print(f"Error extracting ZIP: {e}")
-        
-        # Store the actual count in a special key
-        pdf_files['__pdf_count__'] = pdf_count
-        return pdf_files
-    
-    def _find_matching_pdf(self, article_data, pdf_files):
-        """Try to find a matching PDF file for the article"""
-        if not pdf_files:
-            return None
-        
-        # First, try to extract the BibTeX key from the entry
-        bibtex_entry = article_data.get('bibtex_entry', '')
-        bibtex_key = None
-        
-        # Extract the BibTeX key (e.g., "sbes-paper1" from "@inproceedings{sbes-paper1,")
-        key_match = re.search(r'@\w+\s*{\s*([^,\s]+)', bibtex_entry)
-        if key_match:
-            bibtex_key = key_match.group(1).strip()
-        
-        # Strategy 1: Try exact match with BibTeX key + .pdf
-        if bibtex_key:
-            exact_filename = f"{bibtex_key}.pdf".lower()
-            if exact_filename in pdf_files:
-                return pdf_files[exact_filename]
-            
-            # Also try the key without extension (in case it was stored that way)
-            if bibtex_key.lower() in pdf_files:
-                return pdf_files[bibtex_key.lower()]
-        
-        # Strategy 2: Try title-based matching (fallback)
-        title = article_data.get('title', '').lower()
-        
-        # Try different matching strategies based on title
-        possible_names = [
-            # Clean title (remove special characters)
-            re.sub(r'[^\w\s-]', '', title).replace(' ', '_'),
-            re.sub(r'[^\w\s-]', '', title).replace(' ', '-'),
-            re.sub(r'[^\w\s-]', '', title).replace(' ', ''),
-            # First few words of title
-            '_'.join(title.split()[:3]),
-            '-'.join(title.split()[:3]),
-            # Just first word
-            title.split()[0] if title.split() else '',
-        ]
-        
-        # Try to match with PDF files
-        for name in possible_names:
-            if name and name.lower() in pdf_files:
-                return pdf_files[name.lower()]
-                
-        # If no match found, try partial matching
-        for pdf_name in pdf_files.keys():
-            # First try BibTeX key partial match
-            if bibtex_key and bibtex_key.lower() in pdf_name.lower():
-                return pdf_files[pdf_name]
-            
-            # Then try title-based partial match
-            for name in possible_names:
-                if name and len(name) > 3 and name.lower() in pdf_name.lower():
-                    return pdf_files[pdf_name]
-                    
-        return None
+class ImportJobDetailView(View):
+    def get(self, request, pk):
+        """Phase and progress (processed/total) of a queued bulk import, with its summary once done"""
+        job = get_object_or_404(ImportJob, pk=pk)
+        return JsonResponse({
+            "id": job.pk,
+            "edition_id": job.edition_id,
+            "phase": job.phase,
+            "processed": job.processed,
+            "total": job.total,
+            "result": job.result,
+            "error": job.error or None,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+        })
 
-    def _parse_bibtex(self, bibtex_content):
-        """Parse BibTeX content and extract article information"""
-        articles = []
-        
-        # Split entries by @article, @inproceedings, etc.
-        entries = re.split(r'@\w+\s*{', bibtex_content)
-        
-        for entry in entries[1:]:  # Skip first empty split
-            if not entry.strip():
-                continue
-                
-            article_data = {
-                'title': '',
-                'authors': [],
-                'abstract': '',
-                'url': '',
-                'year': '',
-                'bibtex_entry': f"@article{{{entry}"
-            }
-            
-            # Extract title
-            title_match = re.search(r'title\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if title_match:
-                article_data['title'] = title_match.group(1).strip()
-            
-            # Extract authors
-            author_match = re.search(r'author\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if author_match:
-                authors_str = author_match.group(1)
-                # Split by "and" and clean up
-                authors = [a.strip() for a in re.split(r'\s+and\s+', authors_str) if a.strip()]
-                article_data['authors'] = authors
-            
-            # Extract year
-            year_match = re.search(r'year\s*=\s*[{"]?(\d{4})["}]?', entry, re.IGNORECASE)
-            if year_match:
-                article_data['year'] = year_match.group(1).strip()
-            
-            # Extract abstract
-            abstract_match = re.search(r'abstract\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if abstract_match:
-                article_data['abstract'] = abstract_match.group(1).strip()
-            
-            # Extract URL
-            url_match = re.search(r'url\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if url_match:
-                article_data['url'] = url_match.group(1).strip()
-            
-            # Extract booktitle (for inproceedings)
-            booktitle_match = re.search(r'booktitle\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if booktitle_match:
-                article_data['booktitle'] = booktitle_match.group(1).strip()
-            
-            # Extract journal (for articles)
-            journal_match = re.search(r'journal\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if journal_match:
-                article_data['journal'] = journal_match.group(1).strip()
-            
-            # Extract pages
-            pages_match = re.search(r'pages\s*=\s*[{"]([^"}]+)["}]', entry, re.IGNORECASE)
-            if pages_match:
-                article_data['pages'] = pages_match.group(1).strip()
-            
-            # Always add entry for processing (validation will handle missing fields)
-            articles.append(article_data)
-        
-        return articles
\ No newline at end of file
+class CacheStatsView(View):
+    def get(self, request):
+        """Response cache counters, for tuning (hits, misses, stores, evictions)"""
+        return JsonResponse(response_cache.stats())
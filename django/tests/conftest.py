@@ -0,0 +1,11 @@
+import pytest
+
+from library import response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Cached responses live in process memory and would leak between tests"""
+    response_cache.clear()
+    yield
+    response_cache.clear()
@@ -85,6 +85,22 @@ class TestAuthorModel(TestCase):
         author = Author.objects.create(name="Anonymous Author")
         self.assertEqual(author.email, "")
 
+    def test_author_slug_is_unique_and_stable(self):
+        """Test that slugs are folded, de-duplicated and follow renames"""
+        first = Author.objects.create(name="João da Silva")
+        second = Author.objects.create(name="Joao Da Silva")
+        self.assertEqual(first.slug, "joao-da-silva")
+        self.assertEqual(second.slug, "joao-da-silva-2")
+
+        second.email = "joao@example.com"
+        second.save()
+        self.assertEqual(second.slug, "joao-da-silva-2")
+
+        second.name = "Joana Silva"
+        second.save(update_fields=["name"])
+        second.refresh_from_db()
+        self.assertEqual(second.slug, "joana-silva")
+
 @pytest.mark.unit
 class TestArticleModel(TestCase):
     def test_article_creation(self):
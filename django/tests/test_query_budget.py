@@ -0,0 +1,215 @@
+"""Query budgets for every route in library/urls.py.
+
+Each route declares the calls to make and the maximum number of SQL queries
+each may run. Every call is measured twice, on a small and on a larger
+catalog, and must stay within its budget with the same query count on both:
+a count that grows with the number of rows is an N+1.
+
+Adding a route to library/urls.py without an entry in ROUTE_BUDGETS fails
+`test_every_route_has_a_budget`.
+"""
+import json
+import shutil
+import tempfile
+from collections import namedtuple
+
+import pytest
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from library import response_cache, urls
+from library.models import Article, Author, Edition, Event, ImportJob, Subscription
+
+# path/body take the Catalog and return the URL / JSON payload of one call
+Call = namedtuple("Call", "method path body budget", defaults=(None, 0))
+
+SMALL, LARGE = 3, 12
+
+
+class Catalog:
+    """Event, edition, author and article fixtures whose row counts scale"""
+
+    def __init__(self):
+        self.event = Event.objects.create(name="Budget Symposium", sigla="BUDGET")
+        self.author = Author.objects.create(name="Budget Author")
+        self.article = None
+        self.pdf = None
+        self.size = 0
+        self.serial = 0
+
+    def unique(self, prefix):
+        """A fresh name per call, so writes always take the same (create) path"""
+        self.serial += 1
+        return f"{prefix} {self.serial}"
+
+    def grow(self, size):
+        """Add articles (each with 3 authors) until the catalog holds `size` of them"""
+        for i in range(self.size, size):
+            edition = Edition.objects.create(event=self.event, year=2000 + i, location=f"City {i}")
+            for j in range(size):
+                article = Article.objects.create(title=f"Article {i}.{j}", abstract="Abstract", edition=edition)
+                coauthors = [Author.objects.create(name=f"Coauthor {i}.{j}.{k}") for k in range(2)]
+                article.authors.add(self.author, *coauthors)
+                Subscription.objects.create(email=f"reader{i}.{j}@example.com", author=coauthors[0])
+            self.article = article
+        self.size = size
+
+    def article_ids(self):
+        """Every article id, newest first, plus one that does not exist"""
+        return list(Article.objects.order_by("-id").values_list("id", flat=True)) + [0]
+
+    def new_event(self):
+        return Event.objects.create(name=f"Disposable {Event.objects.count()}")
+
+    def new_edition(self):
+        return Edition.objects.create(event=self.event, year=1900 + Edition.objects.count())
+
+    def new_article(self):
+        article = Article.objects.create(title="Disposable", edition=self.article.edition)
+        article.authors.add(self.author)
+        return article
+
+    def pdf_article(self):
+        """The article carrying a PDF, created on first use"""
+        if self.pdf is None:
+            self.pdf = Article.objects.create(title="With PDF", edition=self.article.edition)
+            self.pdf.pdf_file.save("budget.pdf", ContentFile(b"%PDF-1.4 budget"))
+        return self.pdf
+
+    def import_job(self):
+        return ImportJob.objects.create(edition=self.article.edition)
+
+
+BIBTEX = """
+@inproceedings{budget1,
+  title = {Budgeted Import One},
+  author = {Budget Author and %s},
+  booktitle = {Budget Symposium},
+  year = {2024},
+  pages = {1--10}
+}
+"""
+
+ROUTE_BUDGETS = {
+    "event-list-create": [
+        Call("get", lambda c: "/api/events/", budget=2),
+        Call("post", lambda c: "/api/events/", lambda c: {"name": c.unique("New Event")}, budget=6),
+    ],
+    "event-detail": [
+        Call("get", lambda c: f"/api/events/{c.event.id}/", budget=2),
+        Call("put", lambda c: f"/api/events/{c.new_event().id}/", lambda c: {"name": "Renamed"}, budget=3),
+        Call("delete", lambda c: f"/api/events/{c.new_event().id}/", budget=7),
+    ],
+    "edition-list-create": [
+        Call("get", lambda c: "/api/editions/", budget=2),
+        Call("get", lambda c: f"/api/editions/?event_id={c.event.id}&year_from=2001", budget=2),
+        Call("post", lambda c: "/api/editions/", lambda c: {"event_id": c.event.id, "year": 1800}, budget=7),
+    ],
+    "edition-detail": [
+        Call("get", lambda c: f"/api/editions/{c.article.edition_id}/", budget=2),
+        Call("put", lambda c: f"/api/editions/{c.new_edition().id}/", lambda c: {"location": "Elsewhere"}, budget=5),
+        Call("delete", lambda c: f"/api/editions/{c.new_edition().id}/", budget=6),
+    ],
+    "article-list-create": [
+        Call("get", lambda c: "/api/articles/", budget=2),
+        Call("get", lambda c: "/api/articles/?paginate=false", budget=2),
+        Call("get", lambda c: "/api/articles/?author=budget&fields=id,title,authors", budget=2),
+        Call("get", lambda c: "/api/articles/?q=article", budget=2),
+        Call("get", lambda c: f"/api/articles/?event={c.event.name}&year_from=2001", budget=2),
+        Call("get", lambda c: "/api/articles/?author=budget&facets=event,year,author", budget=6),
+        Call("get", lambda c: f"/api/articles/?ids={','.join(map(str, c.article_ids()))}", budget=2),
+        Call("post", lambda c: "/api/articles/", lambda c: {
+            "title": "Posted", "edition_id": c.article.edition_id, "authors": ["Budget Author", c.unique("New Author")],
+        }, budget=44),
+    ],
+    "article-detail": [
+        Call("get", lambda c: f"/api/articles/{c.article.id}/", budget=2),
+        Call("put", lambda c: f"/api/articles/{c.new_article().id}/", lambda c: {
+            "title": "Edited", "authors": ["Budget Author", c.unique("New Author")],
+        }, budget=38),
+        Call("delete", lambda c: f"/api/articles/{c.new_article().id}/", budget=11),
+    ],
+    "bulk-import-articles": [
+        Call("post", lambda c: "/api/articles/bulk-import/", lambda c: {
+            "bibtex_content": BIBTEX % c.unique("Imported Author"), "edition_id": c.article.edition_id,
+        }, budget=23),
+        Call("post", lambda c: "/api/articles/bulk-import/?async=1", lambda c: {
+            "bibtex_content": BIBTEX % c.unique("Queued Author"), "edition_id": c.article.edition_id,
+        }, budget=2),
+    ],
+    "import-job-detail": [
+        Call("get", lambda c: f"/api/import-jobs/{c.import_job().id}/", budget=1),
+    ],
+    "article-pdf": [
+        Call("get", lambda c: f"/api/articles/{c.pdf_article().id}/pdf/", budget=1),
+    ],
+    "article-batch": [
+        Call("post", lambda c: "/api/articles/batch/", lambda c: {"ids": c.article_ids()}, budget=1),
+    ],
+    "author-articles": [
+        Call("get", lambda c: f"/api/authors/{c.author.id}/articles/", budget=3),
+    ],
+    "author-suggest": [
+        Call("get", lambda c: "/api/authors/suggest/?prefix=co", budget=3),
+    ],
+    "author-by-name": [
+        Call("get", lambda c: "/api/authors/budget-author/", budget=3),
+    ],
+    "subscription-create": [
+        Call("post", lambda c: "/api/subscriptions/", lambda c: {"email": c.unique("reader").replace(" ", "") + "@example.com", "name": "Budget Author"}, budget=8),
+    ],
+    "subscription-list": [
+        Call("get", lambda c: "/api/subscriptions/list/", budget=2),
+    ],
+    "cache-stats": [
+        Call("get", lambda c: "/api/cache-stats/", budget=0),
+    ],
+}
+
+
+def count_queries(client, catalog, call):
+    """Run one call against a cold response cache; returns (status, queries)"""
+    path = call.path(catalog)
+    body = call.body(catalog) if call.body else None
+    response_cache.clear()
+    with CaptureQueriesContext(connection) as ctx:
+        response = getattr(client, call.method)(
+            path, data=json.dumps(body) if body is not None else None, content_type="application/json"
+        )
+    response.close()
+    return response.status_code, len(ctx.captured_queries)
+
+
+@pytest.mark.integration
+class TestQueryBudgets(TestCase):
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.client = Client()
+        self.catalog = Catalog()
+
+    def test_every_route_has_a_budget(self):
+        """Test that no route in library/urls.py is left unmeasured"""
+        names = {pattern.name for pattern in urls.urlpatterns}
+        self.assertEqual(names - set(ROUTE_BUDGETS), set())
+
+    def test_routes_stay_within_budget_as_data_grows(self):
+        """Test every call against its budget on a small and a larger catalog"""
+        measured = {}
+        for size in (SMALL, LARGE):
+            self.catalog.grow(size)
+            for name, calls in ROUTE_BUDGETS.items():
+                for call in calls:
+                    status, queries = count_queries(self.client, self.catalog, call)
+                    label = f"{call.method.upper()} {name} {call.path(self.catalog)}"
+                    self.assertLess(status, 400, label)
+                    measured.setdefault((name, call), []).append(queries)
+                    self.assertLessEqual(queries, call.budget, f"{label}: {queries} queries")
+
+        for (name, call), (small, large) in measured.items():
+            self.assertEqual(small, large, f"{call.method.upper()} {name}: {small} -> {large} queries")
@@ -0,0 +1,188 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client
+from library.models import Article, Author, AuthorNameToken
+from library import search
+from tests.factories import ArticleFactory, AuthorFactory
+
+@pytest.mark.integration
+class TestFullTextSearch(TestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def search_ids(self, query):
+        response = self.client.get('/api/articles/', {'q': query, 'paginate': 'false'})
+        self.assertEqual(response.status_code, 200)
+        return [a['id'] for a in response.json()]
+
+    def test_search_matches_title_abstract_and_authors(self):
+        """Test GET /api/articles/?q= searches title, abstract and author names"""
+        by_title = ArticleFactory(title="Mutation Testing at Scale", abstract="")
+        by_abstract = ArticleFactory(title="Another Study", abstract="We apply mutation analysis.")
+        by_author = ArticleFactory(title="Unrelated", abstract="", authors=[AuthorFactory(name="Ana Mutation")])
+        other = ArticleFactory(title="Code Review", abstract="Nothing here")
+
+        ids = self.search_ids("mutation")
+
+        self.assertCountEqual(ids, [by_title.id, by_abstract.id, by_author.id])
+        self.assertNotIn(other.id, ids)
+
+    def test_title_hits_rank_above_abstract_hits(self):
+        """Test that BM25 weights favour title matches"""
+        in_abstract = ArticleFactory(title="A Study", abstract="Flaky tests are common.")
+        in_title = ArticleFactory(title="Flaky Tests in CI", abstract="")
+
+        self.assertEqual(self.search_ids("flaky"), [in_title.id, in_abstract.id])
+
+    def test_search_is_accent_insensitive_and_safe(self):
+        """Test accent folding and that FTS syntax in the input is harmless"""
+        article = ArticleFactory(title="Engenharia de Requisitos Ágeis")
+
+        self.assertEqual(self.search_ids("ageis"), [article.id])
+        self.assertEqual(self.search_ids('"ageis* ('), [article.id])
+        self.assertEqual(self.search_ids('***'), [])
+
+    def test_index_follows_updates_author_changes_and_deletes(self):
+        """Test that saves, author edits and deletes keep the index in sync"""
+        author = AuthorFactory(name="Carla Souza")
+        article = ArticleFactory(title="Old Title", abstract="Legacy systems.", authors=[author])
+
+        article.title = "Refactoring Legacy Code"
+        article.save()
+        self.assertEqual(self.search_ids("refactoring"), [article.id])
+        self.assertEqual(self.search_ids("old"), [])
+
+        author.name = "Carla Pereira"
+        author.save()
+        self.assertEqual(self.search_ids("pereira"), [article.id])
+
+        article.authors.clear()
+        self.assertEqual(self.search_ids("pereira"), [])
+
+        article.delete()
+        self.assertEqual(self.search_ids("refactoring"), [])
+
+    def test_search_results_are_cursor_paginated(self):
+        """Test that ranked search results can be paged with the cursor"""
+        articles = [ArticleFactory(title=f"Fuzzing Study {i}") for i in range(3)]
+
+        first = self.client.get('/api/articles/', {'q': 'fuzzing', 'limit': 2}).json()
+        second = self.client.get('/api/articles/', {'q': 'fuzzing', 'limit': 2, 'cursor': first['next_cursor']}).json()
+
+        ids = [a['id'] for a in first['results'] + second['results']]
+        self.assertCountEqual(ids, [a.id for a in articles])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_rebuild_command_restores_index(self):
+        """Test the rebuild_search_index management command"""
+        article = ArticleFactory(title="Continuous Integration Pipelines")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {search.FTS_TABLE}")
+        self.assertEqual(self.search_ids("pipelines"), [])
+        etag = self.client.get('/api/articles/', {'q': 'pipelines'})['ETag']
+
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        self.assertEqual(self.search_ids("pipelines"), [article.id])
+        self.assertEqual(self.client.get('/api/articles/', {'q': 'pipelines'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@pytest.mark.integration
+class TestAuthorTokenFilter(TestCase):
+    def setUp(self):
+        self.client = Client()
+
+    def author_ids(self, term):
+        response = self.client.get('/api/articles/', {'author': term, 'paginate': 'false'})
+        self.assertEqual(response.status_code, 200)
+        return {a['id'] for a in response.json()}
+
+    def test_tokens_follow_author_create_and_rename(self):
+        """Test that name tokens are written on create and replaced on rename"""
+        author = AuthorFactory(name="Maria da Silva")
+        self.assertEqual(
+            set(AuthorNameToken.objects.filter(author=author).values_list('token', flat=True)),
+            {"maria", "da", "silva"},
+        )
+
+        author.name = "Maria Santos"
+        author.save()
+        self.assertEqual(
+            set(AuthorNameToken.objects.filter(author=author).values_list('token', flat=True)),
+            {"maria", "santos"},
+        )
+
+    def test_multi_word_terms_keep_phrase_semantics(self):
+        """Test that 'John Smith' matches the phrase, not just both words"""
+        exact = ArticleFactory(authors=[AuthorFactory(name="John Smith")])
+        swapped = ArticleFactory(authors=[AuthorFactory(name="Smith John")])
+        hyphen = ArticleFactory(authors=[AuthorFactory(name="Anne Smith-Jones")])
+
+        self.assertEqual(self.author_ids("john smith"), {exact.id})
+        self.assertEqual(self.author_ids("Smith-Jones"), {hyphen.id})
+        self.assertEqual(self.author_ids("smith"), {exact.id, swapped.id, hyphen.id})
+
+@pytest.mark.integration
+class TestAuthorSuggest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.joao = AuthorFactory(name="João Silva")
+        self.joana = AuthorFactory(name="Joana Alves")
+        self.jose = AuthorFactory(name="José Lima")
+        self.mary = AuthorFactory(name="Mary Jones")
+        for _ in range(2):
+            ArticleFactory(authors=[self.joana])
+        ArticleFactory(authors=[self.joao, self.joana])
+
+    def suggest(self, prefix, **params):
+        response = self.client.get('/api/authors/suggest/', {'prefix': prefix, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_prefix_is_case_and_accent_insensitive(self):
+        """Test GET /api/authors/suggest/?prefix= folds case and accents"""
+        self.assertEqual([a['name'] for a in self.suggest('JOA')], ["Joana Alves", "João Silva"])
+        self.assertEqual([a['name'] for a in self.suggest('joão s')], ["João Silva"])
+        self.assertEqual({a['name'] for a in self.suggest('jo')}, {"Joana Alves", "João Silva", "José Lima"})
+        self.assertEqual(self.suggest('  '), [])
+
+    def test_ranked_by_article_count_with_limit(self):
+        """Test that suggestions come most published first and honour ?limit="""
+        data = self.suggest('jo', limit=2)
+
+        self.assertEqual([(a['id'], a['article_count']) for a in data], [(self.joana.id, 3), (self.joao.id, 1)])
+        self.assertEqual(self.client.get('/api/authors/suggest/', {'prefix': 'jo', 'limit': 0}).status_code, 400)
+
+    def test_article_counts_follow_authorship_changes(self):
+        """Test that adding, removing, clearing and deleting keep article_count current"""
+        def count(author):
+            return Author.objects.get(pk=author.pk).article_count
+
+        article = ArticleFactory(authors=[self.jose])
+        self.assertEqual(count(self.jose), 1)
+        self.mary.articles.add(article)
+        self.assertEqual(count(self.mary), 1)
+        article.authors.remove(self.jose)
+        self.assertEqual(count(self.jose), 0)
+        article.authors.clear()
+        self.assertEqual(count(self.mary), 0)
+
+        article.authors.add(self.jose, self.mary)
+        article.delete()
+        self.assertEqual((count(self.jose), count(self.mary)), (0, 0))
+
+        self.joana.articles.clear()
+        self.assertEqual(count(self.joana), 0)
+
+    def test_bulk_created_authors_are_folded(self):
+        """Test that bulk_create fills name_key and the rebuild command restores counts"""
+        Author.objects.bulk_create([Author(name="Álvaro Núñez")])
+        Author.objects.update(article_count=0)
+
+        call_command('rebuild_search_index', stdout=StringIO())
+
+        self.assertEqual(Author.objects.get(name="Álvaro Núñez").name_key, "alvaro nunez")
+        self.assertEqual(Author.objects.get(pk=self.joana.pk).article_count, 3)
+
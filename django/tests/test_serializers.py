@@ -1,10 +1,15 @@
+import datetime
+import json
+
 import pytest
+from django.core.serializers.json import DjangoJSONEncoder
 from django.test import TestCase
 from library.serializers import (
     EventSerializer, EditionSerializer, AuthorSerializer, 
     ArticleSerializer, SubscriptionSerializer
 )
 from library.models import Event, Edition, Article, Author, Subscription
+from library import payloads
 from tests.factories import EventFactory, EditionFactory, ArticleFactory, AuthorFactory, SubscriptionFactory
 
 
@@ -214,3 +219,68 @@ class TestSubscriptionSerializer(TestCase):
         self.assertEqual(subscription.email, "subscriber@example.com")
         self.assertEqual(subscription.author, author)
         self.assertIsNone(subscription.event)
+
+
+@pytest.mark.unit
+class TestPayloadDocuments(TestCase):
+    def test_shared_sub_documents_are_built_once(self):
+        """Test that articles of one edition share a single edition document"""
+        edition = EditionFactory()
+        author = AuthorFactory()
+        for _ in range(3):
+            ArticleFactory(edition=edition, authors=[author])
+        articles = list(Article.objects.select_related("edition__event").prefetch_related("authors"))
+
+        docs = payloads.Documents()
+        data = docs.articles(articles)
+
+        self.assertIs(data[0]['edition'], data[1]['edition'])
+        self.assertIs(data[0]['edition']['event'], data[2]['edition']['event'])
+        self.assertIs(data[0]['authors'][0], data[1]['authors'][0])
+        self.assertEqual(data[0]['edition']['event']['name'], edition.event.name)
+
+    def test_clear_forgets_memoized_documents(self):
+        """Test that clear() drops the shared sub-documents but keeps building equal ones"""
+        article = ArticleFactory(authors=[AuthorFactory()])
+        docs = payloads.Documents()
+        before = docs.article(article)
+
+        docs.clear()
+        after = docs.article(article)
+
+        self.assertEqual(before, after)
+        self.assertIsNot(before['edition'], after['edition'])
+        self.assertIsNot(before['edition']['event'], after['edition']['event'])
+
+    def test_fields_restrict_the_document(self):
+        """Test that only the requested fields are built, in output order"""
+        article = ArticleFactory()
+
+        data = payloads.Documents({'title', 'id'}).article(article)
+
+        self.assertEqual(list(data), ['id', 'title'])
+
+    def test_full_document_matches_field_builders(self):
+        """Test that the unrestricted fast path builds the same document as ?fields=<all>"""
+        article = ArticleFactory()
+
+        full = payloads.Documents().article(article)
+        every_field = payloads.Documents(set(payloads.ARTICLE_FIELDS)).article(article)
+
+        self.assertEqual(list(full), list(payloads.ARTICLE_FIELDS))
+        self.assertEqual(full, every_field)
+
+        compact = payloads.Documents(compact=True)
+        compact_every_field = payloads.Documents(set(payloads.ARTICLE_FIELDS), compact=True)
+        self.assertEqual(compact.article(article), compact_every_field.article(article))
+        self.assertEqual(compact.included(), compact_every_field.included())
+
+    def test_dumps_matches_stdlib_encoding(self):
+        """Test that the fast encoder agrees with JsonResponse on keys and dates"""
+        data = {
+            2024: [{"title": "Ação", "created_at": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456)}],
+            None: [],
+        }
+
+        self.assertEqual(json.loads(payloads.dumps(data)), json.loads(json.dumps(data, cls=DjangoJSONEncoder)))
+
@@ -1,10 +1,14 @@
 import pytest
-from django.test import TestCase
+from django.test import Client, TestCase
 from django.core import mail
+from django.core.management import call_command
 from django.utils import timezone
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch, MagicMock
-from library.models import Article, Author, Event, Edition, Subscription
+from library.models import Article, Author, AuthorProfile, Event, Edition, Subscription
+from library import snapshots
+from library.serializers import ArticleSerializer
 from library.signals import send_notification_email
 from tests.factories import ArticleFactory, AuthorFactory, EventFactory, EditionFactory, SubscriptionFactory
 
@@ -318,3 +322,164 @@ class TestArticleSignals(TestCase):
         
         # No notification should be sent yet
         self.assertEqual(len(mail.outbox), 0)
+
+
+@pytest.mark.integration
+class TestAuthorProfileSignals(TestCase):
+    def setUp(self):
+        event = EventFactory()
+        self.old = EditionFactory(event=event, year=2019)
+        self.new = EditionFactory(event=event, year=2023)
+        self.ana = AuthorFactory(name="Ana Profile")
+        self.bia = AuthorFactory(name="Bia Profile")
+        self.caio = AuthorFactory(name="Caio Profile")
+
+    def profile(self, author):
+        return AuthorProfile.objects.get(author=author)
+
+    def test_authorship_changes_update_articles_and_coauthors(self):
+        """Test that adding, removing and clearing authors keep every profile current"""
+        first = Article.objects.create(title="First", edition=self.old)
+        second = Article.objects.create(title="Second", edition=self.new)
+        first.authors.add(self.ana, self.bia)
+        second.authors.add(self.ana, self.caio)
+        
+        profile = self.profile(self.ana)
+        self.assertEqual(profile.articles_by_year, [[2023, [second.id]], [2019, [first.id]]])
+        self.assertEqual((profile.total_articles, profile.coauthor_count), (2, 2))
+        self.assertEqual((profile.first_year, profile.last_year), (2019, 2023))
+        self.assertEqual(self.profile(self.bia).coauthor_count, 1)
+        
+        second.authors.remove(self.caio)
+        self.assertEqual(self.profile(self.ana).coauthor_count, 1)
+        self.assertEqual(self.profile(self.caio).total_articles, 0)
+        
+        first.authors.clear()
+        self.assertEqual(self.profile(self.ana).articles_by_year, [[2023, [second.id]]])
+        self.assertEqual(self.profile(self.bia).total_articles, 0)
+        
+        self.caio.articles.add(first, second)
+        self.assertEqual(self.profile(self.ana).coauthor_count, 1)
+        self.assertEqual(self.profile(self.caio).total_articles, 2)
+
+    def test_edition_and_deletes_update_profiles(self):
+        """Test that year changes and article/author deletion are reflected"""
+        article = Article.objects.create(title="Moved", edition=self.old)
+        article.authors.add(self.ana, self.bia)
+        
+        self.old.year = 2015
+        self.old.save()
+        self.assertEqual(self.profile(self.ana).first_year, 2015)
+        
+        article.edition = None
+        article.save()
+        self.assertEqual(self.profile(self.ana).articles_by_year, [[None, [article.id]]])
+        
+        self.bia.delete()
+        self.assertEqual(self.profile(self.ana).coauthor_count, 0)
+        
+        article.delete()
+        profile = self.profile(self.ana)
+        self.assertEqual((profile.total_articles, profile.articles_by_year, profile.first_year), (0, [], None))
+
+    def test_rebuild_command_matches_incremental_profiles(self):
+        """Test that rebuild_author_profiles reproduces the signal-maintained rows"""
+        for i, edition in enumerate([self.old, self.new, None]):
+            article = Article.objects.create(title=f"Paper {i}", edition=edition)
+            article.authors.add(self.ana, *([self.bia] if i else [self.caio]))
+        columns = ("author_id", "articles_by_year", "total_articles", "coauthor_count", "first_year", "last_year")
+        incremental = list(AuthorProfile.objects.order_by("author_id").values_list(*columns))
+        
+        etag = Client().get(f'/api/authors/{self.ana.slug}/')['ETag']
+        
+        AuthorProfile.objects.all().delete()
+        call_command('rebuild_author_profiles', stdout=StringIO())
+        self.assertEqual(list(AuthorProfile.objects.order_by("author_id").values_list(*columns)), incremental)
+        self.assertEqual(Client().get(f'/api/authors/{self.ana.slug}/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@pytest.mark.integration
+class TestAuthorSnapshotSignals(TestCase):
+    def names(self, article):
+        return [a['name'] for a in Article.objects.get(pk=article.pk).author_snapshot]
+
+    def test_snapshot_follows_authorship_and_author_changes(self):
+        """Test that the stored author snapshot tracks adds, removals, renames and deletes"""
+        ana = AuthorFactory(name="Ana Snapshot", email="ana@example.com")
+        bia = AuthorFactory(name="Bia Snapshot", email="")
+        article = Article.objects.create(title="Snapshot Paper")
+        
+        article.authors.add(ana)
+        article.authors.add(bia)
+        self.assertEqual(Article.objects.get(pk=article.pk).author_snapshot, [
+            {"id": ana.id, "name": "Ana Snapshot", "email": "ana@example.com", "slug": "ana-snapshot"},
+            {"id": bia.id, "name": "Bia Snapshot", "email": None, "slug": "bia-snapshot"},
+        ])
+        # the in-memory instance is refreshed as well
+        self.assertEqual([a['name'] for a in article.author_snapshot], ["Ana Snapshot", "Bia Snapshot"])
+        
+        ana.name = "Ana Renamed"
+        ana.save()
+        self.assertEqual(self.names(article), ["Ana Renamed", "Bia Snapshot"])
+        self.assertEqual(Article.objects.get(pk=article.pk).author_snapshot[0]['slug'], "ana-renamed")
+        
+        bia.articles.remove(article)
+        self.assertEqual(self.names(article), ["Ana Renamed"])
+        
+        ana.delete()
+        self.assertEqual(self.names(article), [])
+
+    def test_saving_a_stale_instance_keeps_the_snapshot(self):
+        """Test that Article.save() never writes an outdated in-memory snapshot"""
+        article = Article.objects.create(title="Snapshot Paper")
+        stale = Article.objects.get(pk=article.pk)
+        article.authors.add(AuthorFactory(name="Late Author"))
+        
+        stale.title = "Edited elsewhere"
+        stale.save()
+        
+        fresh = Article.objects.get(pk=article.pk)
+        self.assertEqual(fresh.title, "Edited elsewhere")
+        self.assertEqual([a['name'] for a in fresh.author_snapshot], ["Late Author"])
+
+    def test_saving_an_instance_whose_row_was_deleted_inserts_it(self):
+        """Test that Article.save() still falls back to an insert when the row is gone"""
+        article = ArticleFactory(authors=[AuthorFactory(name="Gone Author")])
+        Article.objects.filter(pk=article.pk).delete()
+        
+        article.title = "Saved again"
+        article.save()
+        
+        saved = Article.objects.get(pk=article.pk)
+        self.assertEqual(saved.title, "Saved again")
+        # its authorship links went with the deleted row
+        self.assertEqual(saved.author_snapshot, [])
+
+    def test_serializer_update_refreshes_snapshot(self):
+        """Test that ArticleSerializer.update keeps the snapshot in sync"""
+        article = ArticleFactory(authors=[AuthorFactory(name="Old Author")])
+        serializer = ArticleSerializer()
+        serializer.update(article, {"title": "Updated", "authors": [{"name": "New Author"}]})
+        
+        self.assertEqual(self.names(article), ["New Author"])
+
+    def test_verify_command_detects_and_repairs_drift(self):
+        """Test that verify_author_snapshots reports and fixes a tampered snapshot"""
+        article = ArticleFactory(authors=[AuthorFactory(name="True Author")])
+        Article.objects.filter(pk=article.pk).update(author_snapshot=[{"id": 0, "name": "Ghost", "email": None}])
+        out = StringIO()
+        
+        call_command('verify_author_snapshots', stdout=out)
+        self.assertIn('1 articles have a stale author snapshot', out.getvalue())
+        self.assertEqual(self.names(article), ["Ghost"])
+        # the drifted payload is now cached and has an ETag
+        client = Client()
+        stale = client.get(f'/api/articles/{article.pk}/')
+        self.assertEqual([a['name'] for a in stale.json()['authors']], ["Ghost"])
+        
+        call_command('verify_author_snapshots', '--repair', stdout=out)
+        self.assertEqual(self.names(article), ["True Author"])
+        self.assertEqual(snapshots.find_drift(), [])
+        response = client.get(f'/api/articles/{article.pk}/', HTTP_IF_NONE_MATCH=stale['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([a['name'] for a in response.json()['authors']], ["True Author"])
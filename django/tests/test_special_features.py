@@ -2,10 +2,24 @@ import pytest
 import json
 import zipfile
 import io
-from django.test import TestCase, Client
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.core.files.base import ContentFile
 from django.core.files.uploadedfile import SimpleUploadedFile
-from library.models import Event, Edition, Article, Author
-from tests.factories import EventFactory, EditionFactory, AuthorFactory, ArticleFactory
+from django.utils import timezone
+from library import bibtex, snapshots
+from library.models import Event, Edition, Article, Author, AuthorProfile, ImportJob, StoredPdf
+from tests.factories import EventFactory, EditionFactory, AuthorFactory, ArticleFactory, SubscriptionFactory
 
 @pytest.mark.integration
 class TestBulkImportView(TestCase):
@@ -64,6 +78,113 @@ class TestBulkImportView(TestCase):
         self.assertIn("John Doe", author_names)
         self.assertIn("Jane Smith", author_names)
     
+    def test_bulk_import_nested_braces_and_macros(self):
+        """Test that nested braces, @string macros and # concatenation survive the import"""
+        bibtex_content = """
+        @string{ml = "Machine Learning"}
+        @comment{ @inproceedings{ignored, title={Not an entry}, year={2024}} }
+        @inproceedings{bayes,
+            booktitle = {Proceedings on {AI}},
+            title = {{B}ayesian Methods for } # ml,
+            author = {John Doe and {Barnes and Noble} and Jane Smith},
+            year = 2024,
+            pages = "1--9"
+        }
+        """
+        
+        bibtex_file = SimpleUploadedFile("refs.bib", bibtex_content.encode(), content_type="text/plain")
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_file': bibtex_file,
+            'edition_id': self.edition.id
+        })
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created_count'], 1)
+        article = Article.objects.get()
+        self.assertEqual(article.title, "Bayesian Methods for Machine Learning")
+        self.assertEqual(article.pagina_final, 9)
+        self.assertEqual(
+            [a["name"] for a in article.author_snapshot], ["John Doe", "Barnes and Noble", "Jane Smith"]
+        )
+        self.assertTrue(article.bibtex.startswith('@inproceedings{bayes,'))
+        self.assertTrue(article.bibtex.endswith('}'))
+    
+    def _entries(self, count, prefix):
+        return "".join(
+            f"@inproceedings{{{prefix}{i}, title={{{prefix} Paper {i}}}, author={{{prefix} Author {i} and Shared Author}}, year={{2024}}}}\n"
+            for i in range(count)
+        )
+
+    def test_bulk_import_queries_do_not_grow_with_entries(self):
+        """Test that a batch costs the same number of queries for 3 or 30 entries"""
+        counts = []
+        for count, prefix in ((3, "small"), (30, "large")):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.post('/api/articles/bulk-import/', data={
+                    'bibtex_content': self._entries(count, prefix), 'edition_id': self.edition.id
+                })
+            self.assertEqual(response.json()['created_count'], count)
+            counts.append(len(ctx.captured_queries))
+        
+        self.assertEqual(counts[0], counts[1])
+
+    def test_bulk_import_keeps_derived_data_in_sync(self):
+        """Test that bulk-created articles are indexed, counted, snapshotted and notified"""
+        SubscriptionFactory(email="fan@example.com", author=AuthorFactory(name="Shared Author"), event=None)
+        mail.outbox = []
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/articles/bulk-import/', data={
+                'bibtex_content': self._entries(2, "sync"), 'edition_id': self.edition.id
+            })
+        
+        self.assertEqual(response.json()['created_count'], 2)
+        shared = Author.objects.get(name="Shared Author")
+        self.assertEqual(Author.objects.filter(name="Shared Author").count(), 1)
+        self.assertEqual(shared.article_count, 2)
+        self.assertEqual(AuthorProfile.objects.get(author=shared).total_articles, 2)
+        self.assertEqual(snapshots.find_drift(), [])
+        article = Article.objects.get(title="sync Paper 1")
+        self.assertEqual([a["name"] for a in article.author_snapshot], ["sync Author 1", "Shared Author"])
+        found = self.client.get('/api/articles/?q=sync').json()
+        self.assertEqual(len(found['results']), 2)
+        self.assertIsNone(found['next_cursor'])
+        self.assertEqual(sorted(m.subject for m in mail.outbox), [
+            "Novo artigo disponibilizado: sync Paper 0", "Novo artigo disponibilizado: sync Paper 1",
+        ])
+
+    def test_bulk_import_unreadable_tail_reports_committed_entries(self):
+        """Test that a decoding error past the first chunk returns the summary of the entries already imported"""
+        content = self._entries(3, "head").encode('utf-8') + b"%" * 70000 + b"\n@inproceedings{bad, title={\xff}}\n"
+        
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_file': SimpleUploadedFile("refs.bib", content, content_type="text/plain"),
+            'edition_id': self.edition.id,
+        })
+        
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual((data['success'], data['complete'], data['created_count'], data['error_count']), (False, False, 3, 1))
+        self.assertIn("utf-8", data['error'])
+        self.assertEqual(data['processing_errors'][0]['title'], "Entry #4")
+        self.assertEqual(Article.objects.count(), 3)
+
+    def test_bulk_import_reports_failing_entry_and_keeps_batch(self):
+        """Test that an entry the database rejects is reported while the rest of its batch is created"""
+        bibtex_content = self._entries(2, "ok") + (
+            "@inproceedings{huge, title={Huge Pages}, author={Ana}, year={2024}, pages={1--100000000000000000000}}\n"
+        )
+        
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_content': bibtex_content, 'edition_id': self.edition.id
+        })
+        
+        data = response.json()
+        self.assertEqual((data['created_count'], data['error_count']), (2, 1))
+        self.assertEqual(data['processing_errors'][0]['title'], "Huge Pages")
+        self.assertEqual(set(Article.objects.values_list('title', flat=True)), {"ok Paper 0", "ok Paper 1"})
+        self.assertFalse(Author.objects.filter(name="Ana").exists())
+    
     def test_bulk_import_with_pdf_zip(self):
         """Test BibTeX import with PDF ZIP file"""
         # Create a ZIP file with PDFs
@@ -113,6 +234,27 @@ class TestBulkImportView(TestCase):
         articles_with_pdfs = Article.objects.filter(pdf_file__isnull=False)
         self.assertGreater(articles_with_pdfs.count(), 0)
     
+    def test_bulk_import_zip_reads_matched_members_only(self):
+        """Test that PDFs are read from the ZIP only when an article is matched to them"""
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+            zip_file.writestr('papers/lazy1.pdf', b'%PDF-1.4 matched member')
+            zip_file.writestr('papers/unmatched.pdf', b'%PDF-1.4 corrupt member')
+        # reading the unmatched member would now fail its CRC check
+        data = zip_buffer.getvalue().replace(b'corrupt member', b'corrupt membeR')
+        
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_content': "@inproceedings{lazy1, title={Lazy Paper}, author={Ana Silva}, year={2024}}",
+            'edition_id': self.edition.id,
+            'pdf_zip': SimpleUploadedFile("papers.zip", data, content_type="application/zip"),
+        })
+        
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['report']['summary']['pdf_files_in_zip'], 2)
+        article = Article.objects.get(title="Lazy Paper")
+        with article.pdf_file.open('rb') as f:
+            self.assertEqual(f.read(), b'%PDF-1.4 matched member')
+    
     def test_bulk_import_validation_errors(self):
         """Test BibTeX import with validation errors"""
         bibtex_content = """
@@ -234,6 +376,108 @@ class TestBulkImportView(TestCase):
         self.assertEqual(paper3.pagina_inicial, 25)
         self.assertEqual(paper3.pagina_final, 30)
 
+@pytest.mark.integration
+class TestImportJobs(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.edition = EditionFactory(year=2024)
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def run_worker(self):
+        out, err = StringIO(), StringIO()
+        call_command('run_import_jobs', '--once', stdout=out, stderr=err)
+        return out.getvalue() + err.getvalue()
+
+    def test_queued_import_is_run_by_worker(self):
+        """Test that an async bulk import returns a job at once and the worker creates the articles"""
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+            zip_file.writestr('queued1.pdf', b'%PDF-1.4 queued paper')
+        bibtex_content = """
+        @inproceedings{queued1, title={Queued Paper One}, author={Ana Silva}, year={2024}}
+        @inproceedings{queued2, title={Queued Paper Two}, author={Ana Silva and Rui Costa}, year={2024}}
+        @inproceedings{queued3, title={No Year Paper}, author={Rui Costa}}
+        """
+        
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_content': bibtex_content,
+            'edition_id': self.edition.id,
+            'pdf_zip': SimpleUploadedFile("papers.zip", zip_buffer.getvalue(), content_type="application/zip"),
+            'async': 'true',
+        })
+        
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        self.assertEqual(data['phase'], 'queued')
+        self.assertFalse(Article.objects.exists())
+        status = self.client.get(data['status_url']).json()
+        self.assertEqual((status['phase'], status['processed'], status['total']), ('queued', 0, None))
+        
+        self.assertIn("2 created, 1 skipped", self.run_worker())
+        
+        status = self.client.get(data['status_url']).json()
+        self.assertEqual((status['phase'], status['processed'], status['total']), ('done', 3, 3))
+        self.assertIsNone(status['error'])
+        self.assertEqual(status['result']['created_count'], 2)
+        self.assertEqual(status['result']['report']['summary']['skipped_entries'], 1)
+        self.assertEqual(status['result']['report']['summary']['pdf_files_in_zip'], 1)
+        self.assertNotIn('articles', status['result'])
+        self.assertEqual(Article.objects.filter(edition=self.edition).count(), 2)
+        self.assertTrue(Article.objects.get(title="Queued Paper One").pdf_file)
+        self.assertEqual(Author.objects.get(name="Ana Silva").article_count, 2)
+        # the uploads are removed once the job has run
+        self.assertEqual(os.listdir(os.path.join(self.media, 'imports')), [])
+        self.assertEqual(self.run_worker(), "")
+
+    def test_failed_import_job_reports_error(self):
+        """Test that a job the importer cannot read ends in the failed phase with the error"""
+        response = self.client.post('/api/articles/bulk-import/', data={
+            'bibtex_file': SimpleUploadedFile("refs.bib", b"@article{x, title={\xff\xfe}}", content_type="text/plain"),
+            'edition_id': self.edition.id,
+            'async': '1',
+        })
+        self.assertEqual(response.status_code, 202)
+        
+        self.assertIn("failed", self.run_worker())
+        
+        status = self.client.get(response.json()['status_url']).json()
+        self.assertEqual(status['phase'], 'failed')
+        self.assertIn("utf-8", status['error'])
+        self.assertIsNotNone(status['finished_at'])
+        self.assertFalse(Article.objects.exists())
+
+    def test_stale_import_job_is_resumed(self):
+        """Test that a job whose worker stopped reporting is queued again and skips the entries already imported"""
+        bibtex_content = "".join(
+            f"@inproceedings{{resumed{i}, title={{Resumed Paper {i}}}, author={{Ana Silva}}, year={{2024}}}}\n" for i in range(3)
+        )
+        long_ago = timezone.now() - timedelta(hours=3)
+        stale = ImportJob(edition=self.edition, phase=ImportJob.IMPORTING, processed=1,
+                          started_at=long_ago, heartbeat_at=timezone.now() - timedelta(hours=2))
+        stale.bibtex_file.save('import.bib', ContentFile(bibtex_content.encode('utf-8')), save=False)
+        stale.save()
+        # started as long ago, but its worker is still reporting progress
+        running = ImportJob.objects.create(edition=self.edition, phase=ImportJob.IMPORTING,
+                                           started_at=long_ago, heartbeat_at=timezone.now())
+        
+        self.assertIn("queued again", self.run_worker())
+        
+        stale.refresh_from_db()
+        self.assertEqual((stale.phase, stale.processed, stale.total), (ImportJob.DONE, 3, 3))
+        self.assertEqual(stale.result['created_count'], 2)
+        self.assertGreater(stale.heartbeat_at, long_ago)
+        self.assertEqual(set(Article.objects.values_list('title', flat=True)), {"Resumed Paper 1", "Resumed Paper 2"})
+        running.refresh_from_db()
+        self.assertEqual(running.phase, ImportJob.IMPORTING)
+
+    def test_unknown_import_job(self):
+        """Test that polling a job that does not exist is a 404"""
+        self.assertEqual(self.client.get('/api/import-jobs/999/').status_code, 404)
+
 @pytest.mark.integration 
 class TestSpecialFunctionalities(TestCase):
     def setUp(self):
@@ -254,7 +498,7 @@ class TestSpecialFunctionalities(TestCase):
         response = self.client.get('/api/articles/?author=John')
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = response.json()['results']
         
         # Should only find articles by John Smith (word boundary matching)
         article_ids = [a['id'] for a in data]
@@ -337,12 +581,14 @@ class TestSpecialFunctionalities(TestCase):
         # Check that PDF URL is properly generated
         self.assertIsNotNone(data['pdf_url'])
         self.assertIn('localhost:8000', data['pdf_url'])
-        self.assertIn('research_paper', data['pdf_url'])
+        # served by the download view, versioned by the content hash
+        digest = hashlib.sha256(pdf_content).hexdigest()
+        self.assertTrue(data['pdf_url'].endswith(f"/api/articles/{data['id']}/pdf/?v={digest[:16]}"))
         
         # Verify the article in database
         article = Article.objects.get(id=data['id'])
         self.assertTrue(article.pdf_file)
-        self.assertIn('research_paper', article.pdf_file.name)
+        self.assertEqual(article.pdf_file.name, f'pdfs/{digest[:2]}/{digest[2:4]}/{digest}.pdf')
     
     def test_edition_update(self):
         """Test updating edition details"""
@@ -391,4 +637,292 @@ class TestSpecialFunctionalities(TestCase):
         data = response.json()
         self.assertEqual(data['id'], edition.id)
         self.assertEqual(data['year'], 2024)
-        self.assertEqual(data['location'], "Test City")
\ No newline at end of file
+        self.assertEqual(data['location'], "Test City")
+
+
+@pytest.mark.integration
+class TestPdfStorage(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def upload(self, content, name="paper.pdf"):
+        response = self.client.post('/api/articles/', data={
+            "title": "Stored PDF",
+            "pdf_file": SimpleUploadedFile(name, content, content_type="application/pdf"),
+        })
+        self.assertEqual(response.status_code, 201)
+        return Article.objects.get(pk=response.json()['id'])
+
+    def test_identical_uploads_share_one_blob(self):
+        """Test that equal bytes are stored once and deleted with their last article"""
+        first = self.upload(b'%PDF-1.4 same bytes', "paper1.pdf")
+        second = self.upload(b'%PDF-1.4 same bytes', "paper1_copy.pdf")
+        other = self.upload(b'%PDF-1.4 other bytes', "paper2.pdf")
+        
+        self.assertEqual(first.pdf_file.name, second.pdf_file.name)
+        self.assertNotEqual(first.pdf_file.name, other.pdf_file.name)
+        blob = StoredPdf.objects.get(name=first.pdf_file.name)
+        self.assertEqual((blob.ref_count, blob.size), (2, len(b'%PDF-1.4 same bytes')))
+        
+        path = first.pdf_file.path
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/api/articles/{first.id}/')
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(StoredPdf.objects.get(name=second.pdf_file.name).ref_count, 1)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(StoredPdf.objects.filter(name=second.pdf_file.name).exists())
+
+    def test_blob_reused_before_its_release_commits_is_kept(self):
+        """Test that an upload deduplicated onto a blob whose last article is being deleted keeps the file"""
+        first = self.upload(b'%PDF-1.4 reused bytes')
+        path = first.pdf_file.path
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+            second = self.upload(b'%PDF-1.4 reused bytes', "again.pdf")
+        
+        self.assertEqual(second.pdf_file.path, path)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(StoredPdf.objects.get(name=second.pdf_file.name).ref_count, 1)
+
+    def test_replacing_a_pdf_releases_the_old_blob(self):
+        """Test that uploading a new PDF over an article drops the unused old file"""
+        article = self.upload(b'%PDF-1.4 first version')
+        old_path = article.pdf_file.path
+        body = encode_multipart(BOUNDARY, {"pdf_file": SimpleUploadedFile("v2.pdf", b'%PDF-1.4 second version')})
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(f'/api/articles/{article.id}/', data=body, content_type=MULTIPART_CONTENT)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertEqual(list(StoredPdf.objects.values_list('ref_count', flat=True)), [1])
+
+    def test_bulk_import_failing_entry_leaves_no_blob(self):
+        """Test that the PDF of an entry the database rejects is removed, unless another entry uses it"""
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
+            zip_file.writestr('huge.pdf', b'%PDF-1.4 rejected entry')
+            zip_file.writestr('kept.pdf', b'%PDF-1.4 shared bytes')
+            zip_file.writestr('shared.pdf', b'%PDF-1.4 shared bytes')
+        bibtex_content = (
+            "@inproceedings{huge, title={Huge Pages}, author={Ana}, year={2024}, pages={1--100000000000000000000}}\n"
+            "@inproceedings{shared, title={Shared Huge}, author={Ana}, year={2024}, pages={1--100000000000000000000}}\n"
+            "@inproceedings{kept, title={Kept Paper}, author={Bia}, year={2024}}\n"
+        )
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/articles/bulk-import/', data={
+                'bibtex_content': bibtex_content, 'edition_id': EditionFactory().id,
+                'pdf_zip': SimpleUploadedFile("papers.zip", zip_buffer.getvalue(), content_type="application/zip"),
+            })
+        
+        self.assertEqual((response.json()['created_count'], response.json()['error_count']), (1, 2))
+        kept = Article.objects.get(title="Kept Paper")
+        stored = {
+            os.path.relpath(os.path.join(root, name), self.media)
+            for root, _, names in os.walk(os.path.join(self.media, 'pdfs')) for name in names
+        }
+        self.assertEqual(stored, {kept.pdf_file.name})
+        self.assertEqual(StoredPdf.objects.get(name=kept.pdf_file.name).ref_count, 1)
+
+    def test_dedupe_command_migrates_legacy_files(self):
+        """Test that dedupe_pdfs merges identical legacy files and rebuilds the counts"""
+        files = {
+            'pdfs/paper1_AbC123.pdf': b'%PDF-1.4 duplicate',
+            'pdfs/paper1_XyZ789.pdf': b'%PDF-1.4 duplicate',
+            'articles/unique.pdf': b'%PDF-1.4 unique',
+            'pdfs/orphan.pdf': b'%PDF-1.4 orphan',
+        }
+        for name, content in files.items():
+            os.makedirs(os.path.join(self.media, os.path.dirname(name)), exist_ok=True)
+            with open(os.path.join(self.media, name), 'wb') as f:
+                f.write(content)
+        articles = [ArticleFactory(pdf_file=None) for _ in range(3)]
+        for article, name in zip(articles, list(files)[:3]):
+            Article.objects.filter(pk=article.pk).update(pdf_file=name)  # as stored before this layout
+        
+        call_command('dedupe_pdfs', stdout=StringIO())
+        
+        names = [Article.objects.get(pk=a.pk).pdf_file.name for a in articles]
+        self.assertEqual(names[0], names[1])
+        self.assertEqual(
+            dict(StoredPdf.objects.values_list('name', 'ref_count')), {names[0]: 2, names[2]: 1}
+        )
+        for name, content in zip(names, files.values()):
+            with open(os.path.join(self.media, name), 'rb') as f:
+                self.assertEqual(f.read(), content)
+        remaining = {name for name in files if os.path.exists(os.path.join(self.media, name))}
+        self.assertEqual(remaining, {'pdfs/orphan.pdf'})
+        
+        call_command('dedupe_pdfs', '--purge', stdout=StringIO())
+        self.assertFalse(os.path.exists(os.path.join(self.media, 'pdfs/orphan.pdf')))
+
+
+@pytest.mark.integration
+class TestPdfDownloads(TestCase):
+    CONTENT = b'%PDF-1.4 0123456789 download test'
+
+    def setUp(self):
+        self.client = Client()
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.article = Article.objects.create(title="Downloadable Paper")
+        self.article.pdf_file.save("paper.pdf", SimpleUploadedFile("paper.pdf", self.CONTENT))
+        self.url = self.client.get(f'/api/articles/{self.article.id}/').json()['pdf_url'].replace('http://localhost:8000', '')
+
+    def download(self, url=None, **headers):
+        response = self.client.get(url or self.url, headers=headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, body
+
+    def test_full_download_with_immutable_caching(self):
+        """Test that the versioned URL serves the whole file and may be cached forever"""
+        response, body = self.download()
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body, self.CONTENT)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Length'], str(len(self.CONTENT)))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('downloadable-paper', response['Content-Disposition'])
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+        
+        unversioned, _ = self.download(f'/api/articles/{self.article.id}/pdf/')
+        self.assertEqual(unversioned['Cache-Control'], 'no-cache')
+        self.assertEqual(unversioned['ETag'], response['ETag'])
+
+    def test_range_requests(self):
+        """Test single byte ranges, suffix ranges and unsatisfiable ranges"""
+        size = len(self.CONTENT)
+        response, body = self.download(Range='bytes=9-18')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(body, b'0123456789')
+        self.assertEqual(response['Content-Range'], f'bytes 9-18/{size}')
+        self.assertEqual(response['Content-Length'], '10')
+        
+        response, body = self.download(Range='bytes=20-')
+        self.assertEqual((response.status_code, body), (206, self.CONTENT[20:]))
+        
+        response, body = self.download(Range='bytes=-4')
+        self.assertEqual((response.status_code, body), (206, b'test'))
+        
+        response, _ = self.download(Range=f'bytes={size}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{size}')
+        
+        # several ranges, or a stale If-Range, get the whole file
+        response, body = self.download(Range='bytes=0-1,5-6')
+        self.assertEqual((response.status_code, body), (200, self.CONTENT))
+        response, body = self.download(Range='bytes=0-1', **{'If-Range': '"stale"'})
+        self.assertEqual((response.status_code, body), (200, self.CONTENT))
+
+    def test_conditional_download(self):
+        """Test that a matching If-None-Match is answered with 304"""
+        response, _ = self.download()
+        
+        revalidated, body = self.download(**{'If-None-Match': response['ETag']})
+        
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(body, b'')
+
+    def test_proxy_offload(self):
+        """Test that the transfer is handed to the front proxy when configured"""
+        with override_settings(PDF_SENDFILE_BACKEND='x-accel-redirect', PDF_ACCEL_REDIRECT_PREFIX='/protected-media/'):
+            response, body = self.download()
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.article.pdf_file.name}')
+        self.assertEqual(body, b'')
+        
+        with override_settings(PDF_SENDFILE_BACKEND='x-sendfile'):
+            response, _ = self.download()
+        self.assertEqual(response['X-Sendfile'], self.article.pdf_file.path)
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_proxy_offload_of_legacy_names(self):
+        """Test that non-ASCII legacy names are percent-encoded for nginx and streamed instead of X-Sendfile"""
+        name = 'pdfs/Aceitação final.pdf'
+        os.makedirs(os.path.join(self.media, 'pdfs'), exist_ok=True)
+        with open(os.path.join(self.media, name), 'wb') as f:
+            f.write(self.CONTENT)
+        Article.objects.filter(pk=self.article.pk).update(pdf_file=name)  # as stored before the content-addressed layout
+        url = self.client.get(f'/api/articles/{self.article.id}/').json()['pdf_url'].replace('http://localhost:8000', '')
+        
+        with override_settings(PDF_SENDFILE_BACKEND='x-accel-redirect', PDF_ACCEL_REDIRECT_PREFIX='/protected-media/'):
+            response, _ = self.download(url)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/pdfs/Aceita%C3%A7%C3%A3o%20final.pdf')
+        
+        with override_settings(PDF_SENDFILE_BACKEND='x-sendfile'):
+            response, body = self.download(url)
+        self.assertFalse(response.has_header('X-Sendfile'))
+        self.assertEqual((response.status_code, body), (200, self.CONTENT))
+
+    def test_missing_pdf(self):
+        """Test 404 for articles without a PDF and for files gone from disk"""
+        response, _ = self.download(f'/api/articles/{ArticleFactory(pdf_file=None).id}/pdf/')
+        self.assertEqual(response.status_code, 404)
+        
+        os.remove(self.article.pdf_file.path)
+        response, _ = self.download()
+        self.assertEqual(response.status_code, 404)
+
+
+class TestBibtexParser(TestCase):
+    def test_streams_entries_across_chunks(self):
+        """Test that entries split over read() chunks are parsed whole"""
+        source = "".join(
+            f"@article{{key{i}, title = {{Title {{{i}}}}}, year = {2000 + i}}}\n% comment {i}\n" for i in range(20)
+        )
+        entries = list(bibtex.parse(StringIO(source), chunk_size=7))
+        
+        self.assertEqual([e['key'] for e in entries], [f"key{i}" for i in range(20)])
+        self.assertEqual(entries[3]['fields'], {'title': 'Title {3}', 'year': '2003'})
+
+    def test_values(self):
+        """Test quoted, braced, numeric, macro and concatenated values"""
+        entry, = bibtex.parse("""
+            @STRING(venue = "SBES")
+            @misc{k,
+              Title = "A {"}quoted{"} {{W}}ord",
+              note = venue # { } # 2024 # " " # mar,
+              % ignored = {x},
+              author = {Ana Silva AND B{\\'e}atriz Souza},
+              title = {Second title is ignored}
+            }
+        """)
+        
+        fields = entry['fields']
+        self.assertEqual(fields['title'], 'A {"}quoted{"} {{W}}ord')
+        self.assertEqual(bibtex.text(fields['title']), 'A "quoted" Word')
+        self.assertEqual(fields['note'], 'SBES 2024 March')
+        self.assertNotIn('ignored', fields)
+        self.assertEqual(bibtex.names(fields['author']), ['Ana Silva', "B\\'eatriz Souza"])
+
+    def test_count_matches_parse(self):
+        """Test that count finds the entries parse yields, skipping @string, @comment and nested heads"""
+        source = (
+            "@string{ml = \"ML\"}\n@comment{ @misc{hidden, title={No}} }\n% @misc{commented}\n"
+            + "".join(f"@misc{{k{i}, title = {{A {{@misc{{inner}}}}}}}}\n" for i in range(5))
+            + "@misc{open, title={Unterminated"
+        )
+        
+        self.assertEqual(bibtex.count(StringIO(source), chunk_size=7), len(list(bibtex.parse(source))))
+        self.assertEqual(bibtex.count(source), 6)
+
+    def test_malformed_entries(self):
+        """Test that broken fields and unterminated entries keep what could be read"""
+        entries = list(bibtex.parse("@misc{a, title={Kept}, year=, note={x}}\n@misc{b, title={Open"))
+        
+        self.assertEqual([(e['key'], e['fields']) for e in entries], [('a', {'title': 'Kept'}), ('b', {})])
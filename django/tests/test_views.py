@@ -1,9 +1,14 @@
 import pytest
 import json
-from django.test import TestCase, Client
+from unittest.mock import patch
+from django.db import connection
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.core.files.uploadedfile import SimpleUploadedFile
-from library.models import Event, Edition, Article, Author, Subscription
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from library.models import Event, Edition, Article, Author, AuthorProfile, Subscription
+from library.views import _parse_multipart
 from tests.factories import EventFactory, EditionFactory, ArticleFactory, AuthorFactory, SubscriptionFactory
 
 @pytest.mark.integration
@@ -157,6 +162,26 @@ class TestEditionAPIViews(TestCase):
         event = Event.objects.get(name="New Conference")
         self.assertIsNotNone(event)
 
+    def test_filter_editions_by_event_and_year_range(self):
+        """Test GET /api/editions/?event_id=&year_from=&year_to="""
+        event = EventFactory()
+        EditionFactory(event=event, year=2021)
+        edition_2023 = EditionFactory(event=event, year=2023)
+        edition_2024 = EditionFactory(event=event, year=2024)
+        EditionFactory(year=2023)
+
+        response = self.client.get(f'/api/editions/?event_id={event.id}&year_from=2022&year_to=2024')
+
+        self.assertEqual(response.status_code, 200)
+        ids = sorted(e['id'] for e in response.json())
+        self.assertEqual(ids, sorted([edition_2023.id, edition_2024.id]))
+
+    def test_filter_editions_rejects_non_integer(self):
+        """Test that a non-numeric filter value returns 400"""
+        response = self.client.get('/api/editions/?year=abc')
+
+        self.assertEqual(response.status_code, 400)
+
 @pytest.mark.integration
 class TestArticleAPIViews(TestCase):
     def setUp(self):
@@ -169,7 +194,7 @@ class TestArticleAPIViews(TestCase):
         response = self.client.get('/api/articles/')
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = response.json()['results']
         self.assertEqual(len(data), 3)
     
     def test_filter_articles_by_title(self):
@@ -181,7 +206,7 @@ class TestArticleAPIViews(TestCase):
         response = self.client.get('/api/articles/?title=Learning')
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = response.json()['results']
         self.assertEqual(len(data), 2)
         
         titles = [a['title'] for a in data]
@@ -201,11 +226,30 @@ class TestArticleAPIViews(TestCase):
         response = self.client.get('/api/articles/?author=John')
         
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = response.json()['results']
         # Should find articles with John Smith
         article_ids = [a['id'] for a in data]
         self.assertIn(article1.id, article_ids)
         self.assertIn(article3.id, article_ids)
+
+    def test_filter_articles_by_edition_event_and_year(self):
+        """Test GET /api/articles/?edition_id=, ?event_id=, ?year="""
+        event = EventFactory()
+        edition_2023 = EditionFactory(event=event, year=2023)
+        edition_2024 = EditionFactory(event=event, year=2024)
+        article_2023 = ArticleFactory(edition=edition_2023)
+        article_2024 = ArticleFactory(edition=edition_2024)
+        other = ArticleFactory(edition=EditionFactory(year=2024))
+
+        def ids(query):
+            response = self.client.get(f'/api/articles/?{query}')
+            self.assertEqual(response.status_code, 200)
+            return {a['id'] for a in response.json()['results']}
+
+        self.assertEqual(ids(f'edition_id={edition_2023.id}'), {article_2023.id})
+        self.assertEqual(ids(f'event_id={event.id}'), {article_2023.id, article_2024.id})
+        self.assertEqual(ids('year=2024'), {article_2024.id, other.id})
+        self.assertEqual(ids(f'event_id={event.id}&year_to=2023'), {article_2023.id})
     
     def test_create_article_json(self):
         """Test POST /api/articles/ with JSON payload"""
@@ -297,6 +341,63 @@ class TestArticleAPIViews(TestCase):
         article.refresh_from_db()
         self.assertEqual(article.title, payload['title'])
     
+    def test_update_authors_keeps_order_in_constant_queries(self):
+        """Test PUT with authors applies a diff, keeps the given order and does not scale with N"""
+        def put_authors(size):
+            names = [f"Byline {size}.{i}" for i in range(size)]
+            article = ArticleFactory(authors=[AuthorFactory(name=name) for name in names])
+            # reverse the order, drop one author, keep the rest and add two (one new)
+            AuthorFactory(name=f"Existing {size}")
+            wanted = names[:0:-1] + [f"Existing {size}", f"Brand New {size}"]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.put(
+                    f'/api/articles/{article.id}/',
+                    data=json.dumps({"authors": wanted}),
+                    content_type='application/json'
+                )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([a['name'] for a in response.json()['authors']], wanted)
+            self.assertEqual(
+                list(article.authors.order_by('articleauthor__position').values_list('name', flat=True)), wanted
+            )
+            return len(ctx.captured_queries)
+        
+        self.assertEqual(put_authors(3), put_authors(30))
+    
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=1024)
+    def test_multipart_put_streams_upload_to_disk(self):
+        """Test PUT multipart is parsed from the stream, spooling large files to temp files"""
+        article = ArticleFactory()
+        pdf_content = b'%PDF-1.4 ' + b'x' * 256 * 1024
+        body = encode_multipart(BOUNDARY, {
+            "title": "Streamed PDF",
+            "pdf_file": SimpleUploadedFile("big.pdf", pdf_content, content_type="application/pdf"),
+        })
+        
+        request = RequestFactory().put('/', data=body, content_type=MULTIPART_CONTENT)
+        data, files = _parse_multipart(request)
+        self.assertEqual(data['title'], "Streamed PDF")
+        self.assertIsInstance(files['pdf_file'], TemporaryUploadedFile)
+        self.assertFalse(hasattr(request, '_body'))  # the body was never buffered
+        request.close()
+        self.assertTrue(files['pdf_file'].closed)
+        
+        for method in ('put', 'patch'):
+            response = getattr(self.client, method)(f'/api/articles/{article.id}/', data=body, content_type=MULTIPART_CONTENT)
+            self.assertEqual(response.status_code, 200, method)
+            self.assertEqual(response.json()['title'], "Streamed PDF")
+        article.refresh_from_db()
+        with article.pdf_file.open('rb') as stored:
+            self.assertEqual(stored.read(), pdf_content)
+    
+    def test_malformed_multipart_put_is_rejected(self):
+        """Test PUT with a broken multipart body returns 400 instead of silently ignoring it"""
+        article = ArticleFactory()
+        response = self.client.put(
+            f'/api/articles/{article.id}/', data=b'garbage', content_type='multipart/form-data; boundary='
+        )
+        self.assertEqual(response.status_code, 400)
+    
     def test_delete_article(self):
         """Test DELETE /api/articles/{id}/"""
         article = ArticleFactory()
@@ -307,6 +408,463 @@ class TestArticleAPIViews(TestCase):
         self.assertEqual(response.status_code, 204)
         self.assertFalse(Article.objects.filter(id=article_id).exists())
 
+@pytest.mark.integration
+class TestArticlePagination(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.articles = [ArticleFactory() for _ in range(5)]
+
+    def test_cursor_pagination_walks_all_pages(self):
+        """Test GET /api/articles/?limit=&cursor= returns every article once"""
+        seen = []
+        url = '/api/articles/?limit=2'
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertLessEqual(len(data['results']), 2)
+            seen.extend(a['id'] for a in data['results'])
+            pages += 1
+            url = f"/api/articles/?limit=2&cursor={data['next_cursor']}" if data['next_cursor'] else None
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, [a.id for a in self.articles])
+
+    def test_last_page_has_no_cursor(self):
+        """Test that a page holding the remaining rows has next_cursor null"""
+        response = self.client.get('/api/articles/?limit=5')
+
+        data = response.json()
+        self.assertEqual(len(data['results']), 5)
+        self.assertIsNone(data['next_cursor'])
+
+    def test_unpaginated_flag_keeps_list_shape(self):
+        """Test GET /api/articles/?paginate=false returns the legacy list"""
+        response = self.client.get('/api/articles/?paginate=false')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIsInstance(data, list)
+        self.assertEqual(len(data), 5)
+
+    def test_invalid_cursor_and_limit(self):
+        """Test that malformed pagination params are rejected"""
+        response = self.client.get('/api/articles/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get('/api/articles/?limit=0')
+        self.assertEqual(response.status_code, 400)
+
+@pytest.mark.integration
+class TestArticleStreaming(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.articles = [ArticleFactory() for _ in range(3)]
+
+    def test_stream_json_array(self):
+        """Test GET /api/articles/?stream=json streams a JSON array"""
+        response = self.client.get('/api/articles/?stream=json&fields=id,authors')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([a['id'] for a in data], [a.id for a in self.articles])
+        self.assertTrue(all(a['authors'] for a in data))
+
+    def test_stream_ndjson(self):
+        """Test GET /api/articles/?stream=ndjson emits one article per line"""
+        response = self.client.get('/api/articles/?stream=ndjson')
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['id'] for line in lines], [a.id for a in self.articles])
+
+    def test_stream_empty_and_invalid_format(self):
+        """Test an empty stream and an unknown stream format"""
+        response = self.client.get('/api/articles/?stream=json&title=nothing-matches')
+        self.assertEqual(json.loads(b''.join(response.streaming_content)), [])
+
+        response = self.client.get('/api/articles/?stream=xml')
+        self.assertEqual(response.status_code, 400)
+
+    def test_stream_spanning_chunks_matches_listing(self):
+        """Test that a stream over several chunks builds the same documents as the listing"""
+        edition = self.articles[0].edition
+        ArticleFactory(edition=edition, authors=list(self.articles[0].authors.all()))
+
+        with patch('library.views.STREAM_CHUNK_SIZE', 2):
+            response = self.client.get('/api/articles/?stream=json')
+            streamed = json.loads(b''.join(response.streaming_content))
+
+        listed = self.client.get('/api/articles/?paginate=false').json()
+        self.assertEqual(sorted(streamed, key=lambda a: a['id']), sorted(listed, key=lambda a: a['id']))
+
+@pytest.mark.integration
+class TestArticleBatchLookup(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.articles = [ArticleFactory() for _ in range(5)]
+
+    def test_get_preserves_order_and_reports_missing(self):
+        """Test GET /api/articles/?ids= returns articles in request order plus missing ids"""
+        a, b, c = self.articles[3], self.articles[0], self.articles[2]
+        response = self.client.get(f'/api/articles/?ids={a.id},999999,{b.id},{c.id},{a.id}')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([r['id'] for r in data['results']], [a.id, b.id, c.id])
+        self.assertEqual(data['missing'], [999999])
+        self.assertEqual(data['results'][1]['title'], b.title)
+
+    def test_lookup_runs_constant_queries(self):
+        """Test that the query count does not depend on the number of ids"""
+        ids = ','.join(str(a.id) for a in self.articles)
+        with CaptureQueriesContext(connection) as one:
+            self.client.get(f'/api/articles/?ids={self.articles[0].id}')
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(f'/api/articles/?ids={ids}')
+
+        self.assertEqual(len(one.captured_queries), len(many.captured_queries))
+
+    def test_post_variant_with_fields(self):
+        """Test POST /api/articles/batch/ with ?fields="""
+        ids = [a.id for a in reversed(self.articles)]
+        response = self.client.post(
+            '/api/articles/batch/?fields=id,title',
+            data=json.dumps({"ids": ids + [0]}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([r['id'] for r in data['results']], ids)
+        self.assertEqual(set(data['results'][0]), {'id', 'title'})
+        self.assertEqual(data['missing'], [0])
+
+    def test_invalid_ids_are_rejected(self):
+        """Test that malformed ids and oversized batches answer 400"""
+        self.assertEqual(self.client.get('/api/articles/?ids=1,abc').status_code, 400)
+        response = self.client.post(
+            '/api/articles/batch/', data=json.dumps({"ids": {"first": 1}}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(
+            '/api/articles/batch/', data=json.dumps({"ids": list(range(1, 1002))}), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_integer_ids_are_rejected(self):
+        """Test that floats, bools and signed or decimal strings answer 400 instead of being truncated"""
+        article = self.articles[0]
+        for bad in (article.id + 0.5, float(article.id), True, "1.5", "-1", None):
+            response = self.client.post(
+                '/api/articles/batch/', data=json.dumps({"ids": [article.id, bad]}), content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 400, bad)
+        response = self.client.post(
+            '/api/articles/batch/', data=json.dumps({"ids": [article.id, f" {article.id} "]}), content_type='application/json'
+        )
+        self.assertEqual([r['id'] for r in response.json()['results']], [article.id])
+
+@pytest.mark.integration
+class TestArticleFacets(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.icse = EventFactory(name="ICSE")
+        self.sbes = EventFactory(name="SBES")
+        icse_2023 = EditionFactory(event=self.icse, year=2023)
+        icse_2024 = EditionFactory(event=self.icse, year=2024)
+        sbes_2024 = EditionFactory(event=self.sbes, year=2024)
+        self.alice = AuthorFactory(name="Alice Souza")
+        self.bob = AuthorFactory(name="Bob Lima")
+        self.carol = AuthorFactory(name="Carol Alves")
+        ArticleFactory(title="Testing microservices", edition=icse_2023, authors=[self.alice, self.bob])
+        ArticleFactory(title="Testing compilers", edition=icse_2024, authors=[self.alice])
+        ArticleFactory(title="Mining repositories", edition=sbes_2024, authors=[self.alice, self.carol])
+
+    def test_facets_over_whole_catalog(self):
+        """Test ?facets=event,year,author counts per event, year and author"""
+        response = self.client.get('/api/articles/?facets=event,year,author&limit=1')
+
+        self.assertEqual(response.status_code, 200)
+        facets = response.json()['facets']
+        self.assertEqual(facets['event'], [
+            {"id": self.icse.id, "name": "ICSE", "count": 2},
+            {"id": self.sbes.id, "name": "SBES", "count": 1},
+        ])
+        self.assertEqual(facets['year'], [{"year": 2024, "count": 2}, {"year": 2023, "count": 1}])
+        self.assertEqual(facets['author'][0], {"id": self.alice.id, "name": "Alice Souza", "count": 3})
+        # counts cover the filtered set, not just the one-article page
+        self.assertEqual(len(response.json()['results']), 1)
+
+    def test_facets_follow_filters(self):
+        """Test that facets are computed over the filtered result, without double counting"""
+        facets = self.client.get('/api/articles/?author=alice&q=testing&facets=event,author').json()['facets']
+
+        self.assertEqual(facets['event'], [{"id": self.icse.id, "name": "ICSE", "count": 2}])
+        self.assertEqual([(a['name'], a['count']) for a in facets['author']], [("Alice Souza", 2), ("Bob Lima", 1)])
+        self.assertNotIn('year', facets)
+
+    def test_author_facet_limit(self):
+        """Test ?facet_limit= keeps only the top-N authors"""
+        data = self.client.get('/api/articles/?paginate=false&facets=author&facet_limit=1').json()
+
+        self.assertEqual(len(data['results']), 3)
+        self.assertEqual([a['id'] for a in data['facets']['author']], [self.alice.id])
+
+    def test_invalid_facets(self):
+        """Test unknown facets and bad limits answer 400"""
+        self.assertEqual(self.client.get('/api/articles/?facets=color').status_code, 400)
+        self.assertEqual(self.client.get('/api/articles/?facets=author&facet_limit=0').status_code, 400)
+        self.assertEqual(self.client.get('/api/articles/?facets=event&stream=json').status_code, 400)
+
+@pytest.mark.integration
+class TestCompactListing(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.edition = EditionFactory()
+        self.shared = AuthorFactory()
+        self.articles = [ArticleFactory(edition=self.edition, authors=[self.shared, AuthorFactory()]) for _ in range(3)]
+
+    def test_compact_references_included_objects(self):
+        """Test that ?compact=true replaces nested objects with ids plus an included map"""
+        data = self.client.get('/api/articles/?compact=true').json()
+
+        for article in data['results']:
+            self.assertNotIn('edition', article)
+            self.assertNotIn('authors', article)
+            self.assertEqual(article['edition_id'], self.edition.id)
+            self.assertIn(self.shared.id, article['author_ids'])
+
+        included = data['included']
+        self.assertEqual(list(included['editions']), [str(self.edition.id)])
+        self.assertEqual(included['editions'][str(self.edition.id)]['event_id'], self.edition.event_id)
+        self.assertEqual(included['events'][str(self.edition.event_id)]['name'], self.edition.event.name)
+        self.assertEqual(len(included['authors']), 4)
+        self.assertEqual(included['authors'][str(self.shared.id)]['name'], self.shared.name)
+        self.assertIn('next_cursor', data)
+
+    def test_compact_is_smaller_and_carries_the_same_data(self):
+        """Test that the compact body is smaller and resolves to the nested one"""
+        nested = self.client.get('/api/articles/?paginate=false')
+        compact = self.client.get('/api/articles/?paginate=false&compact=true')
+        self.assertLess(len(compact.content), len(nested.content))
+
+        included = compact.json()['included']
+        by_id = {a['id']: a for a in nested.json()}
+        for article in compact.json()['results']:
+            edition = dict(included['editions'][str(article['edition_id'])])
+            edition['event'] = included['events'][str(edition.pop('event_id'))]
+            self.assertEqual(edition, by_id[article['id']]['edition'])
+            authors = [included['authors'][str(pk)] for pk in article['author_ids']]
+            self.assertEqual(authors, by_id[article['id']]['authors'])
+
+    def test_compact_respects_fields(self):
+        """Test that ?fields= decides which references and included maps are filled"""
+        data = self.client.get('/api/articles/?compact=true&fields=id,authors').json()
+
+        self.assertEqual(set(data['results'][0]), {'id', 'author_ids'})
+        self.assertEqual(data['included']['editions'], {})
+        self.assertEqual(len(data['included']['authors']), 4)
+
+    def test_compact_rejects_streaming(self):
+        """Test that ?compact=true cannot be combined with ?stream="""
+        response = self.client.get('/api/articles/?compact=true&stream=ndjson')
+        self.assertEqual(response.status_code, 400)
+
+@pytest.mark.integration
+class TestSparseFieldsets(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.author = AuthorFactory(name="Paula Fields")
+        self.article = ArticleFactory(authors=[self.author])
+
+    def test_list_returns_only_requested_fields(self):
+        """Test GET /api/articles/?fields= trims the JSON and the SELECT"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/articles/?fields=id,title,authors')
+
+        self.assertEqual(response.status_code, 200)
+        item = response.json()['results'][0]
+        self.assertEqual(set(item), {'id', 'title', 'authors'})
+        self.assertEqual(item['authors'][0]['name'], "Paula Fields")
+        article_select = queries.captured_queries[0]['sql']
+        self.assertNotIn('"bibtex"', article_select)
+        self.assertNotIn('"abstract"', article_select)
+
+    def test_detail_and_author_views_accept_fields(self):
+        """Test ?fields= on the article detail and author endpoints"""
+        detail = self.client.get(f'/api/articles/{self.article.id}/?fields=title,edition').json()
+        self.assertEqual(set(detail), {'title', 'edition'})
+
+        by_id = self.client.get(f'/api/authors/{self.author.id}/articles/?fields=id').json()
+        year = str(self.article.edition.year)
+        self.assertEqual(by_id[year], [{'id': self.article.id}])
+
+        by_name = self.client.get('/api/authors/paula-fields/?fields=id,title').json()
+        self.assertEqual(by_name['total_articles'], 1)
+        self.assertEqual(set(by_name['articles_by_year'][year][0]), {'id', 'title'})
+
+    def test_unknown_field_is_rejected(self):
+        """Test that an unknown field name returns 400"""
+        response = self.client.get('/api/articles/?fields=id,password')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.json()['error'])
+
+@pytest.mark.integration
+class TestConditionalGet(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.article = ArticleFactory()
+
+    def test_list_answers_304_without_running_the_listing_query(self):
+        """Test If-None-Match on GET /api/articles/ only reads the version stamp"""
+        response = self.client.get('/api/articles/')
+        etag = response['ETag']
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_modified_since_alone_never_answers_304(self):
+        """Test that a write in the same second as the last response is not hidden by If-Modified-Since"""
+        self.client.get(f'/api/articles/{self.article.id}/')
+        self.article.title = "Same Second"
+        self.article.save()
+
+        response = self.client.get(f'/api/articles/{self.article.id}/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], "Same Second")
+
+    def test_etag_depends_on_query_string(self):
+        """Test that different filters never share an ETag"""
+        first = self.client.get('/api/articles/?title=a')['ETag']
+        second = self.client.get('/api/articles/?title=b')['ETag']
+
+        self.assertNotEqual(first, second)
+
+    def test_writes_invalidate_dependent_endpoints(self):
+        """Test that article, author, M2M and event changes change the ETags"""
+        detail_url = f'/api/articles/{self.article.id}/'
+        events_etag = self.client.get('/api/events/')['ETag']
+
+        etag = self.client.get(detail_url)['ETag']
+        self.article.title = "Changed"
+        self.article.save()
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['title'], "Changed")
+
+        etag = response['ETag']
+        author = self.article.authors.first()
+        author.name = "Renamed Author"
+        author.save()
+        self.assertEqual(self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        etag = self.client.get(detail_url)['ETag']
+        self.article.authors.add(AuthorFactory())
+        self.assertEqual(self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        # None of the above touched events
+        self.assertEqual(self.client.get('/api/events/', HTTP_IF_NONE_MATCH=events_etag).status_code, 304)
+
+        etag = self.client.get('/api/editions/')['ETag']
+        EventFactory()
+        self.assertNotEqual(self.client.get('/api/events/')['ETag'], events_etag)
+        self.assertEqual(self.client.get('/api/editions/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+@pytest.mark.integration
+class TestResponseCache(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.article = ArticleFactory()
+        self.other = ArticleFactory()
+
+    def _stats(self):
+        return self.client.get('/api/cache-stats/').json()
+
+    def test_repeated_get_is_served_from_cache(self):
+        """Test that the second identical GET runs no listing queries"""
+        url = f'/api/articles/{self.article.id}/'
+        first = self.client.get(url)
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(url)
+        # only the version stamp lookup for the ETag remains
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(second.json(), first.json())
+
+        stats = self._stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['stores'], 1)
+
+    def test_query_parameter_order_shares_an_entry(self):
+        """Test that ?a=1&b=2 and ?b=2&a=1 hit the same cache entry"""
+        url = f'/api/articles/{self.article.id}/'
+        self.client.get(url + '?fields=id,title&x=1')
+        self.client.get(url + '?x=1&fields=id,title')
+
+        self.assertEqual(self._stats()['hits'], 1)
+
+    def test_article_change_evicts_only_its_entries(self):
+        """Test that saving one article keeps the other article cached"""
+        url = f'/api/articles/{self.article.id}/'
+        other_url = f'/api/articles/{self.other.id}/'
+        self.client.get(url)
+        self.client.get(other_url)
+
+        self.article.title = "Changed"
+        self.article.save()
+
+        self.assertEqual(self.client.get(url).json()['title'], "Changed")
+        self.client.get(other_url)
+        stats = self._stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['evictions'], 1)
+
+    def test_related_changes_evict_embedding_responses(self):
+        """Test that author, edition, event and authorship changes reach cached payloads"""
+        url = f'/api/articles/{self.article.id}/'
+        author = self.article.authors.first()
+
+        self.client.get(url)
+        author.name = "Renamed Author"
+        author.save()
+        self.assertIn("Renamed Author", [a['name'] for a in self.client.get(url).json()['authors']])
+
+        event = self.article.edition.event
+        event.name = "Renamed Event"
+        event.save()
+        self.assertEqual(self.client.get(url).json()['edition']['event']['name'], "Renamed Event")
+
+        new_author = AuthorFactory()
+        self.article.authors.add(new_author)
+        self.assertIn(new_author.id, [a['id'] for a in self.client.get(url).json()['authors']])
+
+        by_author = self.client.get(f'/api/authors/{new_author.id}/articles/').json()
+        self.assertEqual(len(sum(by_author.values(), [])), 1)
+        self.article.authors.remove(new_author)
+        self.assertEqual(self.client.get(f'/api/authors/{new_author.id}/articles/').json(), {})
+
+    def test_event_list_evicted_on_new_event(self):
+        """Test that creating an event drops the cached event list"""
+        self.assertEqual(len(self.client.get('/api/events/').json()), 2)
+        EventFactory()
+        self.assertEqual(len(self.client.get('/api/events/').json()), 3)
+
+    def test_error_responses_are_not_cached(self):
+        """Test that 4xx responses never enter the cache"""
+        self.client.get('/api/articles/999999/')
+        self.client.get('/api/articles/999999/')
+
+        stats = self._stats()
+        self.assertEqual(stats['stores'], 0)
+        self.assertEqual(stats['hits'], 0)
+
 @pytest.mark.integration
 class TestSubscriptionAPIViews(TestCase):
     def setUp(self):
@@ -405,6 +963,64 @@ class TestAuthorViews(TestCase):
         self.assertEqual(len(data['2023']), 1)
         self.assertEqual(len(data['2024']), 2)
     
+    def test_author_by_slug(self):
+        """Test GET /api/authors/{slug}/ resolves the canonical slug with one lookup"""
+        author = AuthorFactory(name="Maria José Souza")
+        namesake = AuthorFactory(name="Maria Jose Souza")
+        ArticleFactory(authors=[author])
+
+        response = self.client.get('/api/authors/maria-jose-souza/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['author']['id'], author.id)
+        self.assertEqual(data['author']['slug'], "maria-jose-souza")
+        self.assertEqual(data['total_articles'], 1)
+
+        # Old client-side slugs keep case and accents; they normalize to the same slug
+        self.assertEqual(self.client.get('/api/authors/Maria-José-Souza/').json()['author']['id'], author.id)
+        self.assertEqual(self.client.get('/api/authors/maria-jose-souza-2/').json()['author']['id'], namesake.id)
+        # No more partial-name guesses
+        self.assertEqual(self.client.get('/api/authors/maria/').status_code, 404)
+
+    def test_article_authors_link_by_slug(self):
+        """Test that listed authors carry the slug of their own page, also when names fold alike"""
+        first = AuthorFactory(name="Maria Jose Souza")
+        second = AuthorFactory(name="Maria José Souza")
+        ArticleFactory(authors=[first, second])
+
+        authors = self.client.get('/api/articles/?paginate=false').json()[0]['authors']
+        self.assertEqual([a['slug'] for a in authors], ["maria-jose-souza", "maria-jose-souza-2"])
+        for listed in authors:
+            page = self.client.get(f"/api/authors/{listed['slug']}/").json()
+            self.assertEqual(page['author']['id'], listed['id'])
+
+    def test_reserved_slug_is_never_assigned(self):
+        """Test that an author named like a fixed route still gets a reachable page"""
+        author = AuthorFactory(name="Suggest")
+        ArticleFactory(authors=[author])
+
+        self.assertEqual(author.slug, "suggest-2")
+        self.assertEqual(self.client.get('/api/authors/suggest-2/').json()['author']['id'], author.id)
+
+    def test_author_by_slug_reads_profile(self):
+        """Test that the author page is served from the materialized profile"""
+        author = AuthorFactory(name="Profile Author")
+        coauthor = AuthorFactory(name="Profile Coauthor")
+        old = ArticleFactory(authors=[author, coauthor], edition=EditionFactory(year=2020))
+        new = ArticleFactory(authors=[author], edition=EditionFactory(year=2024))
+
+        data = self.client.get('/api/authors/profile-author/?fields=id,title').json()
+        self.assertEqual(data['years'], [2024, 2020])
+        self.assertEqual([a['id'] for a in data['articles_by_year']['2024']], [new.id])
+        self.assertEqual([a['id'] for a in data['articles_by_year']['2020']], [old.id])
+        self.assertEqual((data['total_articles'], data['coauthor_count']), (2, 1))
+        self.assertEqual((data['first_year'], data['last_year']), (2020, 2024))
+
+        # a missing profile is materialized on first read
+        AuthorProfile.objects.filter(author=author).delete()
+        self.assertEqual(self.client.get('/api/authors/profile-author/').json()['total_articles'], 2)
+        self.assertTrue(AuthorProfile.objects.filter(author=author).exists())
+
     def test_author_detail(self):
         """Test GET /api/authors/{id}/"""
         author = AuthorFactory(name="Test Author", email="test@example.com")
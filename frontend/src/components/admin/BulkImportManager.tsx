@@ -107,6 +107,9 @@ export default function BulkImportManager(): React.JSX.Element {
         setSelectedEventId(undefined);
         setBibtexFile(null);
         setPdfZipFile(null);
+      } else if (result.error) {
+        // the entries read before the error were imported (see the report)
+        toast.error(`${result.created_count} artigos importados antes do erro: ${result.error}`);
       }
     } catch (err: any) {
       setError(err.message || "Erro na importação");
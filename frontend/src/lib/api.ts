@@ -34,6 +34,7 @@ export type AuthorItem = {
   id: number;
   name: string;
   email?: string | null;
+  slug?: string;  // unique; links to /authors/<slug>
 };
 
 export type ArticleItem = {
@@ -64,6 +65,8 @@ export type ArticlePayload = {
 
 export type BulkImportResponse = {
   success: boolean;
+  complete: boolean;  // false when the upload could not be read to the end
+  error: string | null;
   created_count: number;
   skipped_count: number;
   error_count: number;
@@ -105,10 +108,34 @@ export type BulkImportPayload = {
 export type AuthorPageData = {
   author: AuthorItem;
   total_articles: number;
+  coauthor_count?: number;
+  first_year?: number | null;
+  last_year?: number | null;
   years: number[];
   articles_by_year: Record<number, ArticleItem[]>;
 };
 
+// Article fields rendered by the public listing pages (no bibtex / page numbers)
+export const LISTING_FIELDS = 'id,title,abstract,pdf_url,edition,authors,created_at';
+
+export type ListFilters = {
+  fields?: string;
+  edition_id?: number;
+  event_id?: number;
+  year?: number;
+  year_from?: number;
+  year_to?: number;
+};
+
+function toQuery(params: Record<string, string | number | undefined>) {
+  const search = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null) search.set(key, String(value));
+  });
+  const query = search.toString();
+  return query ? `?${query}` : '';
+}
+
 async function handleRes(res: Response) {
   const text = await res.text();
   const json = text ? JSON.parse(text) : null;
@@ -145,8 +172,8 @@ export async function deleteEvent(id: number): Promise<void> {
   if (!res.ok && res.status !== 204) await handleRes(res);
 }
 
-export async function getEditions(): Promise<EditionItem[]> {
-  const res = await fetch(`${API_URL}/api/editions/`);
+export async function getEditions(filters: ListFilters = {}): Promise<EditionItem[]> {
+  const res = await fetch(`${API_URL}/api/editions/${toQuery(filters)}`);
   return handleRes(res);
 }
 
@@ -173,8 +200,21 @@ export async function deleteEdition(id: number): Promise<void> {
   if (!res.ok && res.status !== 204) await handleRes(res);
 }
 
-export async function getArticles(): Promise<ArticleItem[]> {
-  const res = await fetch(`${API_URL}/api/articles/`);
+export async function getArticles(filters: ListFilters = {}): Promise<ArticleItem[]> {
+  // The list endpoint is cursor-paginated by default; ask for the full list
+  const res = await fetch(`${API_URL}/api/articles/${toQuery({ ...filters, paginate: 'false' })}`);
+  return handleRes(res);
+}
+
+export type ArticleBatch = { results: ArticleItem[]; missing: number[] };
+
+// Fetch a known set of articles in one round trip, in the order given
+export async function getArticlesByIds(ids: number[], fields?: string): Promise<ArticleBatch> {
+  const res = await fetch(`${API_URL}/api/articles/batch/${toQuery({ fields })}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ ids }),
+  });
   return handleRes(res);
 }
 
@@ -233,6 +273,14 @@ export async function getAuthorArticles(authorId: number): Promise<any> {
   return handleRes(res);
 }
 
+export type AuthorSuggestion = { id: number; name: string; slug: string; article_count: number };
+
+// Name autocomplete, most published authors first
+export async function suggestAuthors(prefix: string, limit = 10): Promise<AuthorSuggestion[]> {
+  const res = await fetch(`${API_URL}/api/authors/suggest/${toQuery({ prefix, limit })}`);
+  return handleRes(res);
+}
+
 export async function createSubscription(payload: { email: string; author?: number; event?: number }): Promise<any> {
   const res = await fetch(`${API_URL}/api/subscriptions/create/`, {
     method: 'POST',
@@ -278,6 +326,6 @@ export async function bulkImportArticles(payload: BulkImportPayload, bibtexFile?
 }
 
 export async function getAuthorByName(authorName: string): Promise<AuthorPageData> {
-  const res = await fetch(`${API_URL}/api/authors/${authorName}/`);
+  const res = await fetch(`${API_URL}/api/authors/${authorName}/${toQuery({ fields: LISTING_FIELDS })}`);
   return handleRes(res);
 }
\ No newline at end of file
@@ -5,9 +5,18 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
 
-// Convert author name to URL-friendly slug
+// Author page slug. The server's unique Author.slug tells apart names that
+// fold to the same text ("Maria Jose" / "Maria José" -> "...-2"), so only
+// documents without one fall back to the name.
+export function authorSlug(author: { name: string; slug?: string }): string {
+  return author.slug || authorNameToSlug(author.name);
+}
+
+// Convert author name to URL-friendly slug (same rules as author_slug on the server)
 export function authorNameToSlug(name: string): string {
   return name
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')  // Drop accents: "João" -> "Joao"
     .toLowerCase()
     .trim()
     .replace(/\s+/g, '-')           // Replace spaces with hyphens
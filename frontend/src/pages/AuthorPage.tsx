@@ -5,8 +5,8 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Badge } from "@/components/ui/badge";
 import { Separator } from "@/components/ui/separator";
 import { BookOpen, User, Calendar, FileText, ArrowLeft, ExternalLink, Mail } from "lucide-react";
-import { getAuthorByName, AuthorPageData } from "@/lib/api";
-import { authorNameToSlug } from "@/lib/utils";
+import { getAuthorByName, AuthorItem, AuthorPageData } from "@/lib/api";
+import { authorSlug } from "@/lib/utils";
 import { toast } from "sonner";
 
 export default function AuthorPage() {
@@ -38,9 +38,8 @@ export default function AuthorPage() {
     }
   };
 
-  const handleAuthorClick = (authorName: string) => {
-    const slug = authorNameToSlug(authorName);
-    navigate(`/authors/${slug}`);
+  const handleAuthorClick = (author: AuthorItem) => {
+    navigate(`/authors/${authorSlug(author)}`);
   };
 
   if (loading) {
@@ -241,7 +240,7 @@ export default function AuthorPage() {
                                     .map((coauthor, index, filteredAuthors) => (
                                       <span key={coauthor.id} className="text-sm">
                                         <button
-                                          onClick={() => handleAuthorClick(coauthor.name)}
+                                          onClick={() => handleAuthorClick(coauthor)}
                                           className="text-primary hover:text-primary/80 hover:underline transition-colors"
                                         >
                                           {coauthor.name}
@@ -3,7 +3,7 @@ import { useParams, Link, useNavigate } from "react-router-dom";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { ArrowLeft, Calendar, MapPin, FileText, Users, BookOpen } from "lucide-react";
-import { getEvents, getEditions, getArticles, EventItem, EditionItem, ArticleItem } from "@/lib/api";
+import { getEvents, getEditions, getArticles, EventItem, EditionItem, ArticleItem, LISTING_FIELDS } from "@/lib/api";
 import { toast } from "sonner";
 
 export default function EditionPage() {
@@ -24,11 +24,7 @@ export default function EditionPage() {
     
     setLoading(true);
     try {
-      const [eventsData, editionsData, articlesData] = await Promise.all([
-        getEvents(),
-        getEditions(),
-        getArticles()
-      ]);
+      const eventsData = await getEvents();
 
       // Encontrar o evento pelo nome (slug)
       const foundEvent = eventsData.find(e => 
@@ -43,10 +39,9 @@ export default function EditionPage() {
 
       setEvent(foundEvent);
 
-      // Encontrar a edição pelo ano e evento
-      const foundEdition = editionsData.find(edition => 
-        edition.event?.id === foundEvent.id && edition.year === parseInt(year)
-      );
+      // Buscar a edição pelo ano e evento (filtrado no servidor)
+      const editionsData = await getEditions({ event_id: foundEvent.id, year: parseInt(year) });
+      const foundEdition = editionsData[0];
 
       if (!foundEdition) {
         toast.error("Edição não encontrada");
@@ -56,10 +51,8 @@ export default function EditionPage() {
 
       setEdition(foundEdition);
 
-      // Filtrar artigos desta edição
-      const editionArticles = articlesData.filter(article => 
-        article.edition?.id === foundEdition.id
-      );
+      // Buscar somente os artigos desta edição
+      const editionArticles = await getArticles({ edition_id: foundEdition.id, fields: LISTING_FIELDS });
       
       setArticles(editionArticles.sort((a, b) => a.title.localeCompare(b.title)));
     } catch (err: any) {
@@ -23,10 +23,7 @@ export default function EventPage() {
     
     setLoading(true);
     try {
-      const [eventsData, editionsData] = await Promise.all([
-        getEvents(),
-        getEditions()
-      ]);
+      const eventsData = await getEvents();
 
       // Encontrar o evento pelo nome (slug)
       const foundEvent = eventsData.find(e => 
@@ -41,10 +38,8 @@ export default function EventPage() {
 
       setEvent(foundEvent);
 
-      // Filtrar edições deste evento
-      const eventEditions = editionsData.filter(edition => 
-        edition.event?.id === foundEvent.id
-      );
+      // Buscar somente as edições deste evento
+      const eventEditions = await getEditions({ event_id: foundEvent.id });
       
       setEditions(eventEditions.sort((a, b) => b.year - a.year));
     } catch (err: any) {
@@ -3,17 +3,32 @@ import { Input } from "@/components/ui/input";
 import { Card, CardContent, CardFooter, CardHeader, CardTitle } from "@/components/ui/card";
 import { Label } from "@/components/ui/label";
 import { Bell, Mail, User } from "lucide-react";
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { useToast } from "@/hooks/use-toast";
+import { suggestAuthors, AuthorSuggestion } from "@/lib/api";
 
 const NotificationSignup = () => {
   const navigate = useNavigate();
   const [name, setName] = useState("");
   const [email, setEmail] = useState("");
   const [isLoading, setIsLoading] = useState(false);
+  const [suggestions, setSuggestions] = useState<AuthorSuggestion[]>([]);
   const { toast } = useToast();
 
+  useEffect(() => {
+    const prefix = name.trim();
+    if (prefix.length < 2) {
+      setSuggestions([]);
+      return;
+    }
+    // Wait for a pause in typing before asking the server
+    const timer = setTimeout(() => {
+      suggestAuthors(prefix).then(setSuggestions).catch(() => setSuggestions([]));
+    }, 150);
+    return () => clearTimeout(timer);
+  }, [name]);
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
     
@@ -86,8 +101,15 @@ const NotificationSignup = () => {
                       value={name}
                       onChange={(e) => setName(e.target.value)}
                       className="pl-10"
+                      list="author-suggestions"
+                      autoComplete="off"
                       required
                     />
+                    <datalist id="author-suggestions">
+                      {suggestions.map((author) => (
+                        <option key={author.id} value={author.name} />
+                      ))}
+                    </datalist>
                   </div>
                   <p className="text-sm text-muted-foreground">
                     Digite seu nome exatamente como aparece nos artigos
@@ -6,8 +6,8 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Badge } from "@/components/ui/badge";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { Search, BookOpen, FileText, Users, Calendar, ArrowLeft, ExternalLink } from "lucide-react";
-import { getArticles, ArticleItem } from "@/lib/api";
-import { authorNameToSlug } from "@/lib/utils";
+import { getArticles, ArticleItem, AuthorItem, LISTING_FIELDS } from "@/lib/api";
+import { authorSlug } from "@/lib/utils";
 import { toast } from "sonner";
 
 export default function SearchPage() {
@@ -35,6 +35,8 @@ export default function SearchPage() {
     try {
       // Usar a API existente com parâmetros de filtro
       const url = new URL('/api/articles/', 'http://localhost:8000');
+      url.searchParams.set('paginate', 'false');
+      url.searchParams.set('fields', LISTING_FIELDS);
       
       switch (type) {
         case 'title':
@@ -92,9 +94,8 @@ export default function SearchPage() {
     }
   };
 
-  const handleAuthorClick = (authorName: string) => {
-    const slug = authorNameToSlug(authorName);
-    navigate(`/authors/${slug}`);
+  const handleAuthorClick = (author: AuthorItem) => {
+    navigate(`/authors/${authorSlug(author)}`);
   };
 
   const currentQuery = searchParams.get('q');
@@ -206,7 +207,7 @@ export default function SearchPage() {
                             {article.authors.map((author, index) => (
                               <span key={author.id} className="text-sm">
                                 <button
-                                  onClick={() => handleAuthorClick(author.name)}
+                                  onClick={() => handleAuthorClick(author)}
                                   className="text-primary hover:text-primary/80 hover:underline transition-colors"
                                 >
                                   {author.name}